@@ -55,17 +55,132 @@ Write dataclasses to a CSV file:
 :license: BSD, see LICENSE for more details.
 """
 
+import importlib
 
+from typing import TYPE_CHECKING, Any, List
+
+from .converter import RecordConverter
 from .dataclass_reader import DataclassReader
 from .dataclass_writer import DataclassWriter
-from .decorators import dateformat, accept_whitespaces
-from .exceptions import CsvValueError
+from .decorators import (
+    dateformat,
+    accept_whitespaces,
+    categorical,
+    boolean_values,
+    number_format,
+)
+from .exceptions import CsvValueError, SchemaMismatchError
+from .lazy import LazyRow
+from .diff import Change, diff, write_changes
+from .follow import follow, afollow
+from .join import join
+from .schema import HeaderDiff, header_fingerprint, schema_fingerprint
+from .validation import ValidationReport, ValidationFailure
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .aggregation import aggregate
+    from .cache import ParsedCache
+    from .index import IndexedDataclassReader, build_index
+    from .fixedwidth import FixedWidthDataclassReader, FixedWidthDataclassWriter
+    from .jsonlines import JsonLinesDataclassReader, JsonLinesDataclassWriter
+    from .sections import SectionReader
+    from .shared import SharedDataclassReader, SharedDataclassWriter
+    from .sqlite import create_table_sql, from_sqlite, to_sqlite
+    from .stages import distinct, sample
+    from .sorting import external_sort, merge_sorted, sorted_records
+
+# The modules of the other features are imported on first use, so scripts
+# that only read and write files do not pay for importing sqlite3, NumPy
+# and the like. The functions named like their module are imported above,
+# since importing the module would replace them with it.
+_LAZY_IMPORTS = {
+    "aggregate": "aggregation",
+    "ParsedCache": "cache",
+    "IndexedDataclassReader": "index",
+    "build_index": "index",
+    "FixedWidthDataclassReader": "fixedwidth",
+    "FixedWidthDataclassWriter": "fixedwidth",
+    "JsonLinesDataclassReader": "jsonlines",
+    "JsonLinesDataclassWriter": "jsonlines",
+    "SectionReader": "sections",
+    "SharedDataclassReader": "shared",
+    "SharedDataclassWriter": "shared",
+    "create_table_sql": "sqlite",
+    "from_sqlite": "sqlite",
+    "to_sqlite": "sqlite",
+    "distinct": "stages",
+    "sample": "stages",
+    "external_sort": "sorting",
+    "merge_sorted": "sorting",
+    "sorted_records": "sorting",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+def is_compiled() -> bool:
+    """Returns `True` when the conversion core was compiled with mypyc."""
+    from . import converter, dataclass_reader, dataclass_writer
+
+    modules = (converter, dataclass_reader, dataclass_writer)
+    return all(not str(x.__file__).endswith(".py") for x in modules)
 
 
 __all__ = [
+    "RecordConverter",
     "DataclassReader",
     "DataclassWriter",
     "dateformat",
     "accept_whitespaces",
+    "categorical",
+    "boolean_values",
+    "number_format",
     "CsvValueError",
+    "SchemaMismatchError",
+    "is_compiled",
+    "LazyRow",
+    "aggregate",
+    "ParsedCache",
+    "IndexedDataclassReader",
+    "build_index",
+    "Change",
+    "diff",
+    "write_changes",
+    "FixedWidthDataclassReader",
+    "FixedWidthDataclassWriter",
+    "follow",
+    "afollow",
+    "join",
+    "JsonLinesDataclassReader",
+    "JsonLinesDataclassWriter",
+    "HeaderDiff",
+    "header_fingerprint",
+    "schema_fingerprint",
+    "SectionReader",
+    "SharedDataclassReader",
+    "SharedDataclassWriter",
+    "create_table_sql",
+    "to_sqlite",
+    "from_sqlite",
+    "distinct",
+    "sample",
+    "external_sort",
+    "merge_sorted",
+    "sorted_records",
+    "ValidationReport",
+    "ValidationFailure",
 ]
@@ -0,0 +1,329 @@
+import builtins
+import itertools
+import operator
+import os
+import pickle
+import tempfile
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .dataclass_reader import DataclassReader
+
+# NumPy takes longer to import than the rest of the package, so it is only
+# imported by the first aggregation that can use it.
+np: Any = None
+
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_MAX_GROUPS = 1_000_000
+DEFAULT_PARTITIONS = 16
+
+FieldNames = Union[str, Sequence[str]]
+
+
+def _numpy() -> Any:
+    global np
+
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            return None
+        np = numpy
+
+    return np
+
+
+def _as_list(names: FieldNames) -> List[str]:
+    return [names] if isinstance(names, str) else list(names)
+
+
+def _add(current, value):
+    if value is None:
+        return current
+    return value if current is None else current + value
+
+
+def _min(current, value):
+    if value is None:
+        return current
+    return value if current is None else builtins.min(current, value)
+
+
+def _max(current, value):
+    if value is None:
+        return current
+    return value if current is None else builtins.max(current, value)
+
+
+class _Aggregator:
+    """Holds the partial results of every group.
+
+    The state of a group is a list with the row count followed by one
+    slot per aggregated column: `[count, *sums, *mins, *maxs]`. States
+    are mergeable, which allows spilling partial results to disk
+    partitions when there are too many groups.
+    """
+
+    def __init__(
+        self,
+        key_size: int,
+        sum: List[str],
+        min: List[str],
+        max: List[str],
+        max_groups: int,
+        partitions: int,
+        tmpdir: Optional[str],
+        use_numpy: bool,
+    ):
+        self.key_size = key_size
+        self.sum = sum
+        self.min = min
+        self.max = max
+        self.ops = [_add] * len(sum) + [_min] * len(min) + [_max] * len(max)
+        self.max_groups = max_groups
+        self.partitions = partitions
+        self.tmpdir = tmpdir
+        self.use_numpy = use_numpy
+        self.groups: Dict[Any, List[Any]] = {}
+        self._directory: Optional[tempfile.TemporaryDirectory] = None
+        self._files: List[Any] = []
+
+    def _new_state(self) -> List[Any]:
+        return [0] + [0] * len(self.sum) + [None] * (len(self.min) + len(self.max))
+
+    def _key(self, row):
+        return row[0] if self.key_size == 1 else row[: self.key_size]
+
+    def merge(self, key, other: List[Any]) -> None:
+        state = self.groups.get(key)
+        if state is None:
+            self.groups[key] = other
+            return
+
+        state[0] += other[0]
+        for i, op in enumerate(self.ops, 1):
+            state[i] = op(state[i], other[i])
+
+    def add_batch(self, batch: List[Tuple[Any, ...]]) -> None:
+        if self.use_numpy:
+            self._add_batch_numpy(batch)
+        else:
+            self._add_batch_python(batch)
+
+        if len(self.groups) > self.max_groups:
+            self._spill()
+
+    def _add_batch_python(self, batch: List[Tuple[Any, ...]]) -> None:
+        groups = self.groups
+        ops = list(enumerate(self.ops, 1))
+        offset = self.key_size - 1
+
+        for row in batch:
+            key = self._key(row)
+            state = groups.get(key)
+            if state is None:
+                state = groups[key] = self._new_state()
+
+            state[0] += 1
+            for i, op in ops:
+                state[i] = op(state[i], row[i + offset])
+
+    def _add_batch_numpy(self, batch: List[Tuple[Any, ...]]) -> None:
+        index: Dict[Any, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(self._key(row), len(index)) for row in batch),
+            dtype=np.intp,
+            count=len(batch),
+        )
+        size = len(index)
+        columns = list(zip(*batch))[self.key_size :]
+
+        results: List[Any] = [np.bincount(codes, minlength=size).tolist()]
+
+        for column, op in zip(columns, self.ops):
+            values = np.asarray(column)
+
+            if not self._is_numeric(values, op):
+                results.append(self._reduce_python(codes, column, op, size))
+            elif op is _add:
+                sums = np.zeros(size, dtype=values.dtype)
+                np.add.at(sums, codes, values)
+                results.append(sums.tolist())
+            else:
+                ufunc = np.minimum if op is _min else np.maximum
+                reduced = np.full(size, self._identity(values, op), values.dtype)
+                ufunc.at(reduced, codes, values)
+                results.append(reduced.tolist())
+
+        for key, i in index.items():
+            self.merge(key, [result[i] for result in results])
+
+    def _is_numeric(self, values, op) -> bool:
+        if values.dtype.kind == "f":
+            return True
+
+        if values.dtype.kind != "i":
+            return False
+
+        if op is not _add:
+            return True
+
+        # Sums of int64 values wrap around on overflow, use Python ints
+        # when that is possible.
+        limit = np.iinfo(np.int64).max // builtins.max(len(values), 1)
+        return int(np.abs(values).max()) <= limit
+
+    def _identity(self, values, op):
+        if values.dtype.kind == "f":
+            return np.inf if op is _min else -np.inf
+
+        info = np.iinfo(values.dtype)
+        return info.max if op is _min else info.min
+
+    def _reduce_python(self, codes, column, op, size) -> List[Any]:
+        reduced: List[Any] = [0 if op is _add else None] * size
+        for code, value in zip(codes.tolist(), column):
+            reduced[code] = op(reduced[code], value)
+        return reduced
+
+    def _spill(self) -> None:
+        if self._directory is None:
+            self._directory = tempfile.TemporaryDirectory(dir=self.tmpdir)
+            for i in range(self.partitions):
+                path = os.path.join(self._directory.name, f"{i}.part")
+                self._files.append(open(path, "wb"))
+
+        # Each group is pickled on its own, so it is read back without
+        # references to the objects of other groups.
+        for key, state in self.groups.items():
+            f = self._files[hash(key) % self.partitions]
+            pickle.dump((key, state), f, pickle.HIGHEST_PROTOCOL)
+
+        self.groups = {}
+
+    def _result(self, state: List[Any], count: bool) -> Dict[str, Any]:
+        result = {"count": state[0]} if count else {}
+        names = (
+            [f"sum_{x}" for x in self.sum]
+            + [f"min_{x}" for x in self.min]
+            + [f"max_{x}" for x in self.max]
+        )
+        result.update(zip(names, state[1:]))
+        return result
+
+    def results(self, count: bool) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        if self._directory is None:
+            for key, state in self.groups.items():
+                yield key, self._result(state, count)
+            return
+
+        self._spill()
+        for f in self._files:
+            f.close()
+
+        try:
+            for f in self._files:
+                with open(f.name, "rb") as partition:
+                    while True:
+                        try:
+                            key, state = pickle.load(partition)
+                        except EOFError:
+                            break
+                        self.merge(key, state)
+
+                for key, state in self.groups.items():
+                    yield key, self._result(state, count)
+
+                self.groups = {}
+                os.remove(f.name)
+        finally:
+            self._directory.cleanup()
+
+
+def aggregate(
+    records: Iterable[Any],
+    by: FieldNames,
+    sum: FieldNames = (),
+    min: FieldNames = (),
+    max: FieldNames = (),
+    count: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_groups: int = DEFAULT_MAX_GROUPS,
+    partitions: int = DEFAULT_PARTITIONS,
+    tmpdir: Optional[str] = None,
+    use_numpy: Optional[bool] = None,
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Computes per-group counts, sums, minimums and maximums in one pass.
+
+    When `records` is a `DataclassReader`, only the fields used by the
+    aggregation are converted and no dataclass instances are created. Any
+    other iterable of dataclass instances is also accepted.
+
+    Yields `(key, result)` pairs, where `key` is the value of the `by`
+    field (or a tuple, when grouping by several fields) and `result` is a
+    dict with the `count` and `sum_<field>`, `min_<field>` and
+    `max_<field>` entries. `None` values are ignored by the aggregates.
+
+    When there are more than `max_groups` groups, the partial results are
+    written to `partitions` temporary files and merged one partition at a
+    time at the end, so the groups are not yielded in any particular order.
+
+    Usage:
+        >>> from dataclass_csv import DataclassReader, aggregate
+
+        >>> with open('sales.csv') as f:
+        >>>     reader = DataclassReader(f, Sale)
+        >>>     totals = dict(aggregate(reader, by='country', sum=['amount']))
+
+    :param use_numpy: Aggregate numeric columns with NumPy. By default
+    NumPy is used when it is installed.
+    """
+    if batch_size < 1 or max_groups < 1 or partitions < 1:
+        raise ValueError("batch_size, max_groups and partitions must be positive.")
+
+    if use_numpy is not False and _numpy() is None:
+        if use_numpy:
+            raise ImportError("NumPy is required when use_numpy=True.")
+        use_numpy = False
+
+    key_fields = _as_list(by)
+    if not key_fields:
+        raise ValueError("At least one field is required in the by argument.")
+
+    sum, min, max = _as_list(sum), _as_list(min), _as_list(max)
+    columns = key_fields + sum + min + max
+
+    if isinstance(records, DataclassReader):
+        rows: Iterator[Tuple[Any, ...]] = records._iter_values(columns)
+    else:
+        getters = [operator.attrgetter(x) for x in columns]
+        rows = (tuple(getter(x) for getter in getters) for x in records)
+
+    aggregator = _Aggregator(
+        len(key_fields),
+        sum,
+        min,
+        max,
+        max_groups,
+        partitions,
+        tmpdir,
+        use_numpy is not False,
+    )
+
+    return _aggregate(aggregator, rows, batch_size, count)
+
+
+def _aggregate(
+    aggregator: _Aggregator,
+    rows: Iterator[Tuple[Any, ...]],
+    batch_size: int,
+    count: bool,
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        aggregator.add_batch(batch)
+
+    yield from aggregator.results(count)
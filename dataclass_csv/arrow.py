@@ -0,0 +1,172 @@
+import dataclasses
+import itertools
+
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, List, Tuple, Type, TypeVar
+
+from .dataclass_reader import DataclassReader, get_args, is_union_type
+from .schema import get_schema
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 65_536
+
+
+def _pyarrow() -> Tuple[Any, Any]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required to use dataclass_csv.arrow. Install it with "
+            "`pip install dataclass-csv[arrow]`."
+        ) from None
+
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_type(pa: Any, field_name: str, field_type: Any) -> Tuple[Any, bool]:
+    nullable = False
+
+    if is_union_type(field_type):
+        type_args = [x for x in get_args(field_type) if x is not type(None)]
+        nullable = len(type_args) < len(get_args(field_type))
+        if len(type_args) == 1:
+            field_type = type_args[0]
+
+    types = {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        datetime: pa.timestamp("us"),
+        date: pa.date32(),
+    }
+
+    if field_type not in types:
+        raise TypeError(
+            f"The field `{field_name}` has the type {field_type}, which "
+            "cannot be mapped to an Arrow type. Supported types are: "
+            "str, int, float, bool, datetime and date."
+        )
+
+    return types[field_type], nullable
+
+
+def arrow_schema(klass: Type[Any]) -> Any:
+    """Returns the `pyarrow.Schema` of the fields of `klass` that are set by
+    its `__init__`, based on their type hints.
+
+    `Optional` fields and fields with `None` as default are nullable.
+    """
+    pa, _ = _pyarrow()
+
+    if not dataclasses.is_dataclass(klass):
+        raise ValueError("klass argument needs to be a dataclass.")
+
+    type_hints = get_schema(klass).type_hints
+    fields = []
+
+    for field in dataclasses.fields(klass):
+        if not field.init:
+            continue
+
+        arrow_type, nullable = _arrow_type(pa, field.name, type_hints[field.name])
+        nullable = nullable or field.default is None
+        fields.append(pa.field(field.name, arrow_type, nullable=nullable))
+
+    return pa.schema(fields)
+
+
+def _batches(rows: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    if batch_size < 1:
+        raise ValueError("batch_size must be greater than zero.")
+
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _record_batch(pa: Any, schema: Any, columns: List[List[Any]]) -> Any:
+    arrays = [pa.array(x, type=f.type) for x, f in zip(columns, schema)]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def read_record_batches(
+    reader: DataclassReader, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Any]:
+    """Converts the remaining rows of a `DataclassReader` into Arrow
+    record batches of at most `batch_size` rows.
+
+    The values are validated and converted exactly as when iterating over
+    the reader, but no dataclass instances are created.
+
+    Usage:
+        >>> from dataclass_csv import DataclassReader
+        >>> from dataclass_csv.arrow import read_record_batches
+
+        >>> with open('users.csv') as f:
+        >>>     for batch in read_record_batches(DataclassReader(f, User)):
+        >>>         ...
+    """
+    pa, _ = _pyarrow()
+    schema = arrow_schema(reader._cls)
+
+    rows = reader._iter_values(schema.names)
+
+    for batch in _batches(rows, batch_size):
+        yield _record_batch(pa, schema, [list(x) for x in zip(*batch)])
+
+
+def to_record_batches(
+    data: Iterable[T], klass: Type[T], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Any]:
+    """Converts dataclass instances into Arrow record batches."""
+    pa, _ = _pyarrow()
+    schema = arrow_schema(klass)
+
+    for batch in _batches(data, batch_size):
+        columns = [[getattr(x, name) for x in batch] for name in schema.names]
+        yield _record_batch(pa, schema, columns)
+
+
+def write_parquet(
+    batches: Iterable[Any],
+    klass: Type[Any],
+    path: str,
+    **kwds: Any,
+) -> None:
+    """Writes record batches, e.g. from `read_record_batches` or
+    `to_record_batches`, to a Parquet file with the schema of `klass`.
+    Every batch is written as one row group. The keyword arguments are
+    passed to `pyarrow.parquet.ParquetWriter`.
+
+    Usage:
+        >>> with open('users.csv') as f:
+        >>>     reader = DataclassReader(f, User)
+        >>>     write_parquet(read_record_batches(reader), User, 'users.parquet')
+    """
+    _, pq = _pyarrow()
+
+    with pq.ParquetWriter(path, arrow_schema(klass), **kwds) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def read_parquet(
+    path: str, klass: Type[T], batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[T]:
+    """Reads the rows of a Parquet file as instances of `klass`, one batch
+    of `batch_size` rows at a time."""
+    _, pq = _pyarrow()
+    schema = arrow_schema(klass)
+
+    parquet_file = pq.ParquetFile(path)
+    batches = parquet_file.iter_batches(batch_size=batch_size, columns=schema.names)
+
+    for batch in batches:
+        for values in batch.to_pylist():
+            yield klass(**values)
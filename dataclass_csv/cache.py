@@ -0,0 +1,181 @@
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+
+from array import array
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from .dataclass_reader import DataclassReader
+from .schema import schema_fingerprint
+
+T = TypeVar("T")
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".snapshot"
+DEFAULT_MAX_BYTES = 1024**3
+
+
+def _content_hash(path: str) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def _to_column(values: List[Any]) -> Any:
+    """Stores int and float columns as arrays, which are much smaller and
+    faster to (un)pickle than lists of Python objects."""
+    for typecode, value_type in (("q", int), ("d", float)):
+        if values and all(type(x) is value_type for x in values):
+            try:
+                return array(typecode, values)
+            except OverflowError:
+                return values
+
+    return values
+
+
+class ParsedCache:
+    """A size-bounded directory of snapshots of parsed CSV files.
+
+    The first time a file is read the converted records are stored in a
+    binary columnar snapshot. Later reads of the same file, with the same
+    dataclass definition and reader options, load the snapshot instead of
+    parsing and converting the CSV file again.
+
+    A snapshot is identified by the path, size and modification time of the
+    file (or by the hash of its content, with `hash_content=True`), and by a
+    fingerprint of the dataclass fields, types and metadata. When the total
+    size of the snapshots exceeds `max_bytes`, the least recently used ones
+    are removed.
+
+    Usage:
+        >>> from dataclass_csv import ParsedCache
+
+        >>> cache = ParsedCache('/var/cache/myapp', max_bytes=10 * 1024**3)
+        >>> products = cache.read('products.csv', Product)
+
+        >>> with DataclassReader.from_path('products.csv', Product, cache=cache) as r:
+        >>>     for product in r:
+        >>>         ...
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be greater than zero.")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _snapshot_path(
+        self,
+        path: str,
+        klass: Type[Any],
+        hash_content: bool,
+        options: Dict[str, Any],
+    ) -> str:
+        if hash_content:
+            source: Any = _content_hash(path)
+        else:
+            stat = os.stat(path)
+            source = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+        key = repr(
+            (
+                SNAPSHOT_VERSION,
+                source,
+                schema_fingerprint(klass),
+                sorted((k, repr(v)) for k, v in options.items()),
+            )
+        )
+        name = hashlib.sha256(key.encode()).hexdigest() + SNAPSHOT_SUFFIX
+
+        return os.path.join(self.directory, name)
+
+    def read(
+        self,
+        path: str,
+        klass: Type[T],
+        encoding: Optional[str] = "utf-8",
+        hash_content: bool = False,
+        **kwds: Any,
+    ) -> List[T]:
+        """Returns all the records of the CSV file, from the snapshot when
+        available. The file is read with `DataclassReader.from_path`, which
+        detects the encoding when it is `None`, and the keyword arguments
+        are passed to it."""
+        snapshot_path = self._snapshot_path(
+            path, klass, hash_content, {"encoding": encoding, **kwds}
+        )
+
+        records = self._load(snapshot_path, klass)
+        if records is not None:
+            return records
+
+        with DataclassReader.from_path(path, klass, encoding, **kwds) as reader:
+            records = list(reader)
+
+        self._store(snapshot_path, klass, records)
+
+        return records
+
+    def _load(self, snapshot_path: str, klass: Type[T]) -> Optional[List[T]]:
+        try:
+            with open(snapshot_path, "rb") as f:
+                names, columns = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        # Mark the snapshot as recently used.
+        os.utime(snapshot_path)
+
+        return [klass(**dict(zip(names, values))) for values in zip(*columns)]
+
+    def _store(self, snapshot_path: str, klass: Type[Any], records: List[Any]) -> None:
+        names = [x.name for x in dataclasses.fields(klass) if x.init]
+        columns = [_to_column([getattr(x, name) for x in records]) for name in names]
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((names, columns), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, snapshot_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        snapshots = []
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SNAPSHOT_SUFFIX) and entry.is_file():
+                stat = entry.stat()
+                snapshots.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(x[1] for x in snapshots)
+
+        for _, size, snapshot_path in sorted(snapshots):
+            if total <= self.max_bytes:
+                break
+
+            try:
+                os.remove(snapshot_path)
+            except FileNotFoundError:
+                pass
+
+            total -= size
+
+    def clear(self) -> None:
+        """Removes all the snapshots."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(SNAPSHOT_SUFFIX):
+                os.remove(entry.path)
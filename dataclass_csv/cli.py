@@ -0,0 +1,491 @@
+import argparse
+import concurrent.futures
+import csv
+import hashlib
+import importlib
+import math
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .dataclass_reader import DataclassReader
+from .dataclass_writer import DataclassWriter
+from .exceptions import CsvValueError
+from .jsonlines import JsonLinesDataclassWriter
+from .validation import ValidationReport
+
+ChunkFunc = Callable[[DataclassReader, argparse.Namespace, int], Any]
+
+
+def load_class(target: str) -> Any:
+    """Imports a class from a `module:Class` string."""
+    module_name, sep, qualname = target.partition(":")
+
+    if not sep or not module_name or not qualname:
+        raise ValueError(f"Invalid target {target!r}, expected `module:Class`.")
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    obj: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+class _HyperLogLog:
+    """Estimates the number of distinct values with a fixed amount of
+    memory, with a standard error of about `1.04 / sqrt(2 ** precision)`.
+
+    The values are hashed with BLAKE2 instead of `hash`, which is salted
+    per process, so estimators built in different processes can be merged.
+    """
+
+    def __init__(self, precision: int = 12):
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value: Any) -> None:
+        digest = hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+        h = int.from_bytes(digest, "big")
+
+        bits = 64 - self._precision
+        index = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other: "_HyperLogLog") -> None:
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def estimate(self) -> int:
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-x for x in self._registers)
+
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return round(estimate)
+
+
+class _ColumnStats:
+    def __init__(self) -> None:
+        self.values = 0
+        self.nulls = 0
+        self.errors = 0
+        self.minimum: Any = None
+        self.maximum: Any = None
+        self.comparable = True
+        self.distinct = _HyperLogLog()
+
+    def add(self, value: Any) -> None:
+        if value is None:
+            self.nulls += 1
+            return
+
+        self.values += 1
+        self.distinct.add(value)
+        self._update_range(value, value)
+
+    def _update_range(self, minimum: Any, maximum: Any) -> None:
+        if not self.comparable:
+            return
+
+        try:
+            if self.minimum is None or minimum < self.minimum:
+                self.minimum = minimum
+            if self.maximum is None or maximum > self.maximum:
+                self.maximum = maximum
+        except TypeError:
+            self.comparable = False
+            self.minimum = self.maximum = None
+
+    def merge(self, other: "_ColumnStats") -> None:
+        self.values += other.values
+        self.nulls += other.nulls
+        self.errors += other.errors
+        self.distinct.merge(other.distinct)
+
+        if not other.comparable:
+            self.comparable = False
+            self.minimum = self.maximum = None
+        elif other.values:
+            self._update_range(other.minimum, other.maximum)
+
+
+def _read_header(path: str, encoding: str, delimiter: str) -> Tuple[List[str], int]:
+    """Returns the header of a file and the offset of its first row."""
+    with open(path, "rb") as f:
+        line = f.readline()
+        offset = f.tell()
+
+    if not line:
+        raise ValueError(f"The file {path} is empty.")
+
+    header = next(csv.reader([line.decode(encoding)], delimiter=delimiter))
+    return header, offset
+
+
+def _split_file(path: str, start: int, parts: int) -> List[Tuple[int, int]]:
+    """Splits a file in byte ranges that start at the beginning of a line."""
+    size = os.path.getsize(path)
+    bounds = [start]
+
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(start + (size - start) * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+
+    bounds.append(size)
+
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+def _read_lines(f: Any, end: int, encoding: str) -> Iterator[str]:
+    while f.tell() < end:
+        line = f.readline()
+        if not line:
+            return
+        yield line.decode(encoding)
+
+
+def _run_chunk(task: Tuple[Any, ...]) -> Tuple[Any, int]:
+    args, chunk, header, index, start, end = task
+    klass = load_class(args.target)
+
+    with open(args.file, "rb") as f:
+        f.seek(start)
+        lines = _read_lines(f, end, args.encoding)
+        reader = DataclassReader(
+            lines, klass, fieldnames=header, delimiter=args.delimiter
+        )
+        result = chunk(reader, args, index)
+
+        return result, reader._reader.line_num
+
+
+def _run(args: argparse.Namespace, chunk: ChunkFunc) -> List[Tuple[Any, int]]:
+    """Runs `chunk` on the whole file, or on `--workers` parts of the file in
+    parallel, and returns its results with the number of lines before each
+    part, so line numbers can be made relative to the whole file."""
+    klass = load_class(args.target)
+
+    if args.workers <= 1:
+        with open(args.file, newline="", encoding=args.encoding) as f:
+            reader = DataclassReader(f, klass, delimiter=args.delimiter)
+            return [(chunk(reader, args, 0), 0)]
+
+    header, start = _read_header(args.file, args.encoding, args.delimiter)
+    tasks = [
+        (args, chunk, header, index, part_start, part_end)
+        for index, (part_start, part_end) in enumerate(
+            _split_file(args.file, start, args.workers)
+        )
+    ]
+
+    # The workers are spawned rather than forked, which is unsafe when the
+    # calling process runs other threads.
+    context = multiprocessing.get_context("spawn")
+    results = []
+    lines = 1
+
+    with concurrent.futures.ProcessPoolExecutor(
+        args.workers, mp_context=context
+    ) as executor:
+        try:
+            for result, line_count in executor.map(_run_chunk, tasks):
+                results.append((result, lines))
+                lines += line_count
+        except CsvValueError as ex:
+            # The parts are numbered from their first line, and the results
+            # of all the parts before the failed one are known.
+            if ex.line_number is not None:
+                ex.line_number += lines
+            raise
+
+    return results
+
+
+def _validate_chunk(
+    reader: DataclassReader, args: argparse.Namespace, index: int
+) -> ValidationReport:
+    return reader.validate(max_failures=args.max_failures)
+
+
+def _validate(args: argparse.Namespace) -> int:
+    report = ValidationReport(max_failures=args.max_failures)
+
+    for part, offset in _run(args, _validate_chunk):
+        for failure in part.failures:
+            failure.line_number += offset
+        report.merge(part)
+
+    for failure in report.failures:
+        print(f"{args.file}:{failure.line_number}: {failure.field}: {failure.message}")
+
+    for field, count in sorted(report.error_counts.items()):
+        print(f"{field}: {count} error(s)")
+
+    print(f"{report.rows} row(s) checked, {report.invalid_rows} invalid.")
+
+    return 0 if report.is_valid else 1
+
+
+def _write_records(
+    reader: DataclassReader, args: argparse.Namespace, f: Any, header: bool
+) -> None:
+    if args.to == "jsonl":
+        JsonLinesDataclassWriter(f, reader, reader._cls).write()
+        return
+
+    writer = DataclassWriter(f, reader, reader._cls, delimiter=args.output_delimiter)
+    writer.write(skip_header=not header)
+
+
+def _convert_chunk(
+    reader: DataclassReader, args: argparse.Namespace, index: int
+) -> None:
+    path = os.path.join(args.parts_directory, str(index))
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        _write_records(reader, args, f, header=index == 0)
+
+
+def _convert(args: argparse.Namespace) -> int:
+    output: Any
+    if args.output:
+        output = open(args.output, "w", newline="", encoding="utf-8")
+    else:
+        output = sys.stdout
+
+    try:
+        if args.workers <= 1:
+            klass = load_class(args.target)
+            with open(args.file, newline="", encoding=args.encoding) as f:
+                reader = DataclassReader(f, klass, delimiter=args.delimiter)
+                _write_records(reader, args, output, header=True)
+            return 0
+
+        # Each worker converts its part of the file into a temporary file,
+        # and the parts are then copied to the output in order.
+        with tempfile.TemporaryDirectory() as directory:
+            args.parts_directory = directory
+            parts = len(_run(args, _convert_chunk))
+
+            for index in range(parts):
+                with open(os.path.join(directory, str(index)), encoding="utf-8") as f:
+                    shutil.copyfileobj(f, output)
+
+        return 0
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def _stats_chunk(
+    reader: DataclassReader, args: argparse.Namespace, index: int
+) -> Dict[str, _ColumnStats]:
+    fields = reader._init_fields
+    stats = {x.name: _ColumnStats() for x in fields}
+    columns = [(x, stats[x.name]) for x in fields]
+    csv_reader = reader._reader
+
+    for row in csv_reader:
+        for field, column in columns:
+            try:
+                column.add(reader._parse_field(row, field, csv_reader.line_num))
+            except (CsvValueError, KeyError, AttributeError):
+                column.errors += 1
+
+    return stats
+
+
+def _print_table(header: List[str], rows: List[List[str]]) -> None:
+    widths = [max(len(x) for x in column) for column in zip(header, *rows)]
+
+    for row in [header, *rows]:
+        print("  ".join(x.ljust(w) for x, w in zip(row, widths)).rstrip())
+
+
+def _stats(args: argparse.Namespace) -> int:
+    stats: Dict[str, _ColumnStats] = {}
+
+    for part, _ in _run(args, _stats_chunk):
+        for name, column in part.items():
+            if name in stats:
+                stats[name].merge(column)
+            else:
+                stats[name] = column
+
+    _print_table(
+        ["field", "values", "nulls", "errors", "min", "max", "distinct"],
+        [
+            [
+                name,
+                str(x.values),
+                str(x.nulls),
+                str(x.errors),
+                "" if x.minimum is None else str(x.minimum),
+                "" if x.maximum is None else str(x.maximum),
+                f"~{x.distinct.estimate()}",
+            ]
+            for name, x in stats.items()
+        ],
+    )
+
+    return 0
+
+
+def _profile(args: argparse.Namespace) -> int:
+    klass = load_class(args.target)
+
+    # The first pass measures the throughput without the overhead of timing
+    # each field, the second one measures where the time goes.
+    with open(args.file, newline="", encoding=args.encoding) as f:
+        reader = DataclassReader(f, klass, delimiter=args.delimiter)
+        started = time.perf_counter()
+        rows = sum(1 for _ in _limit(reader, args.rows))
+        elapsed = time.perf_counter() - started
+
+    with open(args.file, newline="", encoding=args.encoding) as f:
+        reader = DataclassReader(f, klass, delimiter=args.delimiter)
+        csv_reader = reader._reader
+        fields = reader._init_fields
+        field_times = [0.0] * len(fields)
+        parse_time = build_time = 0.0
+        clock = time.perf_counter
+
+        for _ in range(rows):
+            started = clock()
+            row = next(csv_reader)
+            parse_time += clock() - started
+
+            values = {}
+            for i, field in enumerate(fields):
+                started = clock()
+                values[field.name] = reader._parse_field(
+                    row, field, csv_reader.line_num
+                )
+                field_times[i] += clock() - started
+
+            started = clock()
+            klass(**values)
+            build_time += clock() - started
+
+    rate = rows / elapsed if elapsed else 0.0
+    print(f"{rows} row(s) in {elapsed:.3f}s ({rate:,.0f} rows/s)")
+
+    timings = [("csv parsing", parse_time)]
+    timings.extend((f"field {x.name}", t) for x, t in zip(fields, field_times))
+    timings.append(("instance creation", build_time))
+    total = sum(t for _, t in timings) or 1.0
+
+    _print_table(
+        ["step", "seconds", "share"],
+        [[name, f"{t:.3f}", f"{t / total:.1%}"] for name, t in timings],
+    )
+
+    return 0
+
+
+def _limit(items: Any, rows: Optional[int]) -> Iterator[Any]:
+    for count, item in enumerate(items):
+        if rows is not None and count >= rows:
+            return
+        yield item
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dataclass-csv",
+        description="Work with CSV files using dataclasses as their schema.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("file", help="path to the CSV file")
+    common.add_argument("target", help="the dataclass, as `module:Class`")
+    common.add_argument("--delimiter", default=",", help="the field delimiter")
+    common.add_argument("--encoding", default="utf-8", help="the file encoding")
+
+    parallel = argparse.ArgumentParser(add_help=False)
+    parallel.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "number of processes reading parts of the file in parallel. "
+            "The values must not contain line breaks (default: 1)"
+        ),
+    )
+
+    validate = subparsers.add_parser(
+        "validate",
+        parents=[common, parallel],
+        help="check that every row of a CSV file can be parsed",
+    )
+    validate.add_argument(
+        "--max-failures",
+        type=int,
+        default=10,
+        help="number of failures to display (default: 10)",
+    )
+    validate.set_defaults(func=_validate)
+
+    convert = subparsers.add_parser(
+        "convert",
+        parents=[common, parallel],
+        help="convert a CSV file to JSON Lines or to another CSV dialect",
+    )
+    convert.add_argument(
+        "--to", choices=["csv", "jsonl"], default="csv", help="the output format"
+    )
+    convert.add_argument(
+        "--output", "-o", help="path to the output file (default: stdout)"
+    )
+    convert.add_argument(
+        "--output-delimiter", default=",", help="the field delimiter of the output"
+    )
+    convert.set_defaults(func=_convert)
+
+    stats = subparsers.add_parser(
+        "stats",
+        parents=[common, parallel],
+        help="show the nulls, range and distinct values of each field",
+    )
+    stats.set_defaults(func=_stats)
+
+    profile = subparsers.add_parser(
+        "profile",
+        parents=[common],
+        help="measure the rows per second and the conversion time per field",
+    )
+    profile.add_argument("--rows", type=int, help="number of rows to read")
+    profile.set_defaults(func=_profile, workers=1)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        return args.func(args)
+    except KeyError as ex:
+        # The message of a `KeyError` is the repr of its argument.
+        print(f"dataclass-csv: error: {ex.args[0]}", file=sys.stderr)
+        return 2
+    except (CsvValueError, ValueError, ImportError, AttributeError, OSError) as ex:
+        print(f"dataclass-csv: error: {ex}", file=sys.stderr)
+        return 2
@@ -0,0 +1,388 @@
+import dataclasses
+import functools
+import sys
+
+from datetime import date, datetime
+from typing import (
+    Union,
+    Type,
+    Optional,
+    Sequence,
+    Dict,
+    Any,
+    Generic,
+    TypeVar,
+    cast,
+)
+
+
+from .field_mapper import FieldMapper
+from .exceptions import CsvValueError
+from .schema import get_schema
+
+T = TypeVar("T")
+
+DEFAULT_INTERN_CACHE_SIZE = 1024
+
+
+TRUE_VALUES = ("true", "yes", "t", "y", "on", "1")
+FALSE_VALUES = ("false", "no", "f", "n", "off", "0")
+
+
+def _bool_table(
+    true_values: Sequence[str], false_values: Sequence[str]
+) -> Dict[str, bool]:
+    table = {str(x).strip().lower(): False for x in false_values}
+    table.update((str(x).strip().lower(), True) for x in true_values)
+    return table
+
+
+BOOL_VALUES = _bool_table(TRUE_VALUES, FALSE_VALUES)
+
+
+def _parse_bool(value: str, table: Dict[str, bool]) -> bool:
+    result = table.get(value)
+
+    if result is None:
+        result = table.get(value.strip().lower())
+        if result is None:
+            raise ValueError(f"invalid boolean value {value}")
+
+    return result
+
+
+def strtobool(value: str) -> bool:
+    return _parse_bool(value, BOOL_VALUES)
+
+
+def _with_cause(error: BaseException, cause: Optional[BaseException]):
+    # Same as `raise error from cause`, which is not supported when this
+    # module is compiled with mypyc.
+    error.__cause__ = cause
+    return error
+
+
+def is_union_type(t):
+    if hasattr(t, "__origin__") and t.__origin__ is Union:
+        return True
+
+    return False
+
+
+def get_args(t):
+    if hasattr(t, "__args__"):
+        return t.__args__
+
+    return tuple()
+
+
+class RecordConverter(Generic[T]):
+    """Converts rows of raw values into instances of a dataclass.
+
+    The converter of each field is built once from its type hint, metadata
+    and the options set by the decorators, so the same rules apply to every
+    source of records: `DataclassReader` is built on it, and it can be used
+    directly for rows that come from other sources, such as the messages of
+    a queue.
+
+    Usage:
+        >>> converter = RecordConverter(User)
+        >>> converter.convert({'name': 'User1', 'age': '40'})
+        User(name='User1', age=40)
+
+    :param positional: Convert sequences of values instead of mappings. The
+    values are matched to the fields by the `index` metadata of the field,
+    or by their order
+    """
+
+    def __init__(self, klass: Type[T], positional: bool = False):
+        if klass is None or not dataclasses.is_dataclass(klass):
+            raise ValueError("klass argument needs to be a dataclass.")
+
+        schema = get_schema(klass)
+
+        self._cls = klass
+        self._init_fields = schema.init_fields
+        self._optional_fields = schema.optional_fields
+        self._field_mapping: Dict[str, Dict[str, Any]] = {}
+        self._positions: Optional[Dict[str, int]] = (
+            self._get_positions() if positional else None
+        )
+
+        self.type_hints = schema.type_hints
+        self._converters = {x.name: self._get_converter(x) for x in self._init_fields}
+
+    def _get_positions(self) -> Dict[str, int]:
+        positions = {}
+
+        for position, field in enumerate(self._init_fields):
+            index = field.metadata.get("index", position)
+            if not isinstance(index, int) or index < 0:
+                raise ValueError(
+                    f"The index of the field `{field.name}` must be a "
+                    "non-negative integer."
+                )
+            positions[field.name] = index
+
+        return positions
+
+    def _add_to_mapping(self, property_name, csv_fieldname):
+        self._field_mapping[property_name] = csv_fieldname
+
+    def _get_metadata_option(self, field, key):
+        option = field.metadata.get(key, getattr(self._cls, f"__{key}__", None))
+        return option
+
+    def _get_default_value(self, field):
+        return (
+            field.default
+            if not isinstance(field.default, dataclasses._MISSING_TYPE)
+            else field.default_factory()
+        )
+
+    def _get_possible_keys(self, fieldname, row):
+        possible_keys = list(filter(lambda x: x.strip() == fieldname, row.keys()))
+        if possible_keys:
+            return possible_keys[0]
+
+    def _get_positional_value(self, row, field):
+        positions = cast(Dict[str, int], self._positions)
+        index = positions.get(field.name, -1)
+
+        if index < 0 or index >= len(row):
+            if field.name in self._optional_fields:
+                return self._get_default_value(field)
+            raise KeyError(
+                f"The value for the column `{field.name}` is missing in the CSV file"
+            )
+
+        return self._check_value(field, row[index])
+
+    def _get_value(self, row, field):
+        if self._positions is not None:
+            return self._get_positional_value(row, field)
+
+        is_field_mapped = False
+
+        if field.name in self._field_mapping.keys():
+            is_field_mapped = True
+            key = self._field_mapping.get(field.name)
+        else:
+            key = field.name
+
+        if key in row.keys():
+            value = row[key]
+        else:
+            try:
+                possible_key = self._get_possible_keys(field.name, row)
+                key = possible_key if possible_key else key
+                value = row[key]
+            except KeyError:
+                if field.name in self._optional_fields:
+                    return self._get_default_value(field)
+                else:
+                    keyerror_message = f"The value for the column `{field.name}`"
+                    if is_field_mapped:
+                        keyerror_message = f"The value for the mapped column `{key}`"
+                    raise KeyError(f"{keyerror_message} is missing in the CSV file")
+
+        return self._check_value(field, value)
+
+    def _check_value(self, field, value):
+        # Falsy values that are not empty, such as the numbers and booleans
+        # of a JSON document, are converted as usual.
+        empty = not value and (value is None or value == "")
+
+        if empty and field.name in self._optional_fields:
+            return self._get_default_value(field)
+        elif empty:
+            raise ValueError(f"The field `{field.name}` is required.")
+        elif (
+            isinstance(value, str)
+            and field.type is str
+            and not len(value.strip())
+            and not self._get_metadata_option(field, "accept_whitespaces")
+        ):
+            raise ValueError(
+                (
+                    f"It seems like the value of `{field.name}` contains "
+                    "only white spaces. To allow white spaces to all "
+                    "string fields, use the @accept_whitespaces "
+                    "decorator. "
+                    "To allow white spaces specifically for the field "
+                    f"`{field.name}` change its definition to: "
+                    f"`{field.name}: str = field(metadata="
+                    "{'accept_whitespaces': True})`."
+                )
+            )
+        else:
+            return value
+
+    def _parse_date_value(self, field, date_value, field_type):
+        dateformat = self._get_metadata_option(field, "dateformat")
+
+        if not isinstance(date_value, str):
+            return date_value
+
+        if not dateformat:
+            raise AttributeError(
+                (
+                    "Unable to parse the datetime string value. Date format "
+                    "not specified. To specify a date format for all "
+                    "datetime fields in the class, use the @dateformat "
+                    "decorator. To define a date format specifically for this "
+                    "field, change its definition to: "
+                    f"`{field.name}: datetime = field(metadata="
+                    "{'dateformat': <date_format>})`."
+                )
+            )
+
+        datetime_obj = datetime.strptime(date_value, dateformat)
+
+        if field_type == date:
+            return datetime_obj.date()
+        else:
+            return datetime_obj
+
+    def _get_field_type(self, field):
+        field_type = self.type_hints[field.name]
+
+        if is_union_type(field_type):
+            type_args = [x for x in get_args(field_type) if x is not type(None)]
+            if len(type_args) == 1:
+                field_type = type_args[0]
+
+        return field_type
+
+    def _get_bool_converter(self, field):
+        true_values = self._get_metadata_option(field, "true_values")
+        false_values = self._get_metadata_option(field, "false_values")
+
+        if true_values is None and false_values is None:
+            table = BOOL_VALUES
+        else:
+            table = _bool_table(
+                TRUE_VALUES if true_values is None else true_values,
+                FALSE_VALUES if false_values is None else false_values,
+            )
+
+        return lambda value: (
+            value if isinstance(value, bool) else _parse_bool(str(value), table)
+        )
+
+    def _get_number_converter(self, field, field_type):
+        convert = functools.partial(self._convert_value, field, field_type)
+
+        thousands = self._get_metadata_option(field, "thousands")
+        decimal = self._get_metadata_option(field, "decimal")
+
+        if not thousands and (not decimal or decimal == "."):
+            return convert
+
+        # A single `str.translate` call removes the thousands separators
+        # and replaces the decimal separator.
+        mapping = {ord(thousands): None} if thousands else {}
+        if decimal and decimal != ".":
+            mapping[ord(decimal)] = "."
+        table = str.maketrans(mapping)
+
+        return lambda value: convert(
+            value.translate(table) if isinstance(value, str) else value
+        )
+
+    def _get_converter(self, field):
+        field_type = self._get_field_type(field)
+
+        if field_type is bool:
+            convert = self._get_bool_converter(field)
+        elif field_type is int or field_type is float:
+            convert = self._get_number_converter(field, field_type)
+        else:
+            convert = functools.partial(self._convert_value, field, field_type)
+
+        option = self._get_metadata_option(field, "intern")
+        if not option and field.name in getattr(self._cls, "__categorical__", ()):
+            option = True
+
+        if not option:
+            return convert
+
+        if field_type is str:
+            return lambda value: sys.intern(value) if type(value) is str else value
+
+        maxsize = DEFAULT_INTERN_CACHE_SIZE if option is True else option
+        cached_convert = functools.lru_cache(maxsize=maxsize)(convert)
+
+        return lambda value: (
+            cached_convert(value) if isinstance(value, str) else convert(value)
+        )
+
+    def _type_error(self, field, value) -> ValueError:
+        return ValueError(
+            (
+                f"The field `{field.name}` is defined as {field.type} "
+                f"but received a value of type {type(value)}."
+            )
+        )
+
+    def _check_type(self, field, field_type, value):
+        # Values that are not strings come from other sources, such as JSON
+        # documents, and would be silently changed by the type conversion.
+        if isinstance(value, (list, dict)):
+            if not isinstance(field_type, type) or not isinstance(value, field_type):
+                raise self._type_error(field, value)
+        elif field_type is int or field_type is float:
+            if isinstance(value, bool) or (
+                field_type is int
+                and isinstance(value, float)
+                and not value.is_integer()
+            ):
+                raise self._type_error(field, value)
+
+    def _convert_value(self, field, field_type, value):
+        if not isinstance(value, str):
+            self._check_type(field, field_type, value)
+
+        if field_type is datetime or field_type is date:
+            return self._parse_date_value(field, value, field_type)
+
+        try:
+            return field_type(value)
+        except ValueError as e:
+            raise _with_cause(self._type_error(field, value), e)
+
+    def _parse_field(self, row, field, line_number):
+        try:
+            value = self._get_value(row, field)
+
+            if value is None and field.default is None:
+                return None
+
+            return self._converters[field.name](value)
+        except ValueError as ex:
+            error = CsvValueError(ex, line_number=line_number)
+            raise _with_cause(error, ex.__cause__)
+
+    def _parse_row(self, row, line_number) -> Dict[str, Any]:
+        return {
+            field.name: self._parse_field(row, field, line_number)
+            for field in self._init_fields
+        }
+
+    def convert(self, row: Any, line_number: Optional[int] = None) -> T:
+        """Converts a mapping of column names to values, or a sequence of
+        values for positional converters, into a dataclass instance.
+
+        :param line_number: The position of the row in its source, reported
+        in the `CsvValueError` raised when a value cannot be converted
+        """
+        return self._cls(**self._parse_row(row, line_number))
+
+    def map(self, csv_fieldname: str) -> FieldMapper:
+        """Used to map a field in the CSV file, or a key of the rows, to a
+        `dataclass` field
+        :param csv_fieldname: The name of the CSV field
+        """
+        return FieldMapper(
+            lambda property_name: self._add_to_mapping(property_name, csv_fieldname)
+        )
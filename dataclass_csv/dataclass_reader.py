@@ -1,33 +1,43 @@
-import dataclasses
 import csv
-
-from datetime import date, datetime
-from typing import Union, Type, Optional, Sequence, Dict, Any, List, Generic, TypeVar
-
-import typing
-
-from .field_mapper import FieldMapper
-from .exceptions import CsvValueError
+import dataclasses
+import io
+
+from typing import (
+    Type,
+    Optional,
+    Sequence,
+    Dict,
+    Any,
+    List,
+    TypeVar,
+    Iterator,
+    Tuple,
+    Union,
+)
+
+from .converter import (  # noqa: F401
+    BOOL_VALUES,
+    DEFAULT_INTERN_CACHE_SIZE,
+    FALSE_VALUES,
+    TRUE_VALUES,
+    RecordConverter,
+    get_args,
+    is_union_type,
+    strtobool,
+)
+from .encoding import DEFAULT_BLOCK_SIZE, open_lines, sniff_dialect
+from .lazy import lazy_class, create_lazy_row
+from .exceptions import CsvValueError, SchemaMismatchError
+from .schema import HeaderDiff, compare_header
+from .validation import ValidationReport
 
 from collections import Counter
 
 T = TypeVar("T")
 
-def strtobool(value: str) -> bool:
-    trueValues = ["true", "yes", "t", "y", "on", "1"]
-
-    validValues =  ["false", "no", "f", "n", "off", "0", *trueValues]
-
-    if value.lower() not in validValues:
-        raise ValueError(f"invalid boolean value {value}")
-
-    return value.lower() in trueValues
-
-
-T = TypeVar("T")
 
 def _verify_duplicate_header_items(header):
-    if header is not None and len(header) == 0:
+    if header is not None and len(set(header)) == len(header):
         return
 
     header_counter = Counter(header)
@@ -44,32 +54,27 @@ def _verify_duplicate_header_items(header):
         )
 
 
-def strtobool(value: str) -> bool:
-    trueValues = ["true", "yes", "t", "y", "on", "1"]
-
-    validValues =  ["false", "no", "f", "n", "off", "0", *trueValues]
-
-    if value.lower() not in validValues:
-        raise ValueError(f"invalid boolean value {value}")
-
-    return value.lower() in trueValues
+class _PositionalRows:
+    """Wraps a `csv.reader`, skipping empty rows as `csv.DictReader` does."""
 
+    def __init__(self, reader: Any):
+        self._reader = reader
 
-def is_union_type(t):
-    if hasattr(t, "__origin__") and t.__origin__ is Union:
-        return True
+    @property
+    def line_num(self) -> int:
+        return self._reader.line_num
 
-    return False
-
-
-def get_args(t):
-    if hasattr(t, "__args__"):
-        return t.__args__
+    def __iter__(self):
+        return self
 
-    return tuple()
+    def __next__(self) -> List[str]:
+        row: List[str] = next(self._reader)
+        while not row:
+            row = next(self._reader)
+        return row
 
 
-class DataclassReader(Generic[T]):
+class DataclassReader(RecordConverter[T]):
     def __init__(
         self,
         f: Any,
@@ -77,7 +82,7 @@ class DataclassReader(Generic[T]):
         fieldnames: Optional[Sequence[str]] = None,
         restkey: Optional[str] = None,
         restval: Optional[Any] = None,
-        dialect: str = "excel",
+        dialect: Union[str, Type[csv.Dialect]] = "excel",
         *args: Any,
         **kwds: Any,
     ):
@@ -85,197 +90,239 @@ class DataclassReader(Generic[T]):
         if not f:
             raise ValueError("The f argument is required.")
 
-        if klass is None or not dataclasses.is_dataclass(klass):
-            raise ValueError("klass argument needs to be a dataclass.")
-
-        self._cls = klass
-        self._optional_fields = self._get_optional_fields()
-        self._field_mapping: Dict[str, Dict[str, Any]] = {}
-
         validate_header = kwds.pop("validate_header", True)
+        positional = kwds.pop("positional", False)
+        header_check = kwds.pop("header_check", None)
 
-        self._reader = csv.DictReader(
-            f, fieldnames, restkey, restval, dialect, *args, **kwds
-        )
+        super().__init__(klass, positional=positional)
 
-        if validate_header:
-            _verify_duplicate_header_items(self._reader.fieldnames)
+        self._file: Any = None
+        self._records: Optional[Iterator[T]] = None
+        self.encoding: Optional[str] = None
+        self._lazy_class = lazy_class(klass) if kwds.pop("lazy", False) else None
+        self._check_required: bool = kwds.pop("check_required", False)
 
-        self.type_hints = typing.get_type_hints(klass)
+        if positional:
+            if fieldnames is not None:
+                raise ValueError(
+                    "The fieldnames argument cannot be used with positional=True."
+                )
 
-    def _get_optional_fields(self):
-        return [
-            field.name
-            for field in dataclasses.fields(self._cls)
-            if not isinstance(field.default, dataclasses._MISSING_TYPE)
-            or not isinstance(field.default_factory, dataclasses._MISSING_TYPE)
-        ]
+            self._reader: Any = _PositionalRows(csv.reader(f, dialect, *args, **kwds))
+        else:
+            self._reader = csv.DictReader(
+                f, fieldnames, restkey, restval, dialect, *args, **kwds
+            )
 
-    def _add_to_mapping(self, property_name, csv_fieldname):
-        self._field_mapping[property_name] = csv_fieldname
+        if validate_header and not positional:
+            _verify_duplicate_header_items(self._reader.fieldnames)
 
-    def _get_metadata_option(self, field, key):
-        option = field.metadata.get(key, getattr(self._cls, f"__{key}__", None))
-        return option
+        if header_check is not None:
+            self.check_header(header_check)
 
-    def _get_default_value(self, field):
-        return (
-            field.default
-            if not isinstance(field.default, dataclasses._MISSING_TYPE)
-            else field.default_factory()
+    @classmethod
+    def from_path(
+        cls,
+        path: str,
+        klass: Type[T],
+        encoding: Optional[str] = None,
+        sniff: bool = False,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        cache: Any = None,
+        **kwds: Any,
+    ) -> "DataclassReader[T]":
+        """Opens the CSV file in `path`, detecting its encoding from the
+        first block, and returns a reader that closes the file when closed.
+
+        Files with a byte order mark (UTF-8, UTF-16 or UTF-32) are decoded
+        with the matching codec and the mark is removed; UTF-16 without one
+        and UTF-8 are recognized, and other files are decoded as cp1252.
+        The file is decoded incrementally in blocks of `block_size` bytes.
+
+        Usage:
+            >>> with DataclassReader.from_path('users.csv', User) as reader:
+            >>>     users = list(reader)
+
+        :param encoding: The encoding of the file, instead of detecting it
+        :param sniff: Use `csv.Sniffer` on the first block to detect the
+        dialect instead of using the `dialect` argument
+        :param cache: A `ParsedCache`. The records are loaded from its
+        snapshot of the file, which is created when missing, instead of
+        being converted while iterating
+        """
+        records = None
+        if cache is not None:
+            records = cache.read(path, klass, encoding, sniff=sniff, **kwds)
+
+        f = open(path, "rb")
+
+        try:
+            reader = cls._from_binary(f, klass, encoding, sniff, block_size, kwds)
+        except BaseException:
+            f.close()
+            raise
+
+        reader._file = f
+        if records is not None:
+            reader._records = iter(records)
+        return reader
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        klass: Type[T],
+        encoding: Optional[str] = None,
+        sniff: bool = False,
+        **kwds: Any,
+    ) -> "DataclassReader[T]":
+        """Same as `from_path`, for the content of a CSV file in memory."""
+        return cls._from_binary(
+            io.BytesIO(data), klass, encoding, sniff, DEFAULT_BLOCK_SIZE, kwds
         )
 
-    def _get_possible_keys(self, fieldname, row):
-        possible_keys = list(filter(lambda x: x.strip() == fieldname, row.keys()))
-        if possible_keys:
-            return possible_keys[0]
+    @classmethod
+    def _from_binary(
+        cls,
+        f: Any,
+        klass: Type[T],
+        encoding: Optional[str],
+        sniff: bool,
+        block_size: int,
+        kwds: Dict[str, Any],
+    ) -> "DataclassReader[T]":
+        lines, encoding = open_lines(f, encoding, block_size)
 
-    def _get_value(self, row, field):
-        is_field_mapped = False
+        if sniff:
+            kwds["dialect"] = sniff_dialect(lines.head, kwds.get("dialect", "excel"))
 
-        if field.name in self._field_mapping.keys():
-            is_field_mapped = True
-            key = self._field_mapping.get(field.name)
-        else:
-            key = field.name
+        reader = cls(lines, klass, **kwds)
+        reader.encoding = encoding
+        return reader
 
-        if key in row.keys():
-            value = row[key]
-        else:
-            try:
-                possible_key = self._get_possible_keys(field.name, row)
-                key = possible_key if possible_key else key
-                value = row[key]
-            except KeyError:
-                if field.name in self._optional_fields:
-                    return self._get_default_value(field)
-                else:
-                    keyerror_message = f"The value for the column `{field.name}`"
-                    if is_field_mapped:
-                        keyerror_message = f"The value for the mapped column `{key}`"
-                    raise KeyError(f"{keyerror_message} is missing in the CSV file")
-        
-        if not value and field.name in self._optional_fields:
-            return self._get_default_value(field)
-        elif not value and field.name not in self._optional_fields:
-            raise ValueError(f"The field `{field.name}` is required.")
-        elif (
-            value
-            and field.type is str
-            and not len(value.strip())
-            and not self._get_metadata_option(field, "accept_whitespaces")
-        ):
-            raise ValueError(
-                (
-                    f"It seems like the value of `{field.name}` contains "
-                    "only white spaces. To allow white spaces to all "
-                    "string fields, use the @accept_whitespaces "
-                    "decorator. "
-                    "To allow white spaces specifically for the field "
-                    f"`{field.name}` change its definition to: "
-                    f"`{field.name}: str = field(metadata="
-                    "{'accept_whitespaces': True})`."
-                )
-            )
-        else:
-            return value
-
-    def _parse_date_value(self, field, date_value, field_type):
-        dateformat = self._get_metadata_option(field, "dateformat")
-
-        if not isinstance(date_value, str):
-            return date_value
-
-        if not dateformat:
-            raise AttributeError(
-                (
-                    "Unable to parse the datetime string value. Date format "
-                    "not specified. To specify a date format for all "
-                    "datetime fields in the class, use the @dateformat "
-                    "decorator. To define a date format specifically for this "
-                    "field, change its definition to: "
-                    f"`{field.name}: datetime = field(metadata="
-                    "{'dateformat': <date_format>})`."
-                )
-            )
+    def _set_header(self, header: Sequence[str]) -> None:
+        # Maps the fields of a positional reader to the columns of a header,
+        # once, instead of looking up the names in every row.
+        columns = {name.strip(): i for i, name in reversed(list(enumerate(header)))}
+        positions = {}
 
-        datetime_obj = datetime.strptime(date_value, dateformat)
+        for field in self._init_fields:
+            name = self._field_mapping.get(field.name, field.name)
+            if name in columns:
+                positions[field.name] = columns[name]
 
-        if field_type == date:
-            return datetime_obj.date()
-        else:
-            return datetime_obj
+        self._positions = positions
 
     def _process_row(self, row) -> T:
-        values = dict()
-
-        for field in dataclasses.fields(self._cls):
-            if not field.init:
-                continue
-
-            try:
-                value = self._get_value(row, field)
-            except ValueError as ex:
-                raise CsvValueError(ex, line_number=self._reader.line_num) from None
+        values = self._parse_row(row, self._reader.line_num)
+        return self._cls(**values)
 
-            if not value and field.default is None:
-                values[field.name] = None
-                continue
+    def _iter_values(self, field_names: Sequence[str]) -> Iterator[Tuple[Any, ...]]:
+        """Yields the converted values of the given fields for each remaining
+        row, without creating the dataclass instances."""
+        init_fields = {x.name: x for x in self._init_fields}
 
-            field_type = self.type_hints[field.name]
+        unknown = [x for x in field_names if x not in init_fields]
+        if unknown:
+            raise ValueError(f"Unknown fields for {self._cls.__name__}: {unknown}")
 
-            if is_union_type(field_type):
-                type_args = [x for x in get_args(field_type) if x is not type(None)]
-                if len(type_args) == 1:
-                    field_type = type_args[0]
+        return self._convert_values([init_fields[x] for x in field_names])
 
-            if field_type is datetime or field_type is date:
-                try:
-                    transformed_value = self._parse_date_value(field, value, field_type)
-                except ValueError as ex:
-                    raise CsvValueError(ex, line_number=self._reader.line_num) from None
-                else:
-                    values[field.name] = transformed_value
-                    continue
-
-            if field_type is bool:
-                try:
-                    transformed_value = (
-                        value
-                        if isinstance(value, bool)
-                        else strtobool(str(value).strip())
-                    )
-                except ValueError as ex:
-                    raise CsvValueError(ex, line_number=self._reader.line_num) from None
-                else:
-                    values[field.name] = transformed_value
-                    continue
-
-            try:
-                transformed_value = field_type(value)
-            except ValueError as e:
-                raise CsvValueError(
-                    (
-                        f"The field `{field.name}` is defined as {field.type} "
-                        f"but received a value of type {type(value)}."
-                    ),
-                    line_number=self._reader.line_num,
-                ) from e
-            else:
-                values[field.name] = transformed_value
-        return self._cls(**values)
+    def _convert_values(
+        self, fields: List[dataclasses.Field]
+    ) -> Iterator[Tuple[Any, ...]]:
+        # A generator function rather than a returned generator expression,
+        # which mypyc evaluates when the function is called, so the rows are
+        # converted one at a time in the compiled build as well.
+        for row in self._reader:
+            line_number = self._reader.line_num
+            yield tuple(self._parse_field(row, x, line_number) for x in fields)
 
     def __next__(self) -> T:
+        if self._records is not None:
+            return next(self._records)
+
         row = next(self._reader)
+
+        if self._lazy_class is not None:
+            return create_lazy_row(
+                self._lazy_class,
+                self,
+                row,
+                self._reader.line_num,
+                self._check_required,
+            )
+
         return self._process_row(row)
 
     def __iter__(self):
         return self
 
-    def map(self, csv_fieldname: str) -> FieldMapper:
-        """Used to map a field in the CSV file to a `dataclass` field
-        :param csv_fieldname: The name of the CSV field
+    def validate(self, max_failures: int = 10) -> ValidationReport:
+        """Checks that every remaining row in the CSV file can be parsed
+        without creating the dataclass instances.
+
+        The conversion and validation rules of each field are applied the
+        same way as when iterating over the reader, but the values are
+        discarded, so the memory usage does not grow with the file size.
+
+        :param max_failures: The number of failures to keep in the report.
+        Failures after that are only counted.
         """
-        return FieldMapper(
-            lambda property_name: self._add_to_mapping(property_name, csv_fieldname)
-        )
+        report = ValidationReport(max_failures=max_failures)
+
+        for row in self._reader:
+            line_number = self._reader.line_num
+            row_is_valid = True
+
+            for field in self._init_fields:
+                try:
+                    self._parse_field(row, field, line_number)
+                except (CsvValueError, KeyError, AttributeError) as ex:
+                    row_is_valid = False
+                    report.add_failure(field.name, line_number, ex)
+
+            report.add_row(row_is_valid)
+
+        return report
+
+    def check_header(self, check: str = "missing") -> HeaderDiff:
+        """Compares the header of the CSV file with the dataclass fields,
+        without reading any row, and returns the differences.
+
+        The same check runs when the reader is created with the kwarg
+        `header_check`; call this method instead when columns are mapped
+        with `map`.
+
+        :param check: `missing` fails when the columns of required fields
+        are missing, `extra` also fails when the header has other columns,
+        and `strict` also fails when the columns are in a different order
+        than the fields
+        :raises SchemaMismatchError: With the differences in its `diff`
+        attribute
+        """
+        if self._positions is not None:
+            raise ValueError("Positional readers do not have a header to check.")
+
+        diff = compare_header(self._cls, self._reader.fieldnames, self._field_mapping)
+        problems = diff.problems(check)
+
+        if problems:
+            raise SchemaMismatchError(
+                f"The header of the CSV file does not match {self._cls.__name__}: "
+                + "; ".join(problems),
+                diff,
+            )
+
+        return diff
+
+    def close(self) -> None:
+        """Closes the file opened by `from_path`."""
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
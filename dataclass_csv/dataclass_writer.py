@@ -1,7 +1,9 @@
 import csv
 import dataclasses
-from typing import Type, Dict, Any, List, Iterable, Generic, TypeVar
+from datetime import date
+from typing import Type, Dict, Any, List, Iterable, Generic, Tuple, TypeVar, Union
 from .header_mapper import HeaderMapper
+from .schema import get_schema
 
 
 
@@ -14,7 +16,7 @@ class DataclassWriter(Generic[T]):
         f: Any,
         data: Iterable[T],
         klass: Type[T],
-        dialect: str = "excel",
+        dialect: Union[str, Type[csv.Dialect]] = "excel",
         **fmtparams: Any,
     ):
         if not f:
@@ -27,10 +29,42 @@ class DataclassWriter(Generic[T]):
         self._cls = klass
         self._field_mapping: Dict[str, str] = dict()
 
-        self._fieldnames = [x.name for x in dataclasses.fields(klass)]
+        fields = get_schema(klass).fields
+        self._fieldnames = [x.name for x in fields]
+
+        # Dates are written in the `dateformat` of the field, so the file can
+        # be read back by `DataclassReader` with the same class.
+        class_dateformat = getattr(klass, "__dateformat__", None)
+        self._dateformats: List[Tuple[int, str]] = []
+        for i, field in enumerate(fields):
+            dateformat = field.metadata.get("dateformat", class_dateformat)
+            if dateformat:
+                self._dateformats.append((i, dateformat))
 
         self._writer = csv.writer(f, dialect=dialect, **fmtparams)
 
+    @classmethod
+    def from_dataframe(
+        cls,
+        f: Any,
+        df: Any,
+        klass: Type[T],
+        dialect: Union[str, Type[csv.Dialect]] = "excel",
+        **fmtparams: Any,
+    ) -> "DataclassWriter[T]":
+        """Creates a writer for the rows of a pandas `DataFrame`, converted
+        into instances of `klass` by matching the columns with the field
+        names. Requires the `pandas` extra.
+
+        Usage:
+            >>> df = read_dataframe('users.csv', User)
+            >>> with open('adults.csv', 'w') as f:
+            >>>     DataclassWriter.from_dataframe(f, df[df.age >= 18], User).write()
+        """
+        from .dataframe import dataframe_records
+
+        return cls(f, dataframe_records(df, klass), klass, dialect, **fmtparams)
+
     def _add_to_mapping(self, header: str, propname: str):
         self._field_mapping[propname] = header
 
@@ -50,16 +84,29 @@ class DataclassWriter(Generic[T]):
 
             self._writer.writerow(self._fieldnames)
         for item in self._data:
-            if not isinstance(item, self._cls):
-                raise TypeError(
-                    (
-                        f"The item [{item}] is not an instance of "
-                        f"{self._cls.__name__}. All items on the list must be "
-                        "instances of the same type"
-                    )
+            self._writer.writerow(self._to_row(item))
+
+    def _to_row(self, item: Any) -> Any:
+        if not isinstance(item, self._cls):
+            raise TypeError(
+                (
+                    f"The item [{item}] is not an instance of "
+                    f"{self._cls.__name__}. All items on the list must be "
+                    "instances of the same type"
                 )
-            row = dataclasses.astuple(item)
-            self._writer.writerow(row)
+            )
+        row: Any = dataclasses.astuple(item)  # type: ignore[call-overload]
+        if self._dateformats:
+            row = self._format_dates(row)
+        return row
+
+    def _format_dates(self, row: Tuple[Any, ...]) -> List[Any]:
+        values = list(row)
+        for i, dateformat in self._dateformats:
+            value = values[i]
+            if isinstance(value, date):
+                values[i] = value.strftime(dateformat)
+        return values
 
     def map(self, propname: str) -> HeaderMapper:
         """Used to map a field in the dataclass to header item in the CSV file
@@ -0,0 +1,336 @@
+import dataclasses
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from .converter import TRUE_VALUES, FALSE_VALUES, RecordConverter, _bool_table
+from .exceptions import CsvValueError
+from .schema import get_schema
+
+T = TypeVar("T")
+
+
+def _pandas() -> Any:
+    try:
+        import pandas
+    except ImportError:
+        raise ImportError(
+            "pandas is required to use dataclass_csv.dataframe. Install it with "
+            "`pip install dataclass-csv[pandas]`."
+        ) from None
+
+    return pandas
+
+
+class _Chunk:
+    """The string columns of a chunk of a CSV file, with the line number of
+    each row, and the first error found while converting them."""
+
+    def __init__(self, pd: Any, df: Any, lines_before: int):
+        df.columns = [str(x).strip() for x in df.columns]
+
+        # Blank lines are read as rows of empty values, so they are counted
+        # in the line numbers, and dropped here.
+        blank = (df == "").all(axis=1)
+
+        # Values with line breaks span several lines of the file.
+        line_breaks = sum(
+            (df[x].str.count("\n") for x in df.columns), pd.Series(0, index=df.index)
+        )
+        lines = lines_before + 1 + pd.RangeIndex(len(df)) + line_breaks.cumsum()
+
+        self.df = df[~blank].reset_index(drop=True)
+        self.lines = lines[~blank].to_numpy()
+        self.last_line = int(lines.iloc[-1]) if len(lines) else lines_before
+        self.error: Optional[Tuple[int, int, BaseException]] = None
+
+    def fail(self, position: int, order: int, error: BaseException) -> None:
+        if self.error is None or (position, order) < self.error[:2]:
+            self.error = (position, order, error)
+
+    def raise_error(self) -> None:
+        if self.error is not None:
+            position, _, error = self.error
+            line_number = int(self.lines[position])
+            if isinstance(error, ValueError):
+                raise CsvValueError(error, line_number=line_number)
+            raise error
+
+
+def _first(mask: Any) -> Optional[int]:
+    positions = mask.to_numpy().nonzero()[0]
+    return int(positions[0]) if len(positions) else None
+
+
+def _conversion_error(
+    converter: RecordConverter, field: dataclasses.Field, value: Any
+) -> BaseException:
+    """Returns the error raised by `DataclassReader` for a value that failed
+    the vectorized conversion, so both report the same message."""
+    try:
+        converter._converters[field.name](converter._check_value(field, value))
+    except (ValueError, AttributeError) as ex:
+        return ex
+
+    return ValueError(
+        f"The field `{field.name}` is defined as {field.type} "
+        f"but received a value of type {type(value)}."
+    )
+
+
+def _is_number(field_type: Any, value: str) -> bool:
+    try:
+        field_type(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_numbers(pd: Any, field_type: Any, column: Any, empty: Any) -> Any:
+    """Converts a column of numbers with the `int` and `float` parsers, like
+    `DataclassReader`, or returns `None` when a value is invalid.
+
+    Casting an object array of strings calls `int` or `float` on each
+    value, so the same strings are accepted, such as `nan` and `inf` for
+    floats but not `1e3` for ints, and the integers are exact instead of
+    going through `float64`.
+    """
+    try:
+        if field_type is float:
+            floats = column.where(~empty, "nan").to_numpy(dtype=object)
+            return pd.Series(floats.astype("float64"), index=column.index)
+
+        ints = column.where(~empty, "0").to_numpy(dtype=object)
+        try:
+            array = pd.arrays.IntegerArray(ints.astype("int64"), empty.to_numpy())
+        except OverflowError:
+            # Integers that do not fit in `Int64` are kept as Python ints.
+            ints = [int(x) if x else None for x in column.tolist()]
+            return pd.Series(ints, index=column.index, dtype=object)
+        return pd.Series(array, index=column.index)
+    except ValueError:
+        return None
+
+
+def _convert_column(
+    pd: Any,
+    converter: RecordConverter,
+    field: dataclasses.Field,
+    order: int,
+    column: Any,
+    chunk: _Chunk,
+) -> Any:
+    field_type = converter._get_field_type(field)
+    option = converter._get_metadata_option
+    empty = column == ""
+
+    if field.name not in converter._optional_fields:
+        position = _first(empty)
+        if position is not None:
+            error = ValueError(f"The field `{field.name}` is required.")
+            chunk.fail(position, order, error)
+
+    def fail(invalid: Any) -> None:
+        position = _first(invalid & ~empty)
+        if position is not None:
+            value = original.iloc[position]
+            chunk.fail(position, order, _conversion_error(converter, field, value))
+
+    original = column
+
+    if field_type is str:
+        if field.type is str and not option(field, "accept_whitespaces"):
+            fail(column.str.strip() == "")
+        values = column.where(~empty, None).astype(object)
+    elif field_type is int or field_type is float:
+        thousands, decimal = option(field, "thousands"), option(field, "decimal")
+        if thousands:
+            column = column.str.replace(thousands, "", regex=False)
+        if decimal and decimal != ".":
+            column = column.str.replace(decimal, ".", regex=False)
+
+        values = _parse_numbers(pd, field_type, column, empty)
+        if values is None:
+            invalid = column.map(lambda x: not _is_number(field_type, x))
+            fail(invalid)
+            return None
+    elif field_type is bool:
+        true_values = option(field, "true_values")
+        false_values = option(field, "false_values")
+        table = _bool_table(
+            TRUE_VALUES if true_values is None else true_values,
+            FALSE_VALUES if false_values is None else false_values,
+        )
+
+        values = column.str.strip().str.lower().map(table).astype("boolean")
+        fail(values.isna())
+    elif field_type is datetime or field_type is date:
+        dateformat = option(field, "dateformat")
+        if not dateformat:
+            fail(column == column)
+            return None
+
+        values = pd.to_datetime(
+            column.where(~empty, None), format=dateformat, errors="coerce"
+        )
+        fail(values.isna())
+    else:
+        # Other types are converted value by value, like `DataclassReader`.
+        convert = converter._converters[field.name]
+        results: List[Any] = []
+
+        for position, value in enumerate(column.tolist()):
+            try:
+                results.append(convert(value) if value else None)
+            except (ValueError, AttributeError) as ex:
+                chunk.fail(position, order, ex)
+                break
+
+        if len(results) < len(column):
+            return None
+        values = pd.Series(results, index=column.index, dtype=object)
+
+    if field.name in converter._optional_fields:
+        default = converter._get_default_value(field)
+        if default is not None:
+            values = values.where(~empty, default)
+
+    if option(field, "intern") or field.name in getattr(
+        converter._cls, "__categorical__", ()
+    ):
+        values = values.astype("category")
+
+    return values
+
+
+def _convert_chunk(pd: Any, converter: RecordConverter, chunk: _Chunk) -> Any:
+    df = chunk.df
+    columns: Dict[str, Any] = {}
+
+    for order, field in enumerate(converter._init_fields):
+        if field.name in df.columns:
+            column = df[field.name]
+        elif field.name in converter._optional_fields:
+            column = pd.Series("", index=df.index, dtype=object)
+        else:
+            raise KeyError(
+                f"The value for the column `{field.name}` is missing in the CSV file"
+            )
+
+        columns[field.name] = _convert_column(
+            pd, converter, field, order, column, chunk
+        )
+
+    chunk.raise_error()
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def read_dataframe(
+    f: Any, klass: Type[Any], chunksize: Optional[int] = None, **kwds: Any
+) -> Any:
+    """Reads a CSV file into a pandas `DataFrame`, with a column for each
+    field of `klass` that is set by its `__init__`.
+
+    The values are validated with the same rules as `DataclassReader`:
+    required fields, white spaces, date formats and boolean and number
+    formats. They are checked column by column with vectorized operations,
+    and the first invalid value raises a `CsvValueError` with its line
+    number. The dtypes come from the type hints: `Int64` for `int`, or
+    `object` when a value does not fit in 64 bits, `float64` for `float`,
+    `boolean` for `bool`, `datetime64` for `date` and `datetime`,
+    `category` for interned or `@categorical` fields, and `object` for the
+    other types, which are converted value by value.
+
+    Usage:
+        >>> from dataclass_csv.dataframe import read_dataframe
+
+        >>> df = read_dataframe('users.csv', User)
+
+        >>> for chunk in read_dataframe('users.csv', User, chunksize=100_000):
+        >>>     ...
+
+    :param f: A path or a file object, passed to `pandas.read_csv`
+    :param chunksize: Return an iterator of DataFrames of at most this
+    many rows instead of a single DataFrame
+    :param kwds: Passed to `pandas.read_csv`, e.g. `delimiter`
+    """
+    pd = _pandas()
+    converter = RecordConverter(klass)
+
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be greater than zero.")
+
+    options = dict(kwds, dtype=str, keep_default_na=False, skip_blank_lines=False)
+    chunks = _read_chunks(pd, converter, f, chunksize, options)
+
+    if chunksize is not None:
+        return chunks
+
+    frames = list(chunks)
+    return frames[0]
+
+
+def _read_chunks(
+    pd: Any,
+    converter: RecordConverter,
+    f: Any,
+    chunksize: Optional[int],
+    options: Dict[str, Any],
+) -> Iterator[Any]:
+    if chunksize is None:
+        frames: Any = [pd.read_csv(f, **options)]
+    else:
+        frames = pd.read_csv(f, chunksize=chunksize, **options)
+
+    lines_before = 1
+
+    for df in frames:
+        chunk = _Chunk(pd, df, lines_before)
+        lines_before = chunk.last_line
+        yield _convert_chunk(pd, converter, chunk)
+
+
+def _python_value(pd: Any, value: Any, field_type: Any) -> Any:
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+
+    if isinstance(value, float) and value != value:
+        return None
+
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+        return value.date() if field_type is date else value
+
+    return value.item() if hasattr(value, "item") else value
+
+
+def dataframe_records(df: Any, klass: Type[T]) -> Iterator[T]:
+    """Converts the rows of a pandas `DataFrame` into instances of `klass`,
+    matching the columns with the field names. Missing values become
+    `None`, and fields without a column get their default value."""
+    pd = _pandas()
+    converter = RecordConverter(klass)
+    schema = get_schema(klass)
+
+    columns = []
+    for field in schema.init_fields:
+        if field.name in df.columns:
+            columns.append((field.name, converter._get_field_type(field)))
+        elif field.name not in schema.optional_fields:
+            raise ValueError(f"The DataFrame does not have the column `{field.name}`.")
+
+    return _dataframe_records(pd, df, klass, columns)
+
+
+def _dataframe_records(
+    pd: Any, df: Any, klass: Type[T], columns: List[Tuple[str, Any]]
+) -> Iterator[T]:
+    names = [name for name, _ in columns]
+
+    for row in df[names].itertuples(index=False, name=None):
+        values: Dict[str, Union[Any, None]] = {
+            name: _python_value(pd, value, field_type)
+            for (name, field_type), value in zip(columns, row)
+        }
+        yield klass(**values)
@@ -1,4 +1,4 @@
-from typing import Any, Callable, TypeVar, Type
+from typing import Any, Callable, Sequence, TypeVar, Type
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -50,3 +50,96 @@ def accept_whitespaces(klass: KLASS) -> KLASS:
 
     klass.__accept_whitespaces__ = True
     return klass
+
+
+def categorical(*field_names: str) -> Callable[[KLASS], KLASS]:
+    """The categorical decorator tells the `DataclassReader` that the
+    given fields have only a few distinct values. String values of these
+    fields are interned, and the conversion of the other types is cached,
+    so repeated values share the same object.
+
+    The same behavior can be enabled for a single field using the
+    metadata: `field(metadata={'intern': True})`. Instead of `True`, an
+    `int` can be used to set the size of the conversion cache.
+
+    Usage:
+        >>> from dataclasses import dataclass
+        >>> from dataclass_csv import categorical
+
+        >>> @dataclass
+        >>> @categorical('country', 'status')
+        >>> class Order:
+        >>>     id: int
+        >>>     country: str
+        >>>     status: Status
+    """
+
+    if not field_names or not all(isinstance(x, str) for x in field_names):
+        raise ValueError("Invalid value for the field_names argument")
+
+    def func(klass):
+        klass.__categorical__ = frozenset(field_names)
+        return klass
+
+    return func
+
+
+def boolean_values(
+    true_values: Sequence[str], false_values: Sequence[str]
+) -> Callable[[KLASS], KLASS]:
+    """The boolean_values decorator sets the values the `DataclassReader`
+    accepts for the `bool` fields of the class. The values are compared
+    ignoring case and surrounding white spaces.
+
+    The vocabulary of a single field can be set using the metadata:
+    `field(metadata={'true_values': ['ja'], 'false_values': ['nein']})`.
+
+    Usage:
+        >>> from dataclasses import dataclass
+        >>> from dataclass_csv import boolean_values
+
+        >>> @dataclass
+        >>> @boolean_values(true_values=['ja', 'j'], false_values=['nein', 'n'])
+        >>> class User:
+        >>>     name: str
+        >>>     active: bool
+    """
+
+    if not true_values or not false_values:
+        raise ValueError("Invalid value for the true_values or false_values argument")
+
+    def func(klass):
+        klass.__true_values__ = tuple(true_values)
+        klass.__false_values__ = tuple(false_values)
+        return klass
+
+    return func
+
+
+def number_format(thousands: str = "", decimal: str = ".") -> Callable[[KLASS], KLASS]:
+    """The number_format decorator sets the thousands and decimal separators
+    the `DataclassReader` should use when parsing `int` and `float` fields.
+
+    The format of a single field can be set using the metadata:
+    `field(metadata={'thousands': '.', 'decimal': ','})`.
+
+    Usage:
+        >>> from dataclasses import dataclass
+        >>> from dataclass_csv import number_format
+
+        >>> @dataclass
+        >>> @number_format(thousands='.', decimal=',')
+        >>> class Product:
+        >>>     name: str
+        >>>     price: float
+    """
+
+    if len(thousands) > 1 or len(decimal) != 1 or thousands == decimal:
+        raise ValueError("Invalid value for the thousands or decimal argument")
+
+    def func(klass):
+        klass.__thousands__ = thousands
+        klass.__decimal__ = decimal
+        return klass
+
+    return func
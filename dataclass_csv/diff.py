@@ -0,0 +1,309 @@
+import contextlib
+import csv
+import dataclasses
+import itertools
+import operator
+import os
+import pickle
+import tempfile
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .dataclass_reader import DataclassReader
+from .exceptions import CsvValueError
+from .sorting import DEFAULT_BUFFER_SIZE, _read_run
+
+DEFAULT_PARTITIONS = 16
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+_MISSING: Any = object()
+
+
+@dataclasses.dataclass
+class Change:
+    """A difference between two files. Records that exist in both files
+    produce one `changed` entry for each field with a different value."""
+
+    key: Any
+    change: str
+    field: Optional[str] = None
+    old_value: Any = None
+    new_value: Any = None
+
+
+def _compare(
+    key: Any, old: Any, new: Any, field_names: Sequence[str]
+) -> Iterator[Change]:
+    for name in field_names:
+        old_value, new_value = getattr(old, name), getattr(new, name)
+        if old_value != new_value:
+            yield Change(key, CHANGED, name, old_value, new_value)
+
+
+def _key_error(message: str, line_number: int) -> CsvValueError:
+    return CsvValueError(ValueError(message), line_number=line_number)
+
+
+def _keyed(
+    reader: DataclassReader, key: Callable[[Any], Any], composite: bool, path: str
+) -> Iterator[Tuple[int, Any, Any]]:
+    """Yields the line number, key and record of each row, and raises a
+    `CsvValueError` when a key is empty."""
+    for record in reader:
+        line_number = reader._reader.line_num
+        current = key(record)
+
+        if current is None or (composite and None in current):
+            raise _key_error(f"The key of the record in {path} is empty.", line_number)
+
+        yield line_number, current, record
+
+
+def _checked_order(items: Iterator[Tuple[int, Any, Any]], path: str) -> Iterator[Any]:
+    previous: Any = _MISSING
+
+    for line_number, current, record in items:
+        error = None
+        if previous is not _MISSING and current == previous:
+            error = f"The key {current!r} is repeated in {path}."
+        elif previous is not _MISSING and current < previous:
+            error = f"The file {path} is not sorted by the key."
+
+        if error is not None:
+            raise _key_error(error, line_number)
+
+        previous = current
+        yield record
+
+
+def _merge_diff(
+    old: Iterator[Any],
+    new: Iterator[Any],
+    key: Callable[[Any], Any],
+    field_names: Sequence[str],
+) -> Iterator[Change]:
+    old_record, new_record = next(old, _MISSING), next(new, _MISSING)
+
+    while old_record is not _MISSING or new_record is not _MISSING:
+        old_key = _MISSING if old_record is _MISSING else key(old_record)
+        new_key = _MISSING if new_record is _MISSING else key(new_record)
+
+        if new_key is _MISSING or (old_key is not _MISSING and old_key < new_key):
+            yield Change(old_key, REMOVED)
+            old_record = next(old, _MISSING)
+        elif old_key is _MISSING or new_key < old_key:
+            yield Change(new_key, ADDED)
+            new_record = next(new, _MISSING)
+        else:
+            yield from _compare(old_key, old_record, new_record, field_names)
+            old_record, new_record = next(old, _MISSING), next(new, _MISSING)
+
+
+def _table(items: Iterable[Tuple[int, Any, Any]], path: str) -> Dict[Any, Any]:
+    table: Dict[Any, Any] = {}
+
+    for line_number, current, record in items:
+        if current in table:
+            raise _key_error(f"The key {current!r} is repeated in {path}.", line_number)
+        table[current] = record
+
+    return table
+
+
+def _hash_diff(
+    old: Dict[Any, Any],
+    new: Iterable[Tuple[int, Any, Any]],
+    field_names: Sequence[str],
+    path: str,
+) -> Iterator[Change]:
+    seen = set()
+
+    for line_number, new_key, new_record in new:
+        if new_key in seen:
+            raise _key_error(f"The key {new_key!r} is repeated in {path}.", line_number)
+        seen.add(new_key)
+
+        old_record = old.pop(new_key, _MISSING)
+
+        if old_record is _MISSING:
+            yield Change(new_key, ADDED)
+        else:
+            yield from _compare(new_key, old_record, new_record, field_names)
+
+    for old_key in old:
+        yield Change(old_key, REMOVED)
+
+
+def _partition(items: Iterable[Tuple[int, Any, Any]], paths: List[str]) -> None:
+    files = [open(x, "wb") for x in paths]
+
+    try:
+        # Each item is pickled on its own, so it is read back by `_read_run`
+        # without references to the objects of other items.
+        for item in items:
+            f = files[hash(item[1]) % len(paths)]
+            pickle.dump(item, f, pickle.HIGHEST_PROTOCOL)
+    finally:
+        for f in files:
+            f.close()
+
+
+def diff(
+    old_path: str,
+    new_path: str,
+    klass: Type[Any],
+    key: Union[str, Sequence[str]],
+    presorted: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    partitions: int = DEFAULT_PARTITIONS,
+    tmpdir: Optional[str] = None,
+    encoding: str = "utf-8",
+    **kwds: Any,
+) -> Iterator[Change]:
+    """Compares two CSV files with the same dataclass, matching their
+    records by a key, and yields a `Change` for each added or removed
+    record and for each changed field.
+
+    The values are compared after being converted, so formatting
+    differences such as `1.0` and `1.00` are not reported. The changes can
+    be written to a CSV file with `write_changes`.
+
+    With `presorted=True` both files must be sorted by the key and are
+    compared in a single streaming pass. Otherwise the old file is loaded
+    in a hash table when it has at most `buffer_size` records; larger files
+    are split in `partitions` temporary files by the hash of the key and
+    compared one partition at a time. The keys must be unique in each file:
+    a repeated or empty key, or with `presorted=True` a key out of order,
+    raises a `CsvValueError` with its line number.
+
+    Usage:
+        >>> from dataclass_csv import diff, write_changes
+
+        >>> changes = diff('yesterday.csv', 'today.csv', Product, key='sku')
+        >>> with open('changes.csv', 'w', newline='') as f:
+        >>>     write_changes(f, changes, key='sku')
+
+    :param key: The name of the key field, or a list of names
+    :param kwds: Passed to `DataclassReader`
+    """
+    if buffer_size < 1 or partitions < 1:
+        raise ValueError("buffer_size and partitions must be positive.")
+
+    key_names = [key] if isinstance(key, str) else list(key)
+    field_names = [x.name for x in dataclasses.fields(klass) if x.init]
+
+    unknown = [x for x in key_names if x not in field_names]
+    if not key_names or unknown:
+        raise ValueError(f"Unknown key fields for {klass.__name__}: {unknown}")
+
+    key_func = operator.attrgetter(*key_names)
+    compared = [x for x in field_names if x not in key_names]
+
+    return _diff(
+        old_path,
+        new_path,
+        klass,
+        key_func,
+        len(key_names) > 1,
+        compared,
+        presorted,
+        buffer_size,
+        partitions,
+        tmpdir,
+        encoding,
+        kwds,
+    )
+
+
+def _diff(
+    old_path: str,
+    new_path: str,
+    klass: Type[Any],
+    key: Callable[[Any], Any],
+    composite: bool,
+    field_names: List[str],
+    presorted: bool,
+    buffer_size: int,
+    partitions: int,
+    tmpdir: Optional[str],
+    encoding: str,
+    kwds: Dict[str, Any],
+) -> Iterator[Change]:
+    with contextlib.ExitStack() as stack:
+        old_file = stack.enter_context(open(old_path, newline="", encoding=encoding))
+        new_file = stack.enter_context(open(new_path, newline="", encoding=encoding))
+
+        old_reader = DataclassReader(old_file, klass, **kwds)
+        new_reader = DataclassReader(new_file, klass, **kwds)
+
+        old = _keyed(old_reader, key, composite, old_path)
+        new = _keyed(new_reader, key, composite, new_path)
+
+        if presorted:
+            old_records = _checked_order(old, old_path)
+            new_records = _checked_order(new, new_path)
+            yield from _merge_diff(old_records, new_records, key, field_names)
+            return
+
+        buffered = list(itertools.islice(old, buffer_size + 1))
+
+        if len(buffered) <= buffer_size:
+            table = _table(buffered, old_path)
+            del buffered
+            yield from _hash_diff(table, new, field_names, new_path)
+            return
+
+        directory = stack.enter_context(tempfile.TemporaryDirectory(dir=tmpdir))
+        old_paths = [os.path.join(directory, f"old{i}") for i in range(partitions)]
+        new_paths = [os.path.join(directory, f"new{i}") for i in range(partitions)]
+
+        _partition(itertools.chain(buffered, old), old_paths)
+        del buffered
+        _partition(new, new_paths)
+
+        for old_partition, new_partition in zip(old_paths, new_paths):
+            table = _table(_read_run(old_partition), old_path)
+            yield from _hash_diff(
+                table, _read_run(new_partition), field_names, new_path
+            )
+
+
+def write_changes(
+    f: Any,
+    changes: Iterable[Change],
+    key: Union[str, Sequence[str]],
+    dialect: Union[str, Type[csv.Dialect]] = "excel",
+    **fmtparams: Any,
+) -> None:
+    """Writes the changes returned by `diff` to a CSV file, with a column for
+    each key field followed by the `change`, `field`, `old_value` and
+    `new_value` columns.
+
+    :param key: The key passed to `diff`
+    """
+    key_names = [key] if isinstance(key, str) else list(key)
+    composite = len(key_names) > 1
+
+    writer = csv.writer(f, dialect, **fmtparams)
+    writer.writerow(key_names + ["change", "field", "old_value", "new_value"])
+
+    for change in changes:
+        keys = list(change.key) if composite else [change.key]
+        writer.writerow(
+            keys + [change.change, change.field, change.old_value, change.new_value]
+        )
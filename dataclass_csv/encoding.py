@@ -0,0 +1,160 @@
+import codecs
+import csv
+import re
+
+from typing import Any, Iterator, List, Optional, Tuple
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+DEFAULT_FALLBACK_ENCODING = "cp1252"
+SNIFF_SAMPLE_SIZE = 64 * 1024
+
+# The UTF-32 BOMs must be checked before the UTF-16 ones, which are their
+# prefixes. The codecs used remove the BOM while decoding.
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_LINES = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+")
+
+
+def _detect_utf16(sample: bytes) -> Optional[str]:
+    # Most characters of a CSV file are ASCII, so in UTF-16 one byte out of
+    # two is zero, always at the same position. A few zero bytes, e.g. in a
+    # UTF-8 file, are not enough to decide it is UTF-16.
+    even_zeros = sample[0::2].count(0)
+    odd_zeros = sample[1::2].count(0)
+    zeros, other_zeros = max(even_zeros, odd_zeros), min(even_zeros, odd_zeros)
+
+    if zeros == 0 or zeros * 4 < len(sample) // 2 or other_zeros * 4 >= zeros:
+        return None
+
+    return "utf-16-be" if even_zeros > odd_zeros else "utf-16-le"
+
+
+def detect_encoding(
+    sample: bytes,
+    encoding: Optional[str] = None,
+    fallback_encoding: str = DEFAULT_FALLBACK_ENCODING,
+) -> str:
+    """Returns the encoding of a file based on its first bytes.
+
+    Files starting with a byte order mark are decoded with a codec that
+    removes it. Without one, UTF-16 is recognized when at least a quarter
+    of its characters have a zero byte, then UTF-8 is tried, and
+    `fallback_encoding` is used when the sample is not valid UTF-8.
+
+    :param encoding: The expected encoding. It is returned as is, unless it
+    is UTF-8 and the sample starts with the UTF-8 BOM
+    """
+    if encoding is not None:
+        is_utf8 = codecs.lookup(encoding).name == "utf-8"
+        return (
+            "utf-8-sig" if is_utf8 and sample.startswith(codecs.BOM_UTF8) else encoding
+        )
+
+    for bom, name in _BOMS:
+        if sample.startswith(bom):
+            return name
+
+    utf16 = _detect_utf16(sample)
+    if utf16 is not None:
+        return utf16
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return fallback_encoding
+
+    return "utf-8"
+
+
+def sniff_dialect(sample: str, default: Any = "excel") -> Any:
+    """Returns the dialect detected by `csv.Sniffer` in the complete lines
+    of `sample`, or `default` when it cannot be detected."""
+    sample = sample[:SNIFF_SAMPLE_SIZE]
+    end = max(sample.rfind("\n"), sample.rfind("\r"))
+
+    try:
+        return csv.Sniffer().sniff(sample[: end + 1] if end > 0 else sample)
+    except csv.Error:
+        return default
+
+
+class DecodedLines:
+    """Iterates over the lines of a binary file, keeping the line endings as
+    a file opened with `newline=''` does.
+
+    The file is read in blocks of `block_size` bytes and decoded with an
+    incremental decoder, so characters split between blocks are handled,
+    and each block is split in lines with a single regular expression.
+    """
+
+    def __init__(
+        self,
+        f: Any,
+        encoding: str,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        first_block: bytes = b"",
+    ):
+        if block_size < 1:
+            raise ValueError("block_size must be greater than zero.")
+
+        self._f = f
+        self._block_size = block_size
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._lines: List[str] = []
+        self._position = 0
+        self._eof = False
+
+        self.head = self._decoder.decode(first_block)
+        self._pending = self.head
+
+    def _read_block(self) -> None:
+        block = self._f.read(self._block_size)
+        self._eof = not block
+
+        text = self._pending + self._decoder.decode(block, final=self._eof)
+
+        if self._eof:
+            cut = len(text)
+        else:
+            # A `\r` at the end of the block may be followed by `\n` in the
+            # next one, so the line is kept for the next block.
+            limit = len(text) - 1 if text.endswith("\r") else len(text)
+            cut = max(text.rfind("\n", 0, limit), text.rfind("\r", 0, limit)) + 1
+
+        self._lines = _LINES.findall(text, 0, cut)
+        self._pending = text[cut:]
+        self._position = 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        while self._position == len(self._lines):
+            if self._eof:
+                raise StopIteration
+            self._read_block()
+
+        line = self._lines[self._position]
+        self._position += 1
+        return line
+
+
+def open_lines(
+    f: Any,
+    encoding: Optional[str] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    fallback_encoding: str = DEFAULT_FALLBACK_ENCODING,
+) -> Tuple[DecodedLines, str]:
+    """Detects the encoding of the binary file `f` from its first block and
+    returns its decoded lines and the encoding used."""
+    # At least the longest BOM is needed to detect the encoding.
+    first_block = f.read(max(block_size, 4))
+    encoding = detect_encoding(first_block, encoding, fallback_encoding)
+
+    return DecodedLines(f, encoding, block_size, first_block), encoding
@@ -1,12 +1,28 @@
-from typing import Any
+from typing import Any, Optional
 
 
 class CsvValueError(Exception):
     """Error when a value in the CSV file cannot be parsed."""
 
-    def __init__(self, error: Any, line_number: int):
+    def __init__(self, error: Any, line_number: Optional[int]):
+        # Both values are passed on, so the error can be pickled, e.g. to
+        # be raised in the parent process of a worker.
+        super().__init__(error, line_number)
         self.error: Any = error
-        self.line_number: int = line_number
+        self.line_number: Optional[int] = line_number
 
     def __str__(self):
+        if self.line_number is None:
+            return str(self.error)
         return f"{self.error} [CSV Line number: {self.line_number}]"
+
+
+class SchemaMismatchError(ValueError):
+    """Error when the header of the CSV file does not match the dataclass."""
+
+    def __init__(self, message: str, diff: Any):
+        super().__init__(message)
+        self.diff: Any = diff
+
+    def __reduce__(self):
+        return type(self), (self.args[0], self.diff), self.__dict__
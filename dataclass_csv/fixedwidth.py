@@ -0,0 +1,278 @@
+import dataclasses
+import enum
+import itertools
+import operator
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .converter import RecordConverter
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 1000
+
+_NUMBER_TYPES = (int, float, Decimal)
+
+
+def _layout_fields(klass: Type[Any]) -> List[dataclasses.Field]:
+    """Returns the fields that have a column in the file: the fields set by
+    `__init__`, and the other fields with a `width` or `slice` metadata."""
+    return [
+        x
+        for x in dataclasses.fields(klass)
+        if x.init or "width" in x.metadata or "slice" in x.metadata
+    ]
+
+
+def _is_number(field_type: Any) -> bool:
+    """Whether the values of a field are aligned to the right."""
+    return (
+        isinstance(field_type, type)
+        and issubclass(field_type, _NUMBER_TYPES)
+        and not issubclass(field_type, bool)
+    )
+
+
+def _get_layout(
+    klass: Type[Any], fields: List[dataclasses.Field]
+) -> List[Tuple[int, int]]:
+    """Returns the `(start, end)` offsets of each field, from the `slice`
+    metadata, or from the `width` metadata starting where the previous
+    field ends."""
+    layout = []
+    position = 0
+
+    for field in fields:
+        if "slice" in field.metadata:
+            start, end = field.metadata["slice"]
+        elif "width" in field.metadata:
+            start, end = position, position + field.metadata["width"]
+        else:
+            raise ValueError(
+                f"The field `{field.name}` of {klass.__name__} needs a `width` "
+                "or `slice` metadata to be read from a fixed-width file."
+            )
+
+        if (
+            not isinstance(start, int)
+            or not isinstance(end, int)
+            or not 0 <= start < end
+        ):
+            raise ValueError(f"The field `{field.name}` has an invalid width or slice.")
+
+        layout.append((start, end))
+        position = end
+
+    return layout
+
+
+class FixedWidthDataclassReader(Generic[T]):
+    """Reads a fixed-width text file into dataclass instances.
+
+    The columns are defined by the metadata of the fields:
+    `field(metadata={'width': 10})` takes the next 10 characters after the
+    previous field, and `field(metadata={'slice': (20, 30)})` the characters
+    from 20 to 30 of the line. The columns of every line are extracted in a
+    single step, stripped of the `fillchar` padding, and converted by a
+    `RecordConverter`, with the same rules as `DataclassReader`. The padding
+    is only stripped on the side where `FixedWidthDataclassWriter` adds it:
+    on the left of numbers and on the right of the other values. A column
+    that only has padding is an empty value.
+
+    Usage:
+        >>> @dataclass
+        >>> class Account:
+        >>>     id: int = field(metadata={'width': 8})
+        >>>     name: str = field(metadata={'width': 30})
+        >>>     opened: date = field(metadata={'width': 8, 'dateformat': '%Y%m%d'})
+
+        >>> with open('accounts.txt') as f:
+        >>>     accounts = list(FixedWidthDataclassReader(f, Account))
+
+    :param skip_lines: The number of lines to skip at the start of the file,
+    such as headers
+    """
+
+    def __init__(
+        self,
+        f: Iterable[str],
+        klass: Type[T],
+        fillchar: str = " ",
+        skip_lines: int = 0,
+    ):
+        if not f:
+            raise ValueError("The f argument is required.")
+
+        self._converter: RecordConverter[T] = RecordConverter(klass, positional=True)
+
+        # The layout is computed over the same fields as the writer, so the
+        # columns of fields that are not set by `__init__` are skipped.
+        layout_fields = _layout_fields(klass)
+        layout = dict(
+            zip((x.name for x in layout_fields), _get_layout(klass, layout_fields))
+        )
+
+        fields = self._converter._init_fields
+        slices = [slice(*layout[x.name]) for x in fields]
+        self._strips: List[Callable[[str, str], str]] = [
+            (
+                str.lstrip
+                if _is_number(self._converter._get_field_type(x))
+                else str.rstrip
+            )
+            for x in fields
+        ]
+
+        # The values are matched to the fields by their order in the layout.
+        self._converter._positions = {x.name: i for i, x in enumerate(fields)}
+
+        # `itemgetter` returns a tuple only with two items or more, so an
+        # empty slice is added, and dropped by the `zip` with `self._strips`.
+        self._extract: Callable[[str], Any] = operator.itemgetter(*slices, slice(0, 0))
+        self._fillchar = fillchar
+        self._lines = itertools.islice(enumerate(f, 1), skip_lines, None)
+        self.line_num = skip_lines
+        self._records = self._read_records()
+
+    def _read_records(self) -> Iterator[T]:
+        convert = self._converter.convert
+        extract = self._extract
+        strips = self._strips
+        fillchar = self._fillchar
+
+        for line_number, line in self._lines:
+            self.line_num = line_number
+            line = line.rstrip("\r\n")
+
+            if not line.strip():
+                continue
+
+            values = [strip(x, fillchar) for strip, x in zip(strips, extract(line))]
+            yield convert(values, line_number)
+
+    def __next__(self) -> T:
+        return next(self._records)
+
+    def __iter__(self):
+        return self
+
+
+def _get_formatter(
+    field: dataclasses.Field, width: int, fillchar: str, dateformat: Any
+) -> Callable[[Any], str]:
+    dateformat = field.metadata.get("dateformat", dateformat)
+
+    def format_value(value: Any) -> str:
+        if value is None:
+            return fillchar * width
+
+        if isinstance(value, (date, datetime)) and dateformat:
+            text = value.strftime(dateformat)
+        elif isinstance(value, enum.Enum):
+            text = str(value.value)
+        else:
+            text = str(value)
+
+        if isinstance(value, _NUMBER_TYPES) and not isinstance(value, bool):
+            return text[:width].rjust(width, fillchar)
+
+        return text[:width].ljust(width, fillchar)
+
+    return format_value
+
+
+class FixedWidthDataclassWriter(Generic[T]):
+    """Writes dataclass instances to a fixed-width text file, with the
+    layout defined by the `width` and `slice` metadata of the fields, like
+    `FixedWidthDataclassReader`.
+
+    Each value is truncated to the width of its column, and padded with
+    `fillchar`: numbers are aligned to the right and the other values to the
+    left. Dates are written with the `dateformat` of the field. Fields
+    without a layout and that are not set by `__init__` are not written.
+
+    Usage:
+        >>> with open('accounts.txt', 'w') as f:
+        >>>     FixedWidthDataclassWriter(f, accounts, Account).write()
+    """
+
+    def __init__(
+        self,
+        f: Any,
+        data: Iterable[T],
+        klass: Type[T],
+        fillchar: str = " ",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if not f:
+            raise ValueError("The f argument is required")
+
+        if not dataclasses.is_dataclass(klass):
+            raise ValueError("Invalid 'klass' argument. It must be a dataclass")
+
+        if len(fillchar) != 1:
+            raise ValueError("fillchar must be a single character.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+
+        fields = _layout_fields(klass)
+        layout = sorted(zip(_get_layout(klass, fields), fields), key=lambda x: x[0][0])
+        dateformat = getattr(klass, "__dateformat__", None)
+
+        # The gaps between the columns are filled, so each column can be
+        # formatted separately and the line joined at once.
+        self._columns: List[Tuple[str, str, Callable[[Any], str]]] = []
+        position = 0
+
+        for (start, end), field in layout:
+            if start < position:
+                raise ValueError(f"The column of the field `{field.name}` overlaps.")
+
+            formatter = _get_formatter(field, end - start, fillchar, dateformat)
+            self._columns.append((field.name, fillchar * (start - position), formatter))
+            position = end
+
+        self._f = f
+        self._data = data
+        self._cls = klass
+        self._batch_size = batch_size
+
+    def _format(self, item: T) -> str:
+        if not isinstance(item, self._cls):
+            raise TypeError(
+                (
+                    f"The item [{item}] is not an instance of "
+                    f"{self._cls.__name__}. All items on the list must be "
+                    "instances of the same type"
+                )
+            )
+
+        return (
+            "".join(
+                gap + format_value(getattr(item, name))
+                for name, gap, format_value in self._columns
+            )
+            + "\n"
+        )
+
+    def write(self) -> None:
+        data = iter(self._data)
+
+        while True:
+            batch = [self._format(x) for x in itertools.islice(data, self._batch_size)]
+            if not batch:
+                return
+            self._f.write("".join(batch))
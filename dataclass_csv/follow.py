@@ -0,0 +1,347 @@
+import collections
+import csv
+import os
+import select
+import sys
+import time
+
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .dataclass_reader import DataclassReader
+
+T = TypeVar("T")
+
+DEFAULT_POLL_INTERVAL = 1.0
+BLOCK_SIZE = 1024 * 1024
+
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_EVENTS = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_DELETE_SELF | _IN_MOVE_SELF
+
+
+class _PollWaiter:
+    def watch(self, path: str) -> None:
+        pass
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(timeout)
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyWaiter:
+    """Wakes up as soon as the file is modified, moved or deleted, instead
+    of sleeping for the whole poll interval."""
+
+    def __init__(self, path: str):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._libc = libc
+        self._fd = fd
+        self._watch = -1
+        self.watch(path)
+
+    def watch(self, path: str) -> None:
+        if self._watch >= 0:
+            self._libc.inotify_rm_watch(self._fd, self._watch)
+
+        # When the file cannot be watched, `wait` still times out.
+        self._watch = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(path), _IN_EVENTS
+        )
+
+    def wait(self, timeout: float) -> None:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+
+        if readable:
+            try:
+                os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _get_waiter(path: str) -> Any:
+    if sys.platform.startswith("linux"):
+        try:
+            return _InotifyWaiter(path)
+        except (OSError, AttributeError):
+            pass
+
+    return _PollWaiter()
+
+
+class _Tail:
+    """Iterates over the complete records appended to a file.
+
+    Lines are only handed out when they complete a record: a trailing line
+    without a newline, or a quoted field that continues in a line that was
+    not written yet, are kept until the rest arrives. When there are no
+    complete records left the iteration stops, and it can be resumed after
+    more data is appended.
+
+    When the file is truncated, or replaced by a new file (rotation), the
+    reading starts again from the beginning of the file, skipping its
+    header when `skip_header` is set and the header of the previous file
+    was already handed out.
+    """
+
+    def __init__(self, path: str, encoding: str, quotechar: str, skip_header: bool):
+        self._path = path
+        self._encoding = encoding
+        self._quote = quotechar.encode(encoding) if quotechar else b""
+        self._skip_header = skip_header
+        self._f = open(path, "rb")
+        self._lines: Deque[str] = collections.deque()
+        self._record: List[bytes] = []
+        self._quotes = 0
+        self._partial = b""
+        self._drop_next_record = False
+        self._has_header = False
+        self.reopened = False
+
+    def _add_line(self, line: bytes) -> None:
+        self._record.append(line)
+        if self._quote:
+            self._quotes += line.count(self._quote)
+
+        if self._quotes % 2:
+            return
+
+        if self._drop_next_record:
+            self._drop_next_record = False
+        else:
+            self._lines.extend(x.decode(self._encoding) for x in self._record)
+            self._has_header = True
+
+        self._record = []
+        self._quotes = 0
+
+    def _restart(self, f: Any) -> None:
+        if f is not self._f:
+            self._f.close()
+            self._f = f
+        self._record, self._quotes, self._partial = [], 0, b""
+        # A file that was empty until now has not given a header to the
+        # reader yet, so the header of the new file is kept.
+        self._drop_next_record = self._skip_header and self._has_header
+        self.reopened = True
+
+    def _check_file(self) -> bool:
+        """Returns `True` when the file was truncated or rotated."""
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return False
+
+        current = os.fstat(self._f.fileno())
+
+        if (stat.st_ino, stat.st_dev) != (current.st_ino, current.st_dev):
+            try:
+                f = open(self._path, "rb")
+            except FileNotFoundError:
+                return False
+            self._restart(f)
+            return True
+
+        if current.st_size < self._f.tell():
+            self._f.seek(0)
+            self._restart(self._f)
+            return True
+
+        return False
+
+    def _fill(self) -> bool:
+        block = self._f.read(BLOCK_SIZE)
+
+        if not block:
+            return self._check_file()
+
+        lines = (self._partial + block).split(b"\n")
+        self._partial = lines.pop()
+
+        for line in lines:
+            self._add_line(line + b"\n")
+
+        return True
+
+    def has_records(self) -> bool:
+        while not self._lines:
+            if not self._fill():
+                return False
+        return True
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.has_records():
+            raise StopIteration
+        return self._lines.popleft()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class _Follower:
+    def __init__(
+        self,
+        path: str,
+        klass: Type[Any],
+        encoding: str,
+        dialect: Any,
+        kwds: Any,
+    ):
+        if isinstance(dialect, str):
+            quotechar = csv.get_dialect(dialect).quotechar
+        else:
+            quotechar = dialect.quotechar
+        quotechar = kwds.get("quotechar", quotechar)
+        has_header = not kwds.get("positional") and kwds.get("fieldnames") is None
+
+        self._path = path
+        self._klass = klass
+        self._dialect = dialect
+        self._kwds = kwds
+        self._tail = _Tail(path, encoding, quotechar or "", has_header)
+        self._waiter = _get_waiter(path)
+        self._reader: Optional[DataclassReader[Any]] = None
+
+    def records(self) -> Iterator[Any]:
+        """Returns an iterator over the records available now."""
+        if self._reader is None:
+            if not self._tail.has_records():
+                return iter(())
+            self._reader = DataclassReader(
+                self._tail, self._klass, dialect=self._dialect, **self._kwds
+            )
+
+        return self._reader
+
+    def wait(self, timeout: float) -> None:
+        if self._tail.reopened:
+            self._tail.reopened = False
+            self._waiter.watch(self._path)
+
+        self._waiter.wait(timeout)
+
+    def close(self) -> None:
+        self._tail.close()
+        self._waiter.close()
+
+
+def follow(
+    path: str,
+    klass: Type[T],
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    timeout: Optional[float] = None,
+    encoding: str = "utf-8",
+    dialect: Union[str, Type[csv.Dialect]] = "excel",
+    **kwds: Any,
+) -> Iterator[T]:
+    """Reads a CSV file that is being appended to, yielding the records
+    already in the file and then each new record as soon as it is complete.
+
+    The file is kept open and only the new data is read, so each record is
+    converted once. Incomplete trailing lines are not yielded until they
+    are completed. When the file is truncated or replaced by a new file
+    (e.g. by log rotation) the new content is read from the start, skipping
+    its header. On Linux, inotify is used to wake up as soon as the file
+    changes; elsewhere the file is checked every `poll_interval` seconds.
+
+    Only encodings where the newline is the single byte `\\n`, such as UTF-8,
+    are supported. The keyword arguments are passed to `DataclassReader`.
+
+    Usage:
+        >>> from dataclass_csv.follow import follow
+
+        >>> for event in follow('events.csv', Event):
+        >>>     handle(event)
+
+    :param timeout: Stop when no new record is appended during this many
+    seconds. By default the file is followed forever
+    """
+    follower = _Follower(path, klass, encoding, dialect, kwds)
+
+    try:
+        last_record = time.monotonic()
+
+        while True:
+            for item in follower.records():
+                yield item
+                last_record = time.monotonic()
+
+            idle = time.monotonic() - last_record
+            if timeout is not None and idle >= timeout:
+                return
+
+            wait = (
+                poll_interval if timeout is None else min(poll_interval, timeout - idle)
+            )
+            follower.wait(wait)
+    finally:
+        follower.close()
+
+
+async def afollow(
+    path: str,
+    klass: Type[T],
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    timeout: Optional[float] = None,
+    encoding: str = "utf-8",
+    dialect: Union[str, Type[csv.Dialect]] = "excel",
+    **kwds: Any,
+) -> AsyncIterator[T]:
+    """The async version of `follow`. Waiting for changes in the file does
+    not block the event loop.
+
+    Usage:
+        >>> async for event in afollow('events.csv', Event):
+        >>>     await handle(event)
+    """
+    import asyncio
+
+    follower = _Follower(path, klass, encoding, dialect, kwds)
+    loop = asyncio.get_running_loop()
+
+    try:
+        last_record = time.monotonic()
+
+        while True:
+            for item in follower.records():
+                yield item
+                last_record = time.monotonic()
+
+            idle = time.monotonic() - last_record
+            if timeout is not None and idle >= timeout:
+                return
+
+            wait = (
+                poll_interval if timeout is None else min(poll_interval, timeout - idle)
+            )
+            await loop.run_in_executor(None, follower.wait, wait)
+    finally:
+        follower.close()
@@ -0,0 +1,275 @@
+import bisect
+import enum
+import json
+import os
+
+from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar, cast
+
+from .converter import RecordConverter
+from .dataclass_reader import DataclassReader
+from .exceptions import CsvValueError
+from .schema import schema_fingerprint
+
+T = TypeVar("T")
+
+INDEX_VERSION = 3
+INDEX_SUFFIX = ".idx"
+
+# Keys of these types are stored as JSON values, the others as the text of
+# the CSV file, converted again when the index is loaded.
+_JSON_KEY_TYPES = (str, int, float, bool)
+
+
+class _OffsetLines:
+    """Iterates over the lines of a binary file, keeping track of the byte
+    offset where the current CSV record started.
+
+    `csv.reader` requests one line at a time, so after a record is parsed
+    `record_start` holds the offset of its first line. Only encodings where
+    the newline is the single byte `\\n` (ASCII-compatible encodings such as
+    UTF-8 and cp1252) are supported.
+    """
+
+    def __init__(self, f: Any, encoding: str):
+        self._f = f
+        self._encoding = encoding
+        self.record_start: Optional[int] = None
+
+    def seek(self, offset: int) -> None:
+        self._f.seek(offset)
+        self.record_start = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        offset = self._f.tell()
+        line = self._f.readline()
+
+        if not line:
+            raise StopIteration
+
+        if self.record_start is None:
+            self.record_start = offset
+
+        return line.decode(self._encoding)
+
+
+def _file_signature(path: str) -> Dict[str, int]:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _order(value: Any) -> Any:
+    """Returns the value used to sort and look up a key. Enums are ordered
+    by their values, since they cannot be compared."""
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _index_header(path: str, klass: Type[Any], key: str) -> Dict[str, Any]:
+    return {
+        "version": INDEX_VERSION,
+        "key": key,
+        "schema": schema_fingerprint(klass),
+        **_file_signature(path),
+    }
+
+
+def build_index(
+    path: str,
+    klass: Type[T],
+    key: str = "id",
+    index_path: Optional[str] = None,
+    encoding: str = "utf-8",
+    **kwds: Any,
+) -> str:
+    """Creates a sidecar index file mapping the converted values of the
+    `key` field to the byte offset of their record in the CSV file.
+
+    The index is a JSON file. It stores the size and modification time of
+    the CSV file and a fingerprint of `klass`, and is considered stale when
+    any of them changes. Records whose key is empty are not indexed.
+
+    :param index_path: Where to write the index, by default the path of the
+    CSV file followed by `.idx`
+    :return: The path of the index file
+    """
+    index_path = index_path or path + INDEX_SUFFIX
+    header = _index_header(path, klass, key)
+
+    entries = []
+
+    with open(path, "rb") as f:
+        lines = _OffsetLines(f, encoding)
+        reader = DataclassReader(lines, klass, **kwds)
+        fields = {x.name: x for x in reader._init_fields}
+
+        if key not in fields:
+            raise ValueError(f"{klass.__name__} does not have a `{key}` field.")
+
+        field = fields[key]
+        store_values = reader._get_field_type(field) in _JSON_KEY_TYPES
+
+        while True:
+            lines.record_start = None
+            try:
+                row = next(reader._reader)
+            except StopIteration:
+                break
+
+            line_number = reader._reader.line_num
+            value = reader._parse_field(row, field, line_number)
+
+            if value is not None:
+                stored = value if store_values else reader._get_value(row, field)
+                if not isinstance(stored, str) and not store_values:
+                    # The default value of the field, for an empty column.
+                    stored = None
+                start = cast(int, lines.record_start)
+                entries.append((_order(value), stored, start, line_number))
+
+    entries.sort(key=lambda x: x[0])
+
+    index = {
+        **header,
+        "fieldnames": getattr(reader._reader, "fieldnames", None),
+        "values": store_values,
+        "keys": [x[1] for x in entries],
+        "offsets": [x[2] for x in entries],
+        "line_numbers": [x[3] for x in entries],
+    }
+
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    return index_path
+
+
+def _load_index(
+    path: str, index_path: str, klass: Type[Any], key: str
+) -> Optional[Dict[str, Any]]:
+    """Returns the index of `path`, or `None` when the index file is missing,
+    stale or invalid, so it is created again."""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+
+        header = _index_header(path, klass, key)
+        if not isinstance(index, dict) or any(
+            index.get(k) != v for k, v in header.items()
+        ):
+            return None
+
+        keys: List[Any] = index["keys"]
+        if not index["values"]:
+            # The keys are the text of the file, converted like the reader
+            # does. `None` stands for the default value of the field.
+            converter = RecordConverter(klass)
+            field = {x.name: x for x in converter._init_fields}[key]
+            convert = converter._converters[key]
+            default = converter._get_default_value
+            keys = [convert(x) if x is not None else default(field) for x in keys]
+
+        index["keys"] = [_order(x) for x in keys]
+
+        lengths = {len(index[x]) for x in ("keys", "offsets", "line_numbers")}
+        if len(lengths) != 1:
+            return None
+    except (OSError, ValueError, TypeError, KeyError, CsvValueError):
+        return None
+
+    return index
+
+
+class IndexedDataclassReader(Generic[T]):
+    """Reads single records, or ranges of records, of a CSV file by the value
+    of a key field, using the index created by `build_index`.
+
+    The index is created, or recreated when the CSV file has changed, when
+    the reader is opened. Only the matching records are parsed, and they are
+    converted exactly like `DataclassReader` would do, including the line
+    numbers reported in errors.
+
+    Usage:
+        >>> from dataclass_csv import IndexedDataclassReader
+
+        >>> with IndexedDataclassReader('users.csv', User, key='id') as users:
+        >>>     user = users.get(42)
+        >>>     teens = list(users.range(13, 20))
+    """
+
+    def __init__(
+        self,
+        path: str,
+        klass: Type[T],
+        key: str = "id",
+        index_path: Optional[str] = None,
+        encoding: str = "utf-8",
+        **kwds: Any,
+    ):
+        index_path = index_path or path + INDEX_SUFFIX
+
+        self._cls = klass
+        self._file = open(path, "rb")
+        self._lines = _OffsetLines(self._file, encoding)
+
+        try:
+            index = _load_index(path, index_path, klass, key)
+
+            if index is None:
+                build_index(path, klass, key, index_path, encoding, **kwds)
+                index = cast(Dict[str, Any], _load_index(path, index_path, klass, key))
+
+            if index["fieldnames"] is not None:
+                kwds["fieldnames"] = index["fieldnames"]
+            self._reader = DataclassReader(self._lines, klass, **kwds)
+        except BaseException:
+            self._file.close()
+            raise
+
+        self._keys: List[Any] = index["keys"]
+        self._offsets: List[int] = index["offsets"]
+        self._line_numbers: List[int] = index["line_numbers"]
+
+    def _read_at(self, position: int) -> T:
+        self._lines.seek(self._offsets[position])
+        row = next(self._reader._reader)
+        values = self._reader._parse_row(row, self._line_numbers[position])
+        return self._cls(**values)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        key = _order(key)
+        position = bisect.bisect_left(self._keys, key)
+        return position < len(self._keys) and self._keys[position] == key
+
+    def get(self, key: Any) -> T:
+        """Returns the first record with the given key.
+
+        :raises KeyError: When there is no record with the key
+        """
+        position = bisect.bisect_left(self._keys, _order(key))
+
+        if position == len(self._keys) or self._keys[position] != _order(key):
+            raise KeyError(key)
+
+        return self._read_at(position)
+
+    def range(self, lo: Any, hi: Any) -> Iterator[T]:
+        """Yields the records with `lo <= key < hi`, ordered by key."""
+        start = bisect.bisect_left(self._keys, _order(lo))
+        stop = bisect.bisect_left(self._keys, _order(hi))
+
+        for position in range(start, stop):
+            yield self._read_at(position)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
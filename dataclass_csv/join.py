@@ -0,0 +1,177 @@
+import itertools
+import tempfile
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .sorting import DEFAULT_BUFFER_SIZE, _get_key_func, _merge_runs, _sorted_runs
+
+L = TypeVar("L")
+R = TypeVar("R")
+
+_MISSING = object()
+
+
+def _null_first_key(key: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    # Records without a key never match, sorting them first keeps `None`
+    # from being compared with the other keys.
+    def func(item):
+        value = key(item)
+        return (value is not None, value)
+
+    return func
+
+
+def _hash_join(
+    left: Iterable[L],
+    table: Dict[Any, List[R]],
+    left_key: Callable[[Any], Any],
+    how: str,
+) -> Iterator[Tuple[L, Optional[R]]]:
+    for left_item in left:
+        matches = table.get(left_key(left_item))
+
+        if matches:
+            for right_item in matches:
+                yield left_item, right_item
+        elif how == "left":
+            yield left_item, None
+
+
+def _merge_join(
+    left: Iterator[L],
+    right: Iterator[R],
+    left_key: Callable[[Any], Any],
+    right_key: Callable[[Any], Any],
+    how: str,
+) -> Iterator[Tuple[L, Optional[R]]]:
+    groups = itertools.groupby(right, key=right_key)
+    group_key, group = next(groups, (_MISSING, None))
+    matches: List[R] = []
+    matches_key: Any = _MISSING
+
+    for left_item in left:
+        key = left_key(left_item)
+
+        if key[0] and key != matches_key:
+            while group_key is not _MISSING and group_key < key:
+                group_key, group = next(groups, (_MISSING, None))
+
+            if group_key == key:
+                matches, matches_key = list(group), key  # type: ignore
+                group_key, group = next(groups, (_MISSING, None))
+            else:
+                matches, matches_key = [], key
+
+        if key[0] and matches:
+            for right_item in matches:
+                yield left_item, right_item
+        elif how == "left":
+            yield left_item, None
+
+
+def join(
+    left: Iterable[L],
+    right: Iterable[R],
+    on: Union[str, Tuple[str, str]],
+    how: str = "inner",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    tmpdir: Optional[str] = None,
+) -> Iterator[Tuple[L, Optional[R]]]:
+    """Joins two sequences of dataclass instances, e.g. two `DataclassReader`,
+    by a typed key and yields `(left, right)` pairs.
+
+    When the right side has at most `buffer_size` records it is loaded in a
+    hash table and the left side is streamed, keeping its order. Otherwise
+    both sides are sorted by the key, spilling sorted runs to temporary
+    files, and merged; the pairs are then produced in key order.
+
+    Keys are compared using the converted values, so `int` or `date` keys
+    match regardless of how they are formatted in each file. Records whose
+    key is `None` never match.
+
+    Usage:
+        >>> from dataclass_csv import DataclassReader, join
+
+        >>> with open('transactions.csv') as t, open('customers.csv') as c:
+        >>>     pairs = join(
+        >>>         DataclassReader(t, Transaction),
+        >>>         DataclassReader(c, Customer),
+        >>>         on=('customer_id', 'id'),
+        >>>         how='left',
+        >>>     )
+        >>>     for transaction, customer in pairs:
+        >>>         ...
+
+    :param on: The field used as key in both sides, or a tuple with the
+    names of the left and right fields
+    :param how: `inner` or `left`. With `left`, left records without a
+    match are yielded with `None` as the right record
+    :param buffer_size: Maximum number of records of each side held in memory
+    :param tmpdir: Directory for the temporary files
+    """
+    if how not in ("inner", "left"):
+        raise ValueError("The how argument must be 'inner' or 'left'.")
+
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be greater than zero.")
+
+    left_on, right_on = (on, on) if isinstance(on, str) else on
+    left_key, right_key = _get_key_func(left_on), _get_key_func(right_on)
+
+    return _join(left, right, left_key, right_key, how, buffer_size, tmpdir)
+
+
+def _join(
+    left: Iterable[L],
+    right: Iterable[R],
+    left_key: Callable[[Any], Any],
+    right_key: Callable[[Any], Any],
+    how: str,
+    buffer_size: int,
+    tmpdir: Optional[str],
+) -> Iterator[Tuple[L, Optional[R]]]:
+    right_items = iter(right)
+    buffered = list(itertools.islice(right_items, buffer_size + 1))
+
+    if len(buffered) <= buffer_size:
+        table: Dict[Any, List[Any]] = {}
+        for item in buffered:
+            key = right_key(item)
+            if key is not None:
+                table.setdefault(key, []).append(item)
+
+        yield from _hash_join(left, table, left_key, how)
+        return
+
+    left_key, right_key = _null_first_key(left_key), _null_first_key(right_key)
+
+    with tempfile.TemporaryDirectory(dir=tmpdir) as directory:
+        right_runs = _sorted_runs(
+            itertools.chain(buffered, right_items),
+            right_key,
+            directory,
+            buffer_size=buffer_size,
+        )
+        del buffered
+
+        left_runs = _sorted_runs(left, left_key, directory, buffer_size=buffer_size)
+
+        left_sorted = _merge_runs(left_runs, left_key)
+        right_sorted = _merge_runs(right_runs, right_key)
+
+        try:
+            yield from _merge_join(left_sorted, right_sorted, left_key, right_key, how)
+        finally:
+            left_sorted.close()
+            right_sorted.close()
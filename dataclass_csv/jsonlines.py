@@ -0,0 +1,211 @@
+import dataclasses
+import enum
+import itertools
+import json
+
+from datetime import date, datetime, time
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .converter import RecordConverter
+from .exceptions import CsvValueError
+from .field_mapper import FieldMapper
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 1000
+
+_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+class JsonLinesDataclassReader(Generic[T]):
+    """Reads a JSON Lines file, where each line is a JSON object, into
+    dataclass instances.
+
+    The values are converted and validated by a `RecordConverter`, with the
+    same rules as `DataclassReader`, so strings such as `"42"` or dates in
+    the `dateformat` of the field are accepted as well as JSON numbers and
+    booleans. The lines are read and decoded in batches of `batch_size`,
+    and each line must hold a single JSON value.
+
+    Usage:
+        >>> from dataclass_csv import JsonLinesDataclassReader
+
+        >>> with open('users.jsonl') as f:
+        >>>     users = list(JsonLinesDataclassReader(f, User))
+
+    :param positional: Read lines that are JSON arrays of values instead of
+    objects
+    """
+
+    def __init__(
+        self,
+        f: Iterable[str],
+        klass: Type[T],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        positional: bool = False,
+    ):
+        if not f:
+            raise ValueError("The f argument is required.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+
+        self._converter: RecordConverter[T] = RecordConverter(klass, positional)
+        self._row_type: type = list if positional else dict
+        self._row_name = "array" if positional else "object"
+        self._lines = enumerate(f, 1)
+        self._batch_size = batch_size
+        self._decoder = json.JSONDecoder()
+        self._records = self._read_records()
+        self.line_num = 0
+
+    def _decode(self, lines: List[Tuple[int, str]]) -> List[Any]:
+        # Each line is decoded on its own, so a value split over several
+        # lines, or several values on one line, is an error even when the
+        # number of values matches the number of lines.
+        decode = self._decoder.decode
+
+        try:
+            return list(map(decode, [x for _, x in lines]))
+        except ValueError:
+            pass
+
+        # Decode the lines one by one to find the line with the error.
+        rows = []
+        for line_number, line in lines:
+            try:
+                rows.append(decode(line))
+            except ValueError as ex:
+                raise CsvValueError(ex, line_number=line_number)
+        return rows
+
+    def _rows(self) -> Iterator[Tuple[int, Any]]:
+        while True:
+            batch = list(itertools.islice(self._lines, self._batch_size))
+            if not batch:
+                return
+
+            lines = [(i, x) for i, x in batch if x.strip()]
+            for (line_number, _), row in zip(lines, self._decode(lines)):
+                if type(row) is not self._row_type:
+                    error = ValueError(f"The line is not a JSON {self._row_name}.")
+                    raise CsvValueError(error, line_number=line_number)
+                yield line_number, row
+
+    def _read_records(self) -> Iterator[T]:
+        convert = self._converter.convert
+
+        for line_number, row in self._rows():
+            self.line_num = line_number
+            yield convert(row, line_number)
+
+    def __next__(self) -> T:
+        return next(self._records)
+
+    def __iter__(self):
+        return self
+
+    def map(self, json_key: str) -> FieldMapper:
+        """Used to map a key of the JSON objects to a `dataclass` field
+        :param json_key: The key in the JSON objects
+        """
+        return self._converter.map(json_key)
+
+
+def _get_serializer(dateformat: Any) -> Callable[[Any], Any]:
+    def serialize(value: Any) -> Any:
+        if isinstance(value, _JSON_TYPES):
+            return value
+
+        if isinstance(value, (date, datetime)):
+            return value.strftime(dateformat) if dateformat else value.isoformat()
+
+        if isinstance(value, time):
+            return value.isoformat()
+
+        if isinstance(value, enum.Enum):
+            return value.value
+
+        return str(value)
+
+    return serialize
+
+
+class JsonLinesDataclassWriter(Generic[T]):
+    """Writes dataclass instances to a JSON Lines file, one JSON object per
+    line.
+
+    Dates are written with the `dateformat` of the field, like
+    `DataclassReader` expects them, or in ISO format when the field does not
+    have one. Enums are written as their values and the other types that
+    are not supported by JSON as strings. The lines are written in batches
+    of `batch_size`.
+
+    Usage:
+        >>> from dataclass_csv import JsonLinesDataclassWriter
+
+        >>> with open('users.jsonl', 'w') as f:
+        >>>     JsonLinesDataclassWriter(f, users, User).write()
+    """
+
+    def __init__(
+        self,
+        f: Any,
+        data: Iterable[T],
+        klass: Type[T],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if not f:
+            raise ValueError("The f argument is required")
+
+        if not dataclasses.is_dataclass(klass):
+            raise ValueError("Invalid 'klass' argument. It must be a dataclass")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+
+        self._f = f
+        self._data = data
+        self._cls = klass
+        self._batch_size = batch_size
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+        dateformat = getattr(klass, "__dateformat__", None)
+        self._fields = [
+            (x.name, _get_serializer(x.metadata.get("dateformat", dateformat)))
+            for x in dataclasses.fields(klass)
+        ]
+
+    def _encode(self, item: T) -> str:
+        if not isinstance(item, self._cls):
+            raise TypeError(
+                (
+                    f"The item [{item}] is not an instance of "
+                    f"{self._cls.__name__}. All items on the list must be "
+                    "instances of the same type"
+                )
+            )
+
+        values = {
+            name: serialize(getattr(item, name)) for name, serialize in self._fields
+        }
+        return self._encoder.encode(values) + "\n"
+
+    def write(self) -> None:
+        data = iter(self._data)
+
+        while True:
+            batch = [self._encode(x) for x in itertools.islice(data, self._batch_size)]
+            if not batch:
+                return
+            self._f.write("".join(batch))
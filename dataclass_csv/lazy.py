@@ -0,0 +1,139 @@
+import dataclasses
+import weakref
+
+from typing import Any, MutableMapping, Type
+
+from .exceptions import CsvValueError
+
+_STATE = "_dataclass_csv_lazy"
+
+_classes: MutableMapping[type, type] = weakref.WeakKeyDictionary()
+
+
+class _LazyField:
+    """Non-data descriptor that converts the raw value of a field the first
+    time it is accessed. The converted value is stored in the instance
+    `__dict__`, which takes precedence over this descriptor afterwards."""
+
+    def __init__(self, field: dataclasses.Field, default: Any):
+        self.field = field
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            if self.default is dataclasses.MISSING:
+                raise AttributeError(self.field.name)
+            return self.default
+
+        reader, row, line_number = instance.__dict__[_STATE]
+        value = reader._parse_field(row, self.field, line_number)
+        instance.__dict__[self.field.name] = value
+
+        return value
+
+
+def _init_values(self):
+    return {
+        field.name: getattr(self, field.name)
+        for field in dataclasses.fields(self)
+        if field.init
+    }
+
+
+def _materialize(self):
+    """Converts all the fields and returns an instance of the dataclass."""
+    return type(self).__mro__[1](**_init_values(self))
+
+
+def _eq(self, other):
+    if isinstance(self, LazyRow):
+        self = self.materialize()
+    if isinstance(other, LazyRow):
+        other = other.materialize()
+    return self == other
+
+
+def _restore(klass, values):
+    return klass(**values)
+
+
+def _reduce_ex(self, protocol):
+    return _restore, (type(self).__mro__[1], _init_values(self))
+
+
+class LazyRow:
+    """Marker base class of the proxies created by `DataclassReader` when
+    `lazy=True` is used."""
+
+    __slots__ = ()
+
+
+def lazy_class(klass: Type[Any]) -> Type[Any]:
+    """Returns a subclass of `klass` whose instances hold a raw CSV row and
+    convert each field on first access."""
+    cached = _classes.get(klass)
+    if cached is not None:
+        return cached
+
+    namespace = {
+        "__module__": klass.__module__,
+        "__qualname__": klass.__qualname__,
+        "__eq__": _eq,
+        "__hash__": klass.__hash__,
+        "__reduce_ex__": _reduce_ex,
+        "materialize": _materialize,
+        "_dataclass_csv_defaults": tuple(
+            (field.name, field.default, field.default_factory)
+            for field in dataclasses.fields(klass)
+            if not field.init
+            and (
+                field.default is not dataclasses.MISSING
+                or field.default_factory is not dataclasses.MISSING
+            )
+        ),
+    }
+
+    for field in dataclasses.fields(klass):
+        if field.init:
+            # The class attribute of a field is not its default with
+            # `slots=True`, so the default is taken from the field.
+            namespace[field.name] = _LazyField(field, field.default)
+
+    # Without `__slots__`, the subclass has a `__dict__` to cache the
+    # converted values, also when the dataclass uses `slots=True`.
+    cls = type(klass.__name__, (klass, LazyRow), namespace)
+    _classes[klass] = cls
+
+    return cls
+
+
+def _check_required(reader: Any, row: Any, line_number: int) -> None:
+    for field in reader._init_fields:
+        if field.name not in reader._optional_fields:
+            try:
+                reader._get_value(row, field)
+            except ValueError as ex:
+                raise CsvValueError(ex, line_number=line_number)
+
+
+def create_lazy_row(
+    cls: Any, reader: Any, row: Any, line_number: int, check_required: bool = False
+) -> Any:
+    if check_required:
+        _check_required(reader, row, line_number)
+
+    obj = cls.__new__(cls)
+    obj.__dict__[_STATE] = (reader, row, line_number)
+
+    for name, default, default_factory in cls._dataclass_csv_defaults:
+        if default_factory is not dataclasses.MISSING:
+            default = default_factory()
+        # Goes through the slot of the field when the dataclass has one.
+        object.__setattr__(obj, name, default)
+
+    # `__post_init__` runs as for the instances created by `__init__`, so
+    # the fields it uses are converted when the row is read.
+    if hasattr(cls, "__post_init__"):
+        obj.__post_init__()
+
+    return obj
@@ -0,0 +1,153 @@
+import dataclasses
+import hashlib
+import typing
+import weakref
+
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type
+
+# Class attributes set by the decorators, which change how the values are
+# converted.
+CLASS_OPTIONS = (
+    "__dateformat__",
+    "__accept_whitespaces__",
+    "__categorical__",
+    "__true_values__",
+    "__false_values__",
+    "__thousands__",
+    "__decimal__",
+)
+
+HEADER_CHECKS = ("missing", "extra", "strict")
+
+
+class ClassSchema:
+    """The fields and type hints of a dataclass, which are the same for
+    every reader and writer of the class."""
+
+    def __init__(self, klass: Type[Any]):
+        self.fields: Tuple[dataclasses.Field, ...] = dataclasses.fields(klass)
+        self.init_fields = [x for x in self.fields if x.init]
+        self.optional_fields: FrozenSet[str] = frozenset(
+            x.name
+            for x in self.fields
+            if not isinstance(x.default, dataclasses._MISSING_TYPE)
+            or not isinstance(x.default_factory, dataclasses._MISSING_TYPE)
+        )
+        self.type_hints: Dict[str, Any] = typing.get_type_hints(klass)
+
+
+# Keyed by weak references, so classes created at runtime can still be
+# garbage collected.
+_schemas: "weakref.WeakKeyDictionary[Type[Any], ClassSchema]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_schema(klass: Type[Any]) -> ClassSchema:
+    """Returns the schema of `klass`, which is computed once per process."""
+    schema = _schemas.get(klass)
+
+    if schema is None:
+        schema = _schemas[klass] = ClassSchema(klass)
+
+    return schema
+
+
+def schema_fingerprint(klass: Type[Any]) -> str:
+    """Returns a hash of the fields of `klass`, their types and metadata,
+    and the options set by the decorators. It changes whenever a change in
+    the dataclass could change the records read from a file, so it can be
+    used as part of the key of caches of parsed records."""
+    schema = get_schema(klass)
+    type_hints = schema.type_hints
+    parts: List[Any] = [klass.__module__, klass.__qualname__]
+
+    for field in schema.fields:
+        parts.append(
+            (
+                field.name,
+                repr(type_hints.get(field.name, field.type)),
+                field.init,
+                sorted((str(k), repr(v)) for k, v in field.metadata.items()),
+            )
+        )
+
+    parts.extend(repr(getattr(klass, x, None)) for x in CLASS_OPTIONS)
+
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def header_fingerprint(klass: Type[Any], header: Sequence[str]) -> str:
+    """Returns a hash of the schema of `klass` and the header of a file."""
+    key = repr((schema_fingerprint(klass), [x.strip() for x in header]))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+@dataclasses.dataclass
+class HeaderDiff:
+    """The differences between the header of a file and the columns
+    expected by a dataclass."""
+
+    fingerprint: str
+    missing: List[str] = dataclasses.field(default_factory=list)
+    missing_optional: List[str] = dataclasses.field(default_factory=list)
+    extra: List[str] = dataclasses.field(default_factory=list)
+    reordered: bool = False
+
+    def problems(self, check: str = "missing") -> List[str]:
+        """Returns the differences that are not allowed by `check`:
+
+        - `missing`: columns of required fields are missing
+        - `extra`: the header has columns that are not in the dataclass
+        - `strict`: the columns are not in the order of the fields
+        """
+        if check not in HEADER_CHECKS:
+            raise ValueError(f"The header check must be one of {HEADER_CHECKS}.")
+
+        problems = []
+
+        if self.missing:
+            problems.append(f"missing columns: {self.missing}")
+
+        if check in ("extra", "strict") and self.extra:
+            problems.append(f"unexpected columns: {self.extra}")
+
+        if check == "strict" and self.reordered:
+            problems.append("the columns are not in the order of the fields")
+
+        return problems
+
+
+def compare_header(
+    klass: Type[Any],
+    header: Optional[Sequence[str]],
+    field_mapping: Optional[Dict[str, Any]] = None,
+) -> HeaderDiff:
+    """Compares the header of a file with the fields of `klass`, after
+    applying the column names mapped with `DataclassReader.map`."""
+    header = [x.strip() for x in header or []]
+    field_mapping = field_mapping or {}
+
+    schema = get_schema(klass)
+    expected = []
+    optional = set()
+
+    for field in schema.init_fields:
+        name = field_mapping.get(field.name, field.name)
+        expected.append(name)
+
+        if field.name in schema.optional_fields:
+            optional.add(name)
+
+    columns = set(header)
+    names = set(expected)
+    absent = [x for x in expected if x not in columns]
+
+    return HeaderDiff(
+        fingerprint=header_fingerprint(klass, header),
+        missing=[x for x in absent if x not in optional],
+        missing_optional=[x for x in absent if x in optional],
+        extra=[x for x in header if x not in names],
+        reordered=[x for x in header if x in names]
+        != [x for x in expected if x in columns],
+    )
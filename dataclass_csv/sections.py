@@ -0,0 +1,93 @@
+import csv
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from .dataclass_reader import DataclassReader
+from .exceptions import CsvValueError
+
+
+class SectionReader:
+    """Reads a CSV file containing several tables, each one starting with a
+    marker line, and yields `(section, record)` pairs in a single pass.
+
+    A marker is a row whose first cell, ignoring surrounding white spaces,
+    is one of the keys of `sections` and whose other cells are empty. The
+    rows that follow it are converted to the dataclass of that section.
+
+    With `header=True` the row after each marker is the header of the
+    section, and it is mapped to column positions once. With `header=False`
+    the columns are matched by position, using the order of the dataclass
+    fields or the `index` metadata. In both cases no `dict` is created for
+    each row.
+
+    Usage:
+        >>> from dataclass_csv import SectionReader
+
+        >>> with open('export.csv') as f:
+        >>>     reader = SectionReader(f, {'[users]': User, '[orders]': Order})
+        >>>     for section, record in reader:
+        >>>         ...
+    """
+
+    def __init__(
+        self,
+        f: Any,
+        sections: Dict[str, Type[Any]],
+        header: bool = True,
+        dialect: Union[str, Type[csv.Dialect]] = "excel",
+        **fmtparams: Any,
+    ):
+        if not f:
+            raise ValueError("The f argument is required.")
+
+        if not sections:
+            raise ValueError("At least one section is required.")
+
+        self._readers = {
+            marker: DataclassReader(iter(()), klass, positional=True)
+            for marker, klass in sections.items()
+        }
+        self._header = header
+        self._reader = csv.reader(f, dialect, **fmtparams)
+        self._records = self._read_records()
+
+    def _get_marker(self, row: List[str]) -> Optional[str]:
+        marker = row[0].strip()
+
+        if marker in self._readers and not any(x.strip() for x in row[1:]):
+            return marker
+
+        return None
+
+    def _read_records(self) -> Iterator[Tuple[str, Any]]:
+        section = ""
+        reader: Any = None
+        expect_header = False
+
+        for row in self._reader:
+            if not row:
+                continue
+
+            line_number = self._reader.line_num
+            marker = self._get_marker(row)
+
+            if marker is not None:
+                section, reader = marker, self._readers[marker]
+                expect_header = self._header
+            elif reader is None:
+                raise CsvValueError(
+                    "The row is not part of a section. The file must start "
+                    f"with one of the markers: {list(self._readers)}.",
+                    line_number=line_number,
+                )
+            elif expect_header:
+                reader._set_header(row)
+                expect_header = False
+            else:
+                yield section, reader._cls(**reader._parse_row(row, line_number))
+
+    def __next__(self) -> Tuple[str, Any]:
+        return next(self._records)
+
+    def __iter__(self):
+        return self
@@ -0,0 +1,159 @@
+import csv
+import io
+import itertools
+import threading
+
+from typing import Any, Generic, Iterable, List, Tuple, Type, TypeVar, Union
+
+from .dataclass_reader import DataclassReader
+from .dataclass_writer import DataclassWriter
+from .header_mapper import HeaderMapper
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class SharedDataclassWriter(Generic[T]):
+    """A writer that can be used by many threads at the same time.
+
+    Each thread formats its rows in its own buffer, so the conversion of
+    the dataclass instances runs in parallel; the lock is only held to
+    write the formatted text to the file. The rows passed to a single call
+    to `write` are written together, without rows of other threads between
+    them.
+
+    The rows are converted like `DataclassWriter` does, with the dates in
+    the `dateformat` of their field. The header is written by the first
+    call to `write`, with the column names set with `map`.
+
+    Usage:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from dataclass_csv import SharedDataclassWriter
+
+        >>> with open('users.csv', 'w', newline='') as f:
+        >>>     writer = SharedDataclassWriter(f, User)
+        >>>     with ThreadPoolExecutor() as executor:
+        >>>         for users in executor.map(fetch_users, pages):
+        >>>             writer.write(users)
+    """
+
+    def __init__(
+        self,
+        f: Any,
+        klass: Type[T],
+        dialect: Union[str, Type[csv.Dialect]] = "excel",
+        skip_header: bool = False,
+        **fmtparams: Any,
+    ):
+        self._rows: DataclassWriter[T] = DataclassWriter(
+            f, (), klass, dialect, **fmtparams
+        )
+        self._f = f
+        self._dialect = dialect
+        self._fmtparams = fmtparams
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._write_header = not skip_header
+
+    def _format(self, rows: Iterable[Any]) -> str:
+        local = self._local
+
+        if not hasattr(local, "writer"):
+            local.buffer = io.StringIO()
+            local.writer = csv.writer(local.buffer, self._dialect, **self._fmtparams)
+
+        try:
+            local.writer.writerows(rows)
+            return local.buffer.getvalue()
+        finally:
+            local.buffer.seek(0)
+            local.buffer.truncate()
+
+    def write(self, data: Iterable[T]) -> None:
+        """Writes the dataclass instances in `data`."""
+        text = self._format(self._rows._to_row(x) for x in data)
+
+        with self._lock:
+            if self._write_header:
+                self._f.write(self._format([self._rows._apply_mapping()]))
+                self._write_header = False
+            self._f.write(text)
+
+    def write_one(self, item: T) -> None:
+        """Writes a single dataclass instance."""
+        self.write([item])
+
+    def map(self, propname: str) -> HeaderMapper:
+        """Used to map a field in the dataclass to header item in the CSV file.
+        The header is written by the first call to `write`, so the fields
+        must be mapped before.
+        :param propname: The name of the property of the dataclass to be mapped
+        """
+        return self._rows.map(propname)
+
+
+class SharedDataclassReader(Generic[T]):
+    """Hands out the rows of a `DataclassReader` in batches to many
+    consumer threads.
+
+    Only reading the raw rows from the file is serialized; each thread
+    converts the rows of its batch into dataclass instances, so the
+    conversion runs in parallel on free-threaded Python builds. The line
+    numbers in the errors are the same as when using the reader directly.
+
+    Usage:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from dataclass_csv import DataclassReader, SharedDataclassReader
+
+        >>> def consume(shared):
+        >>>     for batch in shared:
+        >>>         save(batch)
+
+        >>> with open('users.csv') as f:
+        >>>     shared = SharedDataclassReader(DataclassReader(f, User))
+        >>>     with ThreadPoolExecutor(4) as executor:
+        >>>         for _ in range(4):
+        >>>             executor.submit(consume, shared)
+    """
+
+    def __init__(
+        self, reader: DataclassReader[T], batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than zero.")
+
+        self._reader = reader
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+
+    def _read_rows(self) -> List[Tuple[Any, int]]:
+        csv_reader = self._reader._reader
+
+        with self._lock:
+            return [
+                (row, csv_reader.line_num)
+                for row in itertools.islice(csv_reader, self._batch_size)
+            ]
+
+    def next_batch(self) -> List[T]:
+        """Returns the next batch of records, or an empty list when there
+        are no more rows."""
+        reader = self._reader
+        klass = reader._cls
+
+        return [
+            klass(**reader._parse_row(row, line_number))
+            for row, line_number in self._read_rows()
+        ]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> List[T]:
+        batch = self.next_batch()
+
+        if not batch:
+            raise StopIteration
+
+        return batch
@@ -0,0 +1,222 @@
+import contextlib
+import csv
+import heapq
+import operator
+import os
+import pickle
+import tempfile
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .dataclass_reader import DataclassReader
+from .dataclass_writer import DataclassWriter
+
+T = TypeVar("T")
+
+DEFAULT_BUFFER_SIZE = 100_000
+
+KeyType = Union[str, Callable[[Any], Any]]
+
+
+def _get_key_func(key: KeyType) -> Callable[[Any], Any]:
+    if isinstance(key, str):
+        return operator.attrgetter(key)
+
+    if callable(key):
+        return key
+
+    raise ValueError("The key argument must be a field name or a callable.")
+
+
+def _write_run(items: Iterable[Any], directory: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+
+    with os.fdopen(fd, "wb") as f:
+        # Each item is pickled on its own, so the memo does not hold a
+        # reference to every item written, and each item is read back by a
+        # new unpickler without references to the objects of other items.
+        for item in items:
+            pickle.dump(item, f, pickle.HIGHEST_PROTOCOL)
+
+    return path
+
+
+def _read_run(path: str) -> Iterator[Any]:
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def _sorted_runs(
+    items: Iterable[Any],
+    key: Callable[[Any], Any],
+    directory: str,
+    reverse: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Union[List[Any], List[str]]:
+    """Splits `items` in sorted runs of at most `buffer_size` items.
+
+    When all the items fit in the buffer, the sorted list is returned as
+    the only run, without writing anything to disk. Otherwise every run is
+    written to a temporary file in `directory` and the list of paths is
+    returned.
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be greater than zero.")
+
+    runs: List[str] = []
+    buffer: List[Any] = []
+
+    for item in items:
+        buffer.append(item)
+        if len(buffer) >= buffer_size:
+            buffer.sort(key=key, reverse=reverse)
+            runs.append(_write_run(buffer, directory))
+            buffer = []
+
+    buffer.sort(key=key, reverse=reverse)
+
+    if not runs:
+        return [buffer]
+
+    if buffer:
+        runs.append(_write_run(buffer, directory))
+
+    return runs
+
+
+def _merge_runs(
+    runs: Union[List[Any], List[str]],
+    key: Callable[[Any], Any],
+    reverse: bool = False,
+) -> Generator[Any, None, None]:
+    iterables = [_read_run(run) if isinstance(run, str) else iter(run) for run in runs]
+
+    try:
+        yield from heapq.merge(*iterables, key=key, reverse=reverse)
+    finally:
+        # Close the run files before their directory is removed.
+        for iterable in iterables:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+
+def sorted_records(
+    items: Iterable[T],
+    key: KeyType,
+    reverse: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    tmpdir: Optional[str] = None,
+) -> Generator[T, None, None]:
+    """Sorts an iterable of dataclass instances that may not fit in memory.
+
+    At most `buffer_size` records are held in memory at a time. Larger inputs
+    are split in sorted runs written to temporary files, which are merged
+    while the result is consumed and removed afterwards.
+
+    :param items: The records to sort, e.g. a `DataclassReader`
+    :param key: The name of the field to sort by, or a callable
+    :param reverse: Sort in descending order
+    :param buffer_size: Maximum number of records held in memory
+    :param tmpdir: Directory for the temporary files
+    """
+    key_func = _get_key_func(key)
+
+    with tempfile.TemporaryDirectory(dir=tmpdir) as directory:
+        runs = _sorted_runs(items, key_func, directory, reverse, buffer_size)
+        yield from _merge_runs(runs, key_func, reverse)
+
+
+def external_sort(
+    in_path: str,
+    out_path: str,
+    klass: Type[T],
+    key: KeyType,
+    reverse: bool = False,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    tmpdir: Optional[str] = None,
+    dialect: Union[str, Type[csv.Dialect]] = "excel",
+    encoding: str = "utf-8",
+    writer_options: Optional[Dict[str, Any]] = None,
+    **kwds: Any,
+) -> None:
+    """Sorts a CSV file by a typed key, using a bounded amount of memory.
+
+    The records are read with `DataclassReader`, so the key is compared
+    using the converted values (e.g. `datetime` or `int`) instead of the
+    text in the file, and written to `out_path` with `DataclassWriter`.
+
+    Usage:
+        >>> from dataclass_csv import external_sort
+
+        >>> external_sort('events.csv', 'sorted.csv', Event, key='created_at')
+
+    :param encoding: The encoding of the input and output files
+    :param writer_options: Passed to `DataclassWriter`, e.g. `delimiter`
+    :param kwds: Passed to `DataclassReader`
+    """
+    with open(in_path, newline="", encoding=encoding) as in_file:
+        reader = DataclassReader(in_file, klass, dialect=dialect, **kwds)
+        records = sorted_records(reader, key, reverse, buffer_size, tmpdir)
+
+        with contextlib.closing(records), open(
+            out_path, "w", newline="", encoding=encoding
+        ) as f:
+            DataclassWriter(
+                f, records, klass, dialect=dialect, **(writer_options or {})
+            ).write()
+
+
+def merge_sorted(
+    paths: List[str],
+    out_path: str,
+    klass: Type[T],
+    key: KeyType,
+    reverse: bool = False,
+    dialect: Union[str, Type[csv.Dialect]] = "excel",
+    encoding: str = "utf-8",
+    writer_options: Optional[Dict[str, Any]] = None,
+    **kwds: Any,
+) -> None:
+    """Merges CSV files that are already sorted by `key` into `out_path`.
+
+    Only one record of each file is held in memory at a time.
+
+    :param encoding: The encoding of the input and output files
+    :param writer_options: Passed to `DataclassWriter`, e.g. `delimiter`
+    :param kwds: Passed to `DataclassReader`
+    """
+    key_func = _get_key_func(key)
+
+    with contextlib.ExitStack() as stack:
+        readers = [
+            DataclassReader(
+                stack.enter_context(open(path, newline="", encoding=encoding)),
+                klass,
+                dialect=dialect,
+                **kwds,
+            )
+            for path in paths
+        ]
+        records = heapq.merge(*readers, key=key_func, reverse=reverse)
+
+        with open(out_path, "w", newline="", encoding=encoding) as f:
+            DataclassWriter(
+                f, records, klass, dialect=dialect, **(writer_options or {})
+            ).write()
@@ -0,0 +1,263 @@
+import dataclasses
+import enum
+import itertools
+import sqlite3
+
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .dataclass_reader import DataclassReader, get_args, is_union_type
+from .schema import get_schema
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 10_000
+
+_SAVEPOINT = "dataclass_csv_to_sqlite"
+
+_SQL_TYPES = {
+    int: "INTEGER",
+    bool: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    date: "TEXT",
+    datetime: "TEXT",
+}
+
+_NATIVE_TYPES = (int, float, str, bool, bytes)
+
+
+@dataclasses.dataclass
+class _Column:
+    name: str
+    field_type: Any
+    sql_type: str
+    nullable: bool
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _columns(klass: Type[Any]) -> List[_Column]:
+    if not dataclasses.is_dataclass(klass):
+        raise ValueError("klass argument needs to be a dataclass.")
+
+    type_hints = get_schema(klass).type_hints
+    columns = []
+
+    for field in dataclasses.fields(klass):
+        if not field.init:
+            continue
+
+        field_type = type_hints[field.name]
+        nullable = field.default is None
+
+        if is_union_type(field_type):
+            type_args = [x for x in get_args(field_type) if x is not type(None)]
+            nullable = nullable or len(type_args) < len(get_args(field_type))
+            if len(type_args) == 1:
+                field_type = type_args[0]
+
+        sql_type = _SQL_TYPES.get(field_type, "TEXT")
+        columns.append(_Column(field.name, field_type, sql_type, nullable))
+
+    return columns
+
+
+def create_table_sql(klass: Type[Any], table: str) -> str:
+    """Returns the `CREATE TABLE` statement for the fields of `klass` that
+    are set by its `__init__`, based on their type hints.
+
+    `int` and `bool` fields are stored as `INTEGER`, `float` fields as
+    `REAL`, and the other types, including `date` and `datetime` in ISO
+    format, as `TEXT`. Fields that are not `Optional` and do not default to
+    `None` are `NOT NULL`.
+    """
+    definitions = [
+        f"{_quote(x.name)} {x.sql_type}" + ("" if x.nullable else " NOT NULL")
+        for x in _columns(klass)
+    ]
+
+    return f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({', '.join(definitions)})"
+
+
+def _to_sql_value(value: Any) -> Any:
+    if value is None or isinstance(value, _NATIVE_TYPES):
+        return value
+
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    return str(value)
+
+
+def _from_sql_value(field_type: Any) -> Callable[[Any], Any]:
+    if not isinstance(field_type, type):
+        return lambda value: value
+
+    parse: Callable[[Any], Any] = field_type
+    if field_type is datetime:
+        parse = datetime.fromisoformat
+    elif field_type is date:
+        parse = date.fromisoformat
+
+    return lambda value: value if type(value) is field_type else parse(value)
+
+
+def to_sqlite(
+    data: Iterable[Any],
+    conn: sqlite3.Connection,
+    table: str,
+    klass: Optional[Type[Any]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    create: bool = True,
+    tune: bool = True,
+) -> int:
+    """Inserts records into a SQLite table, creating it from the dataclass
+    type hints when it does not exist.
+
+    When `data` is a `DataclassReader`, the values are converted and
+    validated as usual but no dataclass instances are created. The rows
+    are inserted with `executemany` in batches of `batch_size`, reusing the
+    same prepared statement, inside a savepoint that is rolled back on
+    errors. When the connection is not in a transaction the rows are
+    committed at the end; otherwise they are left in the transaction of the
+    caller, which is neither committed nor rolled back.
+
+    Usage:
+        >>> import sqlite3
+        >>> from dataclass_csv import DataclassReader, to_sqlite
+
+        >>> conn = sqlite3.connect('users.db')
+        >>> with open('users.csv') as f:
+        >>>     to_sqlite(DataclassReader(f, User), conn, 'users')
+
+    :param klass: The dataclass of the records, required when `data` is
+    not a `DataclassReader`
+    :param tune: Set `PRAGMA synchronous=OFF` during the load, which is much
+    faster but not safe against power loss until the load finishes. It is
+    not set when the connection is already in a transaction
+    :return: The number of rows inserted
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be greater than zero.")
+
+    if isinstance(data, DataclassReader):
+        klass = data._cls
+    elif klass is None:
+        raise ValueError("The klass argument is required for iterables of records.")
+
+    columns = _columns(klass)
+    names = [x.name for x in columns]
+
+    rows: Iterator[Tuple[Any, ...]]
+    if isinstance(data, DataclassReader):
+        rows = data._iter_values(names)
+    else:
+        rows = (tuple(getattr(x, name) for name in names) for x in data)
+
+    if any(x.field_type not in _NATIVE_TYPES for x in columns):
+        rows = (tuple(map(_to_sql_value, x)) for x in rows)
+
+    insert = (
+        f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, names))}) "
+        f"VALUES ({', '.join('?' * len(names))})"
+    )
+
+    # The safety level cannot be changed inside a transaction.
+    in_transaction = conn.in_transaction
+    tune = tune and not in_transaction
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    if tune:
+        conn.execute("PRAGMA synchronous = OFF")
+
+    if create and not in_transaction:
+        # Committed on its own, so the table exists even if the load fails.
+        with conn:
+            conn.execute(create_table_sql(klass, table))
+
+    count = 0
+
+    try:
+        # A savepoint commits the rows when there is no transaction, and
+        # only releases them into the transaction of the caller otherwise,
+        # so an error never rolls back or commits the work of the caller.
+        conn.execute(f"SAVEPOINT {_SAVEPOINT}")
+        try:
+            if create and in_transaction:
+                conn.execute(create_table_sql(klass, table))
+
+            while True:
+                batch = list(itertools.islice(rows, batch_size))
+                if not batch:
+                    break
+                conn.executemany(insert, batch)
+                count += len(batch)
+        except BaseException:
+            conn.execute(f"ROLLBACK TO {_SAVEPOINT}")
+            conn.execute(f"RELEASE {_SAVEPOINT}")
+            raise
+
+        conn.execute(f"RELEASE {_SAVEPOINT}")
+    finally:
+        if tune:
+            conn.execute(f"PRAGMA synchronous = {int(synchronous)}")
+
+    return count
+
+
+def from_sqlite(cursor: sqlite3.Cursor, klass: Type[T]) -> Iterator[T]:
+    """Converts the rows of an executed query into instances of `klass`,
+    matching the column names of the query with the field names. The
+    result can be passed to `DataclassWriter` to export a query to CSV.
+
+    Usage:
+        >>> from dataclass_csv import DataclassWriter, from_sqlite
+
+        >>> cursor = conn.execute('SELECT * FROM users WHERE age > 18')
+        >>> with open('adults.csv', 'w') as f:
+        >>>     DataclassWriter(f, from_sqlite(cursor, User), User).write()
+    """
+    columns = {x.name: x for x in _columns(klass)}
+    names = [x[0] for x in cursor.description or []]
+
+    unknown = [x for x in names if x not in columns]
+    if unknown:
+        raise ValueError(f"Unknown fields for {klass.__name__}: {unknown}")
+
+    converters = [_from_sql_value(columns[x].field_type) for x in names]
+
+    return _from_sqlite(cursor, klass, names, converters)
+
+
+def _from_sqlite(
+    cursor: sqlite3.Cursor,
+    klass: Type[T],
+    names: List[str],
+    converters: List[Callable[[Any], Any]],
+) -> Iterator[T]:
+    while True:
+        rows = cursor.fetchmany(DEFAULT_BATCH_SIZE)
+        if not rows:
+            return
+
+        for row in rows:
+            values = {
+                name: value if value is None else convert(value)
+                for name, convert, value in zip(names, converters, row)
+            }
+            yield klass(**values)
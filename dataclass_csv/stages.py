@@ -0,0 +1,274 @@
+import itertools
+import math
+import operator
+import os
+import pickle
+import random
+import sys
+import tempfile
+
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .dataclass_reader import DataclassReader
+from .sorting import _get_key_func, _read_run
+
+DEFAULT_MAX_KEYS = 1_000_000
+DEFAULT_PARTITIONS = 16
+DEFAULT_ERROR_RATE = 0.001
+
+KeyType = Union[str, Sequence[str], Callable[[Any], Any]]
+
+_MISSING = object()
+
+
+def _identity(payload: Any) -> Any:
+    return payload
+
+
+class _BloomFilter:
+    """A fixed size set that can report false positives, but never false
+    negatives, with a probability of about `error_rate` when it holds
+    `capacity` keys."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1.")
+
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._size = max(size, 8)
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def add(self, key: Any) -> bool:
+        """Adds the key and returns `True` when it was not in the filter."""
+        # Double hashing: the positions are h1 + i * h2.
+        h1 = hash(key)
+        h2 = hash((key, 0x9E3779B9)) | 1
+        bits = self._bits
+        added = False
+
+        for i in range(self._hashes):
+            position = (h1 + i * h2) % self._size
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+
+        return added
+
+
+def _keyed_records(
+    records: Iterable[Any], key: KeyType
+) -> Tuple[Iterator[Tuple[Any, Any]], Callable[[Any], Any]]:
+    """Returns `(key, payload)` pairs and the function that converts a
+    payload into a record.
+
+    For a `DataclassReader` the payload is the raw row and its line number,
+    so only the key fields are converted until a record is kept.
+    """
+    if isinstance(records, DataclassReader) and not callable(key):
+        reader = records
+        names = [key] if isinstance(key, str) else list(key)
+        init_fields = {x.name: x for x in reader._init_fields}
+
+        unknown = [x for x in names if x not in init_fields]
+        if unknown:
+            raise ValueError(f"Unknown fields for {reader._cls.__name__}: {unknown}")
+
+        fields = [init_fields[x] for x in names]
+        csv_reader = reader._reader
+
+        def key_of(row: Any, line_number: int) -> Any:
+            values = tuple(reader._parse_field(row, x, line_number) for x in fields)
+            return values[0] if len(values) == 1 else values
+
+        def build(payload: Any) -> Any:
+            return reader._cls(**reader._parse_row(*payload))
+
+        pairs = (
+            (key_of(row, csv_reader.line_num), (row, csv_reader.line_num))
+            for row in csv_reader
+        )
+        return pairs, build
+
+    if isinstance(key, str) or callable(key):
+        key_func = _get_key_func(key)
+    else:
+        key_func = operator.attrgetter(*key)
+
+    return ((key_func(x), x) for x in records), _identity
+
+
+def distinct(
+    records: Iterable[Any],
+    key: KeyType,
+    max_keys: int = DEFAULT_MAX_KEYS,
+    partitions: int = DEFAULT_PARTITIONS,
+    tmpdir: Optional[str] = None,
+    bloom: bool = False,
+    error_rate: float = DEFAULT_ERROR_RATE,
+) -> Iterator[Any]:
+    """Yields the first record of each distinct key.
+
+    When `records` is a `DataclassReader` and `key` is a field name (or a
+    list of names), only the key fields of duplicated rows are converted.
+
+    Up to `max_keys` keys are kept in memory and the records are yielded in
+    their original order. After that, the records with new keys are written
+    to `partitions` temporary files by the hash of their key, and each
+    partition is deduplicated at the end, so these records are yielded
+    grouped by partition.
+
+    With `bloom=True` a Bloom filter sized for `max_keys` keys is used
+    instead, which uses a fixed and much smaller amount of memory and never
+    writes to disk, but drops a distinct record with a probability of about
+    `error_rate`.
+
+    Usage:
+        >>> from dataclass_csv import DataclassReader, distinct
+
+        >>> with open('events.csv') as f:
+        >>>     for event in distinct(DataclassReader(f, Event), key='id'):
+        >>>         ...
+
+    :param key: A field name, a list of field names or a callable receiving
+    a dataclass instance
+    """
+    if max_keys < 1 or partitions < 1:
+        raise ValueError("max_keys and partitions must be positive.")
+
+    pairs, build = _keyed_records(records, key)
+
+    if bloom:
+        return _bloom_distinct(pairs, build, _BloomFilter(max_keys, error_rate))
+
+    return _distinct(pairs, build, max_keys, partitions, tmpdir)
+
+
+def _bloom_distinct(
+    pairs: Iterator[Tuple[Any, Any]],
+    build: Callable[[Any], Any],
+    seen: _BloomFilter,
+) -> Iterator[Any]:
+    for key, payload in pairs:
+        if seen.add(key):
+            yield build(payload)
+
+
+def _distinct(
+    pairs: Iterator[Tuple[Any, Any]],
+    build: Callable[[Any], Any],
+    max_keys: int,
+    partitions: int,
+    tmpdir: Optional[str],
+) -> Iterator[Any]:
+    seen: Set[Any] = set()
+
+    for key, payload in pairs:
+        if key in seen:
+            continue
+
+        if len(seen) == max_keys:
+            pairs = itertools.chain([(key, payload)], pairs)
+            break
+
+        seen.add(key)
+        yield build(payload)
+    else:
+        return
+
+    with tempfile.TemporaryDirectory(dir=tmpdir) as directory:
+        paths = [os.path.join(directory, f"{i}.part") for i in range(partitions)]
+        files = [open(x, "wb") for x in paths]
+
+        try:
+            # Each pair is pickled on its own, so it is read back by
+            # `_read_run` without references to the objects of other pairs.
+            for key, payload in pairs:
+                if key not in seen:
+                    f = files[hash(key) % partitions]
+                    pickle.dump((key, payload), f, pickle.HIGHEST_PROTOCOL)
+        finally:
+            for f in files:
+                f.close()
+
+        del seen
+
+        for path in paths:
+            partition_seen: Set[Any] = set()
+
+            for key, payload in _read_run(path):
+                if key not in partition_seen:
+                    partition_seen.add(key)
+                    yield build(payload)
+
+            os.remove(path)
+
+
+def _log_random(rng: random.Random) -> float:
+    return math.log(rng.random() or sys.float_info.min)
+
+
+def sample(records: Iterable[Any], n: int, seed: Optional[Any] = None) -> List[Any]:
+    """Returns a uniform random sample of `n` records, in their original
+    order, reading the records once.
+
+    It uses reservoir sampling with geometric skips (Algorithm L), so a
+    random number is only drawn for the records that enter the reservoir.
+    When `records` is a `DataclassReader`, the rows are kept unconverted
+    and only the `n` sampled rows are converted into dataclass instances.
+
+    Usage:
+        >>> from dataclass_csv import DataclassReader, sample
+
+        >>> with open('events.csv') as f:
+        >>>     events = sample(DataclassReader(f, Event), 1000, seed=42)
+    """
+    if n < 1:
+        raise ValueError("n must be greater than zero.")
+
+    rng = random.Random(seed)
+
+    if isinstance(records, DataclassReader):
+        reader = records
+        csv_reader = reader._reader
+        items: Iterator[Any] = ((row, csv_reader.line_num) for row in csv_reader)
+
+        def build(payload: Any) -> Any:
+            return reader._cls(**reader._parse_row(*payload))
+
+    else:
+        items = iter(records)
+        build = _identity
+
+    reservoir = list(enumerate(itertools.islice(items, n)))
+    position = len(reservoir)
+
+    if position == n:
+        w = math.exp(_log_random(rng) / n)
+
+        while True:
+            skip = math.floor(_log_random(rng) / math.log(1 - w))
+            item = next(itertools.islice(items, skip, None), _MISSING)
+
+            if item is _MISSING:
+                break
+
+            position += skip + 1
+            reservoir[rng.randrange(n)] = (position - 1, item)
+            w *= math.exp(_log_random(rng) / n)
+
+    reservoir.sort(key=lambda x: x[0])
+
+    return [build(payload) for _, payload in reservoir]
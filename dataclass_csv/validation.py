@@ -0,0 +1,67 @@
+import dataclasses
+
+from typing import Dict, List
+
+from .exceptions import CsvValueError
+
+
+@dataclasses.dataclass
+class ValidationFailure:
+    """A single value that could not be parsed."""
+
+    line_number: int
+    field: str
+    message: str
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    """The result of `DataclassReader.validate`.
+
+    Only the first `max_failures` failures are kept; the per-column
+    counters include every failure found. Reports created from different
+    chunks of the same file can be combined with `merge`.
+    """
+
+    max_failures: int = 10
+    rows: int = 0
+    invalid_rows: int = 0
+    error_counts: Dict[str, int] = dataclasses.field(default_factory=dict)
+    failures: List[ValidationFailure] = dataclasses.field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return self.invalid_rows == 0
+
+    def add_row(self, is_valid: bool) -> None:
+        self.rows += 1
+        if not is_valid:
+            self.invalid_rows += 1
+
+    def add_failure(self, field: str, line_number: int, error: Exception) -> None:
+        self.error_counts[field] = self.error_counts.get(field, 0) + 1
+
+        if len(self.failures) >= self.max_failures:
+            return
+
+        if isinstance(error, CsvValueError):
+            message = str(error.error)
+        elif isinstance(error, KeyError) and error.args:
+            message = str(error.args[0])
+        else:
+            message = str(error)
+
+        self.failures.append(ValidationFailure(line_number, field, message))
+
+    def merge(self, other: "ValidationReport") -> "ValidationReport":
+        """Adds the results of `other` to this report and returns it."""
+        self.rows += other.rows
+        self.invalid_rows += other.invalid_rows
+
+        for field, count in other.error_counts.items():
+            self.error_counts[field] = self.error_counts.get(field, 0) + count
+
+        failures = sorted(self.failures + other.failures, key=lambda x: x.line_number)
+        self.failures = failures[: self.max_failures]
+
+        return self
@@ -0,0 +1,27 @@
+"""Compiles the conversion core in place with mypyc.
+
+The modules are the ones listed in the hatch-mypyc build hook of
+`pyproject.toml`, so the in-place build used by `make compile` and the CI
+is the same as the one of the wheels.
+"""
+import subprocess
+import sys
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, tomli is a dependency of mypy
+    import tomli as tomllib
+
+
+def main() -> int:
+    with open("pyproject.toml", "rb") as f:
+        config = tomllib.load(f)
+
+    hook = config["tool"]["hatch"]["build"]["targets"]["wheel"]["hooks"]["mypyc"]
+    command = [sys.executable, "-m", "mypyc", *hook.get("mypy-args", [])]
+
+    return subprocess.call(command + hook["include"])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,16 @@
 import dataclasses
+import enum
 import re
 
 from datetime import date, datetime
 
-from dataclass_csv import dateformat, accept_whitespaces
+from dataclass_csv import (
+    dateformat,
+    accept_whitespaces,
+    categorical,
+    boolean_values,
+    number_format,
+)
 
 from typing import Optional
 
@@ -135,3 +142,89 @@ class UserWithEmail:
 class UserWithOptionalEmail:
     name: str
     email: str = "not specified"
+
+
+class Status(enum.Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+
+
+@categorical("country", "status")
+@dataclasses.dataclass
+class CategoricalOrder:
+    id: int
+    country: str
+    status: Status
+
+
+@dataclasses.dataclass
+class OrderWithInternMetadata:
+    id: int
+    country: str = dataclasses.field(metadata={"intern": True})
+    amount: int = dataclasses.field(default=0, metadata={"intern": 2})
+
+
+@dataclasses.dataclass
+class Sale:
+    country: str
+    product: str
+    quantity: int
+    price: float
+    discount: Optional[float] = None
+
+
+@dataclasses.dataclass
+class Customer:
+    id: int
+    name: str
+
+
+@dataclasses.dataclass
+class Transaction:
+    id: int
+    amount: float
+    customer_id: Optional[int] = None
+
+
+@dataclasses.dataclass
+@boolean_values(true_values=["ja", "j"], false_values=["nein", "n"])
+@number_format(thousands=".", decimal=",")
+class EuropeanProduct:
+    name: str
+    price: float
+    stock: int
+    available: bool
+    discounted: bool = dataclasses.field(
+        default=False, metadata={"true_values": ["x"], "false_values": ["-"]}
+    )
+
+
+@dataclasses.dataclass
+class ProductWithNumberFormatMetadata:
+    name: str
+    price: float = dataclasses.field(metadata={"thousands": " ", "decimal": ","})
+    stock: Optional[int] = dataclasses.field(default=None, metadata={"thousands": ","})
+
+
+@dataclasses.dataclass
+class Reading:
+    sensor: str = dataclasses.field(metadata={"index": 2})
+    value: float = dataclasses.field(metadata={"index": 0})
+    unit: str = dataclasses.field(default="C", metadata={"index": 3})
+
+
+@dataclasses.dataclass
+class Account:
+    id: int = dataclasses.field(metadata={"width": 6})
+    name: str = dataclasses.field(metadata={"width": 10})
+    opened: date = dataclasses.field(metadata={"width": 8, "dateformat": "%Y%m%d"})
+    balance: Optional[float] = dataclasses.field(
+        default=None, metadata={"slice": (26, 34)}
+    )
+
+
+@dataclasses.dataclass
+class Ledger:
+    code: str = dataclasses.field(metadata={"width": 6, "accept_whitespaces": True})
+    revision: int = dataclasses.field(init=False, default=1, metadata={"width": 3})
+    amount: float = dataclasses.field(metadata={"width": 8})
@@ -0,0 +1,150 @@
+import pytest
+
+from dataclass_csv import CsvValueError, DataclassReader, aggregate
+
+from .mocks import Sale
+
+
+SALES = [
+    {"country": "SE", "product": "a", "quantity": 1, "price": 10.5, "discount": 1},
+    {"country": "BR", "product": "a", "quantity": 5, "price": 2.0, "discount": ""},
+    {"country": "SE", "product": "b", "quantity": 3, "price": 4.0, "discount": 2},
+    {"country": "BR", "product": "a", "quantity": 2, "price": 7.5, "discount": ""},
+    {"country": "US", "product": "c", "quantity": 4, "price": 1.0, "discount": ""},
+]
+
+EXPECTED = {
+    "SE": {
+        "count": 2,
+        "sum_quantity": 4,
+        "min_price": 4.0,
+        "max_price": 10.5,
+        "max_discount": 2.0,
+    },
+    "BR": {
+        "count": 2,
+        "sum_quantity": 7,
+        "min_price": 2.0,
+        "max_price": 7.5,
+        "max_discount": None,
+    },
+    "US": {
+        "count": 1,
+        "sum_quantity": 4,
+        "min_price": 1.0,
+        "max_price": 1.0,
+        "max_discount": None,
+    },
+}
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_aggregate_reader(create_csv, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+
+    csv_file = create_csv(SALES)
+
+    with csv_file.open() as f:
+        result = dict(
+            aggregate(
+                DataclassReader(f, Sale),
+                by="country",
+                sum="quantity",
+                min="price",
+                max=["price", "discount"],
+                batch_size=2,
+                use_numpy=use_numpy,
+            )
+        )
+
+    assert result == EXPECTED
+    assert isinstance(result["SE"]["sum_quantity"], int)
+
+
+def test_aggregate_instances_by_several_fields(create_csv):
+    csv_file = create_csv(SALES)
+
+    with csv_file.open() as f:
+        sales = list(DataclassReader(f, Sale))
+
+    result = dict(aggregate(sales, by=["country", "product"], sum="quantity"))
+
+    assert result == {
+        ("SE", "a"): {"count": 1, "sum_quantity": 1},
+        ("BR", "a"): {"count": 2, "sum_quantity": 7},
+        ("SE", "b"): {"count": 1, "sum_quantity": 3},
+        ("US", "c"): {"count": 1, "sum_quantity": 4},
+    }
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_aggregate_spills_to_disk(create_csv, tmpdir, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+
+    csv_file = create_csv(SALES * 3)
+
+    with csv_file.open() as f:
+        result = dict(
+            aggregate(
+                DataclassReader(f, Sale),
+                by="country",
+                sum="quantity",
+                max="price",
+                count=False,
+                batch_size=1,
+                max_groups=1,
+                partitions=2,
+                tmpdir=str(tmpdir),
+                use_numpy=use_numpy,
+            )
+        )
+
+    assert result == {
+        "SE": {"sum_quantity": 12, "max_price": 10.5},
+        "BR": {"sum_quantity": 21, "max_price": 7.5},
+        "US": {"sum_quantity": 12, "max_price": 1.0},
+    }
+    assert tmpdir.listdir() == []
+
+
+def test_aggregate_spills_string_keys():
+    names = ["w", "x", "y", "z"]
+    sales = [Sale(names[i % 4], names[i // 4 % 4], 1, 1.0) for i in range(64)]
+    options = {"by": ["country", "product"], "min": "country", "max": "product"}
+
+    result = dict(aggregate(sales, max_groups=3, partitions=2, **options))
+
+    assert result == dict(aggregate(sales, **options))
+    assert result[("x", "w")] == {"count": 4, "min_country": "x", "max_product": "w"}
+
+
+def test_aggregate_invalid_arguments(create_csv):
+    csv_file = create_csv(SALES)
+
+    with csv_file.open() as f:
+        reader = DataclassReader(f, Sale)
+
+        with pytest.raises(ValueError):
+            aggregate(reader, by=[])
+
+        with pytest.raises(ValueError):
+            aggregate(reader, by="country", batch_size=0)
+
+        with pytest.raises(ValueError, match="Unknown fields"):
+            aggregate(reader, by="city")
+
+
+def test_reader_values_are_converted_one_row_at_a_time(create_csv):
+    csv_file = create_csv(SALES[:2] + [dict(SALES[2], quantity="x")])
+
+    with csv_file.open() as f:
+        rows = DataclassReader(f, Sale)._iter_values(["country", "quantity"])
+
+        assert next(rows) == ("SE", 1)
+        assert next(rows) == ("BR", 5)
+        with pytest.raises(CsvValueError) as ex:
+            next(rows)
+
+    assert ex.value.line_number == 4
@@ -0,0 +1,113 @@
+import dataclasses
+
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from dataclass_csv import DataclassReader, CsvValueError, dateformat
+
+from .mocks import User, UserWithSSN
+
+pa = pytest.importorskip("pyarrow")
+
+from dataclass_csv.arrow import (  # noqa: E402
+    arrow_schema,
+    read_parquet,
+    read_record_batches,
+    to_record_batches,
+    write_parquet,
+)
+
+
+@dateformat("%Y-%m-%d")
+@dataclasses.dataclass
+class Event:
+    name: str
+    created_at: datetime
+    attendees: Optional[int]
+    price: float = 0.0
+    online: Optional[bool] = None
+
+
+EVENTS = [
+    {
+        "name": "a",
+        "created_at": "2024-01-02",
+        "attendees": 3,
+        "price": 1.5,
+        "online": "yes",
+    },
+    {
+        "name": "b",
+        "created_at": "2024-02-03",
+        "attendees": 7,
+        "price": "",
+        "online": "",
+    },
+]
+
+
+def test_arrow_schema():
+    schema = arrow_schema(Event)
+
+    assert schema.names == ["name", "created_at", "attendees", "price", "online"]
+    assert schema.field("name").type == pa.string()
+    assert not schema.field("name").nullable
+    assert schema.field("created_at").type == pa.timestamp("us")
+    assert schema.field("attendees").type == pa.int64()
+    assert schema.field("attendees").nullable
+    assert schema.field("online").type == pa.bool_()
+
+
+def test_arrow_schema_unsupported_type():
+    with pytest.raises(TypeError, match="ssn"):
+        arrow_schema(UserWithSSN)
+
+
+def test_read_record_batches(create_csv):
+    csv_file = create_csv(EVENTS)
+
+    with csv_file.open() as f:
+        batches = list(read_record_batches(DataclassReader(f, Event), batch_size=1))
+
+    assert len(batches) == 2
+    table = pa.Table.from_batches(batches)
+    assert table.column("created_at").to_pylist() == [
+        datetime(2024, 1, 2),
+        datetime(2024, 2, 3),
+    ]
+    assert table.column("attendees").to_pylist() == [3, 7]
+    assert table.column("price").to_pylist() == [1.5, 0.0]
+    assert table.column("online").to_pylist() == [True, None]
+
+
+def test_read_record_batches_validates_values(create_csv):
+    csv_file = create_csv([{"name": "User1", "age": 1}, {"name": "User2", "age": "x"}])
+
+    with csv_file.open() as f:
+        with pytest.raises(CsvValueError) as ex:
+            list(read_record_batches(DataclassReader(f, User)))
+
+    assert ex.value.line_number == 3
+
+
+def test_csv_to_parquet_and_back(create_csv, tmpdir):
+    csv_file = create_csv(EVENTS)
+    path = str(tmpdir.join("events.parquet"))
+
+    with csv_file.open() as f:
+        expected = list(DataclassReader(f, Event))
+        f.seek(0)
+        write_parquet(read_record_batches(DataclassReader(f, Event)), Event, path)
+
+    assert list(read_parquet(path, Event)) == expected
+
+
+def test_instances_to_parquet(tmpdir):
+    users = [User(name=f"User{x}", age=x) for x in range(5)]
+    path = str(tmpdir.join("users.parquet"))
+
+    write_parquet(to_record_batches(users, User, batch_size=2), User, path)
+
+    assert list(read_parquet(path, User, batch_size=3)) == users
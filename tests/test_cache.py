@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from dataclass_csv import DataclassReader, ParsedCache
+
+from .mocks import User, UserWithDateFormatDecorator, UserWithOptionalAge
+
+
+def _snapshots(directory):
+    return [x for x in directory.listdir() if x.ext == ".snapshot"]
+
+
+def test_read_stores_and_loads_a_snapshot(create_csv, tmpdir, monkeypatch):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": 30}])
+    cache = ParsedCache(str(tmpdir.join("cache")))
+
+    records = cache.read(str(csv_file), User)
+
+    assert records == [User(name="User1", age=40), User(name="User2", age=30)]
+    assert len(_snapshots(tmpdir.join("cache"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the CSV file should not be parsed")
+
+    monkeypatch.setattr("dataclass_csv.cache.DataclassReader", fail)
+
+    assert cache.read(str(csv_file), User) == records
+
+
+def test_snapshot_keeps_the_types(create_csv, tmpdir):
+    csv_file = create_csv({"name": "User1", "create_date": "2018-12-09"})
+    cache = ParsedCache(str(tmpdir))
+
+    first = cache.read(str(csv_file), UserWithDateFormatDecorator)
+    second = cache.read(str(csv_file), UserWithDateFormatDecorator)
+
+    assert first == second
+    assert second[0].create_date.year == 2018
+
+
+def test_snapshot_is_invalidated(create_csv, tmpdir):
+    csv_file = create_csv({"name": "User1", "age": 40})
+    cache = ParsedCache(str(tmpdir.join("cache")))
+
+    cache.read(str(csv_file), User)
+    cache.read(str(csv_file), UserWithOptionalAge)
+    cache.read(str(csv_file), User, validate_header=False)
+
+    assert len(_snapshots(tmpdir.join("cache"))) == 3
+
+    with csv_file.open("a") as f:
+        f.write("User2,30\n")
+
+    assert len(cache.read(str(csv_file), User)) == 2
+
+
+def test_snapshot_keyed_by_content(create_csv, tmpdir):
+    csv_file = create_csv({"name": "User1", "age": 40})
+    cache = ParsedCache(str(tmpdir.join("cache")))
+
+    cache.read(str(csv_file), User, hash_content=True)
+    os.utime(str(csv_file), ns=(0, 0))
+    cache.read(str(csv_file), User, hash_content=True)
+
+    assert len(_snapshots(tmpdir.join("cache"))) == 1
+
+
+def test_least_recently_used_snapshots_are_evicted(create_csv, tmpdir):
+    first = create_csv({"name": "User1", "age": 40})
+    second = create_csv({"name": "User2", "age": 30})
+    cache = ParsedCache(str(tmpdir.join("cache")))
+
+    cache.read(str(first), User)
+    size = _snapshots(tmpdir.join("cache"))[0].size()
+    cache.max_bytes = size + 1
+
+    cache.read(str(second), User)
+
+    assert len(_snapshots(tmpdir.join("cache"))) == 1
+
+    cache.clear()
+    assert _snapshots(tmpdir.join("cache")) == []
+
+
+def test_invalid_max_bytes(tmpdir):
+    with pytest.raises(ValueError):
+        ParsedCache(str(tmpdir), max_bytes=0)
+
+
+def test_reader_from_path_uses_the_cache(create_csv, tmpdir):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": 30}])
+    cache = ParsedCache(str(tmpdir.join("cache")))
+
+    with DataclassReader.from_path(str(csv_file), User, cache=cache) as reader:
+        records = list(reader)
+
+    assert records == [User(name="User1", age=40), User(name="User2", age=30)]
+    assert len(_snapshots(tmpdir.join("cache"))) == 1
+
+    # Same size and modification time, but the ages can't be converted, so
+    # the records must come from the snapshot.
+    stat = os.stat(str(csv_file))
+    csv_file.write_binary(csv_file.read_binary().replace(b"40", b"xx"))
+    os.utime(str(csv_file), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with DataclassReader.from_path(str(csv_file), User, cache=cache) as reader:
+        assert list(reader) == records
@@ -0,0 +1,61 @@
+import pytest
+
+from dataclass_csv import DataclassReader, CsvValueError, categorical
+
+from .mocks import CategoricalOrder, OrderWithInternMetadata, Status
+
+
+def test_categorical_requires_field_names():
+    with pytest.raises(ValueError):
+        categorical()
+
+
+def test_categorical_strings_are_interned(create_csv):
+    csv_file = create_csv(
+        [
+            {"id": 1, "country": "Sweden", "status": "open"},
+            {"id": 2, "country": "Sweden", "status": "open"},
+            {"id": 3, "country": "Brazil", "status": "closed"},
+        ]
+    )
+
+    with csv_file.open() as f:
+        items = list(DataclassReader(f, CategoricalOrder))
+
+    assert items[0].country is items[1].country
+    assert items[2].country == "Brazil"
+    assert items[0].status is Status.OPEN
+    assert items[2].status is Status.CLOSED
+
+
+def test_intern_metadata(create_csv):
+    csv_file = create_csv(
+        [
+            {"id": 1000, "country": "Sweden", "amount": 1000},
+            {"id": 1000, "country": "Sweden", "amount": 1000},
+            {"id": 3, "country": "Brazil", "amount": ""},
+        ]
+    )
+
+    with csv_file.open() as f:
+        items = list(DataclassReader(f, OrderWithInternMetadata))
+
+    assert items[0].country is items[1].country
+    assert items[0].amount is items[1].amount
+    assert items[0].id is not items[1].id
+    assert items[2].amount == 0
+
+
+def test_categorical_invalid_value_keeps_line_number(create_csv):
+    csv_file = create_csv(
+        [
+            {"id": 1, "country": "Sweden", "amount": 1},
+            {"id": 2, "country": "Sweden", "amount": "x"},
+        ]
+    )
+
+    with csv_file.open() as f:
+        with pytest.raises(CsvValueError) as ex:
+            list(DataclassReader(f, OrderWithInternMetadata))
+
+    assert ex.value.line_number == 3
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from dataclass_csv.cli import _HyperLogLog, main
+
+
+def _users(count, invalid=()):
+    return [
+        {"name": f"User{i}", "age": "x" if i in invalid else i % 50}
+        for i in range(count)
+    ]
+
+
+def test_validate_with_workers(create_csv, capsys):
+    csv_file = create_csv(_users(500, invalid=(3, 250, 499)))
+
+    assert main(["validate", str(csv_file), "tests.mocks:User"]) == 1
+    single = capsys.readouterr().out
+
+    args = ["validate", str(csv_file), "tests.mocks:User", "--workers", "3"]
+    assert main(args) == 1
+    parallel = capsys.readouterr().out
+
+    assert parallel == single
+    assert f"{csv_file}:252: age:" in parallel
+    assert "500 row(s) checked, 3 invalid." in parallel
+
+
+def test_convert_to_jsonl(create_csv, tmpdir):
+    csv_file = create_csv(_users(3))
+    output = tmpdir.join("users.jsonl")
+
+    args = ["convert", str(csv_file), "tests.mocks:User", "--to", "jsonl"]
+    assert main(args + ["-o", str(output)]) == 0
+
+    records = [json.loads(x) for x in output.readlines()]
+    assert records == [{"name": f"User{i}", "age": i} for i in range(3)]
+
+
+def test_convert_dialect_with_workers(create_csv, tmpdir):
+    csv_file = create_csv(_users(300))
+    single, parallel = tmpdir.join("single.csv"), tmpdir.join("parallel.csv")
+
+    args = ["convert", str(csv_file), "tests.mocks:User", "--output-delimiter", ";"]
+    assert main(args + ["-o", str(single)]) == 0
+    assert main(args + ["-o", str(parallel), "--workers", "4"]) == 0
+
+    lines = single.read().splitlines()
+    assert lines[:2] == ["name;age", "User0;0"]
+    assert len(lines) == 301
+    assert parallel.read() == single.read()
+
+
+def test_stats(create_csv, capsys):
+    csv_file = create_csv(_users(200, invalid=(7,)))
+
+    assert main(["stats", str(csv_file), "tests.mocks:User", "--workers", "2"]) == 0
+
+    rows = [x.split() for x in capsys.readouterr().out.splitlines()]
+    assert rows[0] == ["field", "values", "nulls", "errors", "min", "max", "distinct"]
+    assert rows[1][:6] == ["name", "200", "0", "0", "User0", "User99"]
+    assert rows[2][:6] == ["age", "199", "0", "1", "0", "49"]
+    assert 190 <= int(rows[1][6].lstrip("~")) <= 210
+    assert 48 <= int(rows[2][6].lstrip("~")) <= 52
+
+
+def test_profile(create_csv, capsys):
+    csv_file = create_csv(_users(100))
+
+    assert main(["profile", str(csv_file), "tests.mocks:User", "--rows", "10"]) == 0
+
+    output = capsys.readouterr().out
+    assert output.startswith("10 row(s) in ")
+    assert "field age" in output
+    assert "instance creation" in output
+
+
+def test_convert_invalid_row(create_csv, capsys):
+    csv_file = create_csv(_users(3, invalid=(1,)))
+
+    assert main(["convert", str(csv_file), "tests.mocks:User"]) == 2
+    assert "[CSV Line number: 3]" in capsys.readouterr().err
+
+    csv_file = create_csv(_users(300, invalid=(250,)))
+    args = ["convert", str(csv_file), "tests.mocks:User", "--workers", "3"]
+
+    assert main(args) == 2
+    assert capsys.readouterr().err.endswith("[CSV Line number: 252]\n")
+
+
+@pytest.mark.parametrize("command", ["convert", "profile"])
+def test_missing_column(tmpdir, capsys, command):
+    csv_file = tmpdir.join("users.csv")
+    csv_file.write("name\nUser1\n")
+
+    assert main([command, str(csv_file), "tests.mocks:User"]) == 2
+    assert capsys.readouterr().err == (
+        "dataclass-csv: error: "
+        "The value for the column `age` is missing in the CSV file\n"
+    )
+
+
+def test_hyperloglog_estimate():
+    first, second = _HyperLogLog(), _HyperLogLog()
+    for i in range(50_000):
+        (first if i % 2 else second).add(i)
+
+    first.merge(second)
+
+    assert abs(first.estimate() - 50_000) < 2_500
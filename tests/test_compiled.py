@@ -0,0 +1,9 @@
+import os
+
+from dataclass_csv import is_compiled
+
+
+def test_expected_implementation_is_used():
+    # The compiled CI job sets DATACLASS_CSV_COMPILED=1 after building the
+    # modules in place, the other jobs run against the Python sources.
+    assert is_compiled() == (os.environ.get("DATACLASS_CSV_COMPILED") == "1")
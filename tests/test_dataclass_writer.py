@@ -1,8 +1,10 @@
+from datetime import datetime
+
 import pytest
 
 from dataclass_csv import DataclassWriter, DataclassReader
 
-from .mocks import User, SimpleUser, NonDataclassUser
+from .mocks import User, SimpleUser, NonDataclassUser, UserWithDateFormatDecorator
 
 
 def test_create_csv_file(tmpdir_factory):
@@ -74,3 +76,16 @@ def test_with_iterable(tmpdir_factory):
 
         assert len(saved_users) > 0
         assert saved_users[0].name == users_dict["test"].name
+
+
+def test_writer_uses_the_dateformat(tmpdir_factory):
+    tempfile = tmpdir_factory.mktemp("data").join("user.csv")
+    users = [UserWithDateFormatDecorator("User1", datetime(2019, 5, 1))]
+
+    with tempfile.open("w") as f:
+        DataclassWriter(f, users, UserWithDateFormatDecorator).write()
+
+    with tempfile.open() as f:
+        assert f.read().splitlines() == ["name,create_date", "User1,2019-05-01"]
+        f.seek(0)
+        assert list(DataclassReader(f, UserWithDateFormatDecorator)) == users
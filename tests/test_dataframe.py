@@ -0,0 +1,147 @@
+import io
+
+from datetime import datetime
+
+import pytest
+
+from dataclass_csv import CsvValueError, DataclassReader, DataclassWriter
+
+from .mocks import (
+    CategoricalOrder,
+    EuropeanProduct,
+    Status,
+    Transaction,
+    User,
+    UserWithDateFormatDecorator,
+    UserWithoutDateFormatDecorator,
+    UserWithSSN,
+)
+
+pd = pytest.importorskip("pandas")
+
+from dataclass_csv.dataframe import dataframe_records, read_dataframe  # noqa: E402
+
+
+def test_read_dataframe_dtypes():
+    data = "id,amount,customer_id\n1,10.5,7\n2,3,\n"
+    df = read_dataframe(io.StringIO(data), Transaction)
+
+    assert [str(x) for x in df.dtypes] == ["Int64", "float64", "Int64"]
+    assert df["customer_id"].isna().tolist() == [False, True]
+
+    data = 'name,price,stock,available\nChair,1.234,5,ja\nTable,"99,5",1.000,n\n'
+    df = read_dataframe(io.StringIO(data), EuropeanProduct)
+
+    assert df["price"].tolist() == [1234.0, 99.5]
+    assert df["stock"].tolist() == [5, 1000]
+    assert str(df["available"].dtype) == "boolean"
+    assert df["available"].tolist() == [True, False]
+    assert df["discounted"].tolist() == [False, False]
+
+
+def test_read_dataframe_dates_and_categories():
+    data = "name,create_date\nUser1,2018-12-09\n"
+    df = read_dataframe(io.StringIO(data), UserWithDateFormatDecorator)
+
+    assert df["create_date"].tolist() == [pd.Timestamp(2018, 12, 9)]
+
+    data = "id,country,status\n1,BR,open\n2,BR,closed\n"
+    df = read_dataframe(io.StringIO(data), CategoricalOrder)
+
+    assert str(df["country"].dtype) == "category"
+    assert df["status"].tolist() == [Status.OPEN, Status.CLOSED]
+
+
+def test_read_dataframe_line_numbers():
+    data = 'name,age\n"User\n1",40\n\nUser2,x\n'
+
+    with pytest.raises(CsvValueError, match=r"\[CSV Line number: 5\]"):
+        read_dataframe(io.StringIO(data), User)
+
+    data = "name,age\nUser1,40\nUser2,30\nUser3,\n"
+    chunks = read_dataframe(io.StringIO(data), User, chunksize=2)
+
+    assert len(next(chunks)) == 2
+    with pytest.raises(CsvValueError, match=r"\[CSV Line number: 4\]"):
+        next(chunks)
+
+
+def test_read_dataframe_same_errors_as_reader():
+    for data, klass in [
+        ("name,age\n  ,40\n", User),
+        ("name,ssn\nUser1,123\n", UserWithSSN),
+        ("name,age\nUser1,40\nUser2,1.5\n", User),
+    ]:
+        with pytest.raises(CsvValueError) as expected:
+            list(DataclassReader(io.StringIO(data), klass))
+
+        with pytest.raises(CsvValueError) as ex:
+            read_dataframe(io.StringIO(data), klass)
+
+        assert str(ex.value) == str(expected.value)
+
+    data = "name,create_date\nUser1,2018-12-09\n"
+
+    with pytest.raises(AttributeError, match="Date format not specified"):
+        read_dataframe(io.StringIO(data), UserWithoutDateFormatDecorator)
+
+    with pytest.raises(KeyError):
+        read_dataframe(io.StringIO("name\nUser1\n"), User)
+
+
+def assert_same_as_reader(data, klass, column):
+    try:
+        records = list(DataclassReader(io.StringIO(data), klass))
+    except CsvValueError as expected:
+        with pytest.raises(CsvValueError) as ex:
+            read_dataframe(io.StringIO(data), klass)
+        assert str(ex.value) == str(expected)
+        return
+
+    df = read_dataframe(io.StringIO(data), klass)
+    assert repr(df[column].tolist()) == repr([getattr(x, column) for x in records])
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["9007199254740993", " 42 ", "+7", "1_000", "1e3", "1.0", "x", "1" * 20],
+)
+def test_read_dataframe_ints_like_reader(value):
+    assert_same_as_reader(f"id,amount\n1,1\n{value},1\n", Transaction, "id")
+
+
+@pytest.mark.parametrize(
+    "value", ["nan", "inf", "-Infinity", "1e3", "0.1", "1_0.5", "x", "1.5.", "1" * 20]
+)
+def test_read_dataframe_floats_like_reader(value):
+    assert_same_as_reader(f"id,amount\n1,1\n2,{value}\n", Transaction, "amount")
+
+
+def test_read_dataframe_exact_ints_with_empty_values():
+    data = "id,amount,customer_id\n1,1,9007199254740993\n2,1,\n"
+    df = read_dataframe(io.StringIO(data), Transaction)
+
+    assert str(df["customer_id"].dtype) == "Int64"
+    assert df["customer_id"][0] == 9007199254740993
+    assert df["customer_id"].isna().tolist() == [False, True]
+
+
+def test_dataframe_round_trip():
+    users = [
+        UserWithDateFormatDecorator("User1", datetime(2018, 12, 9)),
+        UserWithDateFormatDecorator("User2", datetime(2019, 1, 31)),
+    ]
+    data = "name,create_date\nUser1,2018-12-09\nUser2,2019-01-31\n"
+    df = read_dataframe(io.StringIO(data), UserWithDateFormatDecorator)
+
+    assert list(dataframe_records(df, UserWithDateFormatDecorator)) == users
+
+    df = pd.DataFrame({"id": [1, 2], "amount": [1.5, 2.0]})
+    f = io.StringIO()
+    DataclassWriter.from_dataframe(f, df, Transaction).write()
+
+    assert f.getvalue().splitlines() == [
+        "id,amount,customer_id",
+        "1,1.5,",
+        "2,2.0,",
+    ]
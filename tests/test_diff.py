@@ -0,0 +1,119 @@
+import io
+
+import pytest
+
+from dataclass_csv import Change, CsvValueError, diff, write_changes
+
+from .mocks import Sale, Transaction
+
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.fixture()
+def files(tmp_path):
+    old = write(
+        tmp_path / "old.csv",
+        "id,amount,customer_id\n1,10.0,1\n2,20.0,2\n3,30.0,\n5,50,5\n",
+    )
+    new = write(
+        tmp_path / "new.csv",
+        "id,amount,customer_id\n1,10.00,1\n3,31,7\n4,40,4\n5,50.0,5\n",
+    )
+    return old, new
+
+
+EXPECTED = [
+    Change(2, "removed"),
+    Change(3, "changed", "amount", 30.0, 31.0),
+    Change(3, "changed", "customer_id", None, 7),
+    Change(4, "added"),
+]
+
+
+def sort_key(change):
+    return (change.key, change.field or "")
+
+
+@pytest.mark.parametrize("options", [{}, {"presorted": True}])
+def test_diff(files, options):
+    changes = list(diff(*files, Transaction, key="id", **options))
+
+    assert sorted(changes, key=sort_key) == EXPECTED
+
+
+def test_diff_with_partitions(files, tmp_path):
+    changes = diff(*files, Transaction, key="id", buffer_size=2, partitions=3)
+
+    assert sorted(changes, key=sort_key) == EXPECTED
+
+
+def test_diff_presorted_checks_the_order(tmp_path):
+    old = write(tmp_path / "old.csv", "id,amount\n2,1\n1,1\n")
+    new = write(tmp_path / "new.csv", "id,amount\n1,1\n")
+
+    with pytest.raises(CsvValueError, match=r"not sorted.*\[CSV Line number: 3\]"):
+        list(diff(old, new, Transaction, key="id", presorted=True))
+
+
+@pytest.mark.parametrize(
+    "key, message",
+    [
+        ("id", r"repeated.*\[CSV Line number: 3\]"),
+        ("customer_id", r"empty.*\[CSV Line number: 2\]"),
+        (["id", "customer_id"], r"empty.*\[CSV Line number: 2\]"),
+    ],
+)
+@pytest.mark.parametrize(
+    "options", [{"presorted": True}, {}, {"buffer_size": 1, "partitions": 2}]
+)
+def test_diff_checks_the_keys(tmp_path, key, message, options):
+    old = write(tmp_path / "old.csv", "id,amount,customer_id\n1,1,\n1,2,3\n")
+    new = write(tmp_path / "new.csv", "id,amount,customer_id\n")
+
+    with pytest.raises(CsvValueError, match=message):
+        list(diff(old, new, Transaction, key=key, **options))
+
+    with pytest.raises(CsvValueError, match=message):
+        list(diff(new, old, Transaction, key=key, **options))
+
+
+def test_diff_with_partitions_and_shared_objects(tmp_path):
+    header = "country,product,quantity,price\n"
+    rows = [f"{x},{x},{i},1\n" for i, x in enumerate("abcdef" * 3)]
+    old = write(tmp_path / "old.csv", header + "".join(rows))
+    new = write(tmp_path / "new.csv", header + "".join(rows[1:]))
+
+    changes = diff(old, new, Sale, key="quantity", buffer_size=2, partitions=3)
+
+    assert list(changes) == [Change(0, "removed")]
+
+
+def test_diff_with_composite_key_can_be_written(tmp_path):
+    header = "country,product,quantity,price\n"
+    old = write(tmp_path / "old.csv", header + "SE,chair,1,10\nBR,chair,2,10\n")
+    new = write(tmp_path / "new.csv", header + "SE,chair,1,12\n")
+
+    changes = list(diff(old, new, Sale, key=["country", "product"]))
+
+    assert changes == [
+        Change(("SE", "chair"), "changed", "price", 10.0, 12.0),
+        Change(("BR", "chair"), "removed"),
+    ]
+
+    f = io.StringIO()
+    write_changes(f, changes, key=["country", "product"])
+    assert f.getvalue().splitlines() == [
+        "country,product,change,field,old_value,new_value",
+        "SE,chair,changed,price,10.0,12.0",
+        "BR,chair,removed,,,",
+    ]
+
+    f = io.StringIO()
+    write_changes(f, changes[:1], key="country")
+    assert f.getvalue().splitlines()[1] == "\"('SE', 'chair')\",changed,price,10.0,12.0"
+
+    with pytest.raises(ValueError):
+        diff(old, new, Sale, key="unknown")
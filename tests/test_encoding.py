@@ -0,0 +1,62 @@
+import codecs
+import io
+
+import pytest
+
+from dataclass_csv import DataclassReader
+from dataclass_csv.encoding import DecodedLines, detect_encoding
+
+from .mocks import User
+
+CONTENT = "name,age\r\nJosé,40\r\nÅsa,32\r\n"
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (codecs.BOM_UTF8 + CONTENT.encode("utf-8"), "utf-8-sig"),
+        (CONTENT.encode("utf-8"), "utf-8"),
+        (CONTENT.encode("cp1252"), "cp1252"),
+        (CONTENT.encode("utf-16"), "utf-16"),
+        (CONTENT.encode("utf-16-le"), "utf-16-le"),
+        (CONTENT.encode("utf-16-be"), "utf-16-be"),
+        (CONTENT.encode("utf-32"), "utf-32"),
+    ],
+)
+def test_from_bytes_detects_the_encoding(data, expected):
+    reader = DataclassReader.from_bytes(data, User)
+
+    assert reader.encoding == expected
+    assert list(reader) == [User("José", 40), User("Åsa", 32)]
+
+
+def test_detect_encoding_keeps_the_given_encoding():
+    assert detect_encoding(codecs.BOM_UTF8 + b"a", "utf8") == "utf-8-sig"
+    assert detect_encoding(b"a", "latin-1") == "latin-1"
+
+
+def test_decoded_lines_across_blocks():
+    text = 'a,b\r\n"x\ry",é\n\nlast'
+    data = text.encode("utf-8")
+
+    for block_size in range(1, len(data) + 1):
+        lines = DecodedLines(io.BytesIO(data), "utf-8", block_size)
+        assert list(lines) == ["a,b\r\n", '"x\r', 'y",é\n', "\n", "last"]
+
+
+def test_from_path_sniffs_the_dialect(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_bytes(codecs.BOM_UTF8 + b"name;age\nAna;30\nBob;25\n")
+
+    with DataclassReader.from_path(str(path), User, sniff=True) as reader:
+        assert list(reader) == [User("Ana", 30), User("Bob", 25)]
+
+    assert reader._file.closed
+
+
+def test_zero_bytes_in_utf8_files_are_not_utf16():
+    data = CONTENT.encode("utf-8") + b"User\x00,1\r\n"
+
+    assert detect_encoding(data) == "utf-8"
+    assert detect_encoding(data[:10] + b"\x00" + data[10:]) == "utf-8"
+    assert detect_encoding("é".encode("utf-16-le")) == "utf-16-le"
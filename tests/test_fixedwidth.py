@@ -0,0 +1,89 @@
+import io
+
+from datetime import date
+
+import pytest
+
+from dataclass_csv import (
+    CsvValueError,
+    FixedWidthDataclassReader,
+    FixedWidthDataclassWriter,
+)
+
+from .mocks import Account, Ledger, User
+
+LINES = (
+    "     1Alice     20200131    150.25\n"
+    "    22Bob       20210704\n"
+    "\n"
+    "   333Christophe20221231      -3.5\n"
+)
+
+
+def test_read_fixed_width():
+    reader = FixedWidthDataclassReader(io.StringIO(LINES), Account)
+
+    assert list(reader) == [
+        Account(1, "Alice", date(2020, 1, 31), 150.25),
+        Account(22, "Bob", date(2021, 7, 4)),
+        Account(333, "Christophe", date(2022, 12, 31), -3.5),
+    ]
+
+
+def test_read_fixed_width_skip_lines():
+    data = "ID    NAME      OPENED        BALANCE\n" + LINES
+    reader = FixedWidthDataclassReader(io.StringIO(data), Account, skip_lines=1)
+
+    assert next(reader).id == 1
+    assert reader.line_num == 2
+    assert [x.id for x in reader] == [22, 333]
+
+
+def test_read_fixed_width_errors():
+    data = "    1xAlice     20200131\n"
+
+    with pytest.raises(CsvValueError, match=r"\[CSV Line number: 1\]"):
+        list(FixedWidthDataclassReader(io.StringIO(data), Account))
+
+    data = "     1          20200131\n"
+
+    with pytest.raises(CsvValueError, match="The field `name` is required."):
+        list(FixedWidthDataclassReader(io.StringIO(data), Account))
+
+
+def test_fixed_width_layout_required():
+    with pytest.raises(ValueError, match="needs a `width` or `slice` metadata"):
+        FixedWidthDataclassReader(io.StringIO(LINES), User)
+
+
+def test_write_fixed_width():
+    accounts = [
+        Account(1, "Alice", date(2020, 1, 31), 150.25),
+        Account(22, "Bob", date(2021, 7, 4)),
+        Account(333, "Christophe Long", date(2022, 12, 31), -3.5),
+    ]
+    f = io.StringIO()
+
+    FixedWidthDataclassWriter(f, accounts, Account).write()
+
+    assert f.getvalue() == (
+        "     1Alice     20200131    150.25\n"
+        "    22Bob       20210704          \n"
+        "   333Christophe20221231      -3.5\n"
+    )
+
+    f.seek(0)
+    accounts[2].name = "Christophe"
+    assert list(FixedWidthDataclassReader(f, Account)) == accounts
+
+
+def test_fixed_width_padding_side_and_init_false_fields():
+    ledgers = [Ledger("  A-1", 1.5), Ledger("  ", -20.0)]
+    f = io.StringIO()
+
+    FixedWidthDataclassWriter(f, ledgers, Ledger, fillchar="*").write()
+
+    assert f.getvalue() == "  A-1***1*****1.5\n  ******1***-20.0\n"
+
+    f.seek(0)
+    assert list(FixedWidthDataclassReader(f, Ledger, fillchar="*")) == ledgers
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import threading
+
+from dataclass_csv import afollow, follow
+
+from .mocks import User
+
+
+def append(path, text):
+    with open(path, "a", newline="") as f:
+        f.write(text)
+
+
+def test_follow_yields_appended_records(tmp_path):
+    path = str(tmp_path / "users.csv")
+    append(path, "name,age\nAna,30\nBob,2")
+
+    items = follow(path, User, poll_interval=0.01, timeout=0.05)
+
+    assert next(items) == User("Ana", 30)
+
+    append(path, '5\n"Carl\nJr",40\n"Dan')
+    assert next(items) == User("Bob", 25)
+    assert next(items) == User("Carl\nJr", 40)
+
+    append(path, '",1\n')
+    assert list(items) == [User("Dan", 1)]
+
+
+def test_follow_restarts_after_truncation_and_rotation(tmp_path):
+    path = str(tmp_path / "users.csv")
+    append(path, "name,age\nAna,30\nBob,25\n")
+
+    items = follow(path, User, poll_interval=0.01, timeout=0.05)
+    assert [next(items), next(items)] == [User("Ana", 30), User("Bob", 25)]
+
+    with open(path, "w") as f:
+        f.write("name,age\nEve,1\n")
+    assert next(items) == User("Eve", 1)
+
+    rotated = str(tmp_path / "users.new.csv")
+    with open(rotated, "w") as f:
+        f.write("name,age\nZoe,99\n")
+    os.replace(rotated, path)
+
+    assert list(items) == [User("Zoe", 99)]
+
+
+def test_follow_keeps_the_header_of_a_file_rotated_while_empty(tmp_path):
+    path = str(tmp_path / "users.csv")
+    append(path, "")
+
+    def rotate():
+        rotated = str(tmp_path / "users.new.csv")
+        with open(rotated, "w") as f:
+            f.write("name,age\nZoe,99\nAna,30\n")
+        os.replace(rotated, path)
+
+    timer = threading.Timer(0.1, rotate)
+    timer.start()
+
+    try:
+        items = follow(path, User, poll_interval=0.01, timeout=2)
+        assert [next(items), next(items)] == [User("Zoe", 99), User("Ana", 30)]
+        items.close()
+    finally:
+        timer.cancel()
+
+
+def test_afollow(tmp_path):
+    path = str(tmp_path / "users.csv")
+    append(path, "name,age\nAna,30\n")
+
+    async def read():
+        items = []
+        async for item in afollow(path, User, poll_interval=0.01, timeout=0.2):
+            items.append(item)
+            if len(items) == 1:
+                append(path, "Bob,25\n")
+        return items
+
+    assert asyncio.run(read()) == [User("Ana", 30), User("Bob", 25)]
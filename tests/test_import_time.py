@@ -0,0 +1,74 @@
+import dataclasses
+import gc
+import io
+import os
+import subprocess
+import sys
+
+import dataclass_csv
+
+from dataclass_csv import DataclassReader
+from dataclass_csv.schema import _schemas, get_schema
+
+from .mocks import User
+
+# Modules of optional features that must not be imported with the package.
+HEAVY_MODULES = ("asyncio", "ctypes", "sqlite3", "numpy", "pyarrow", "concurrent")
+
+
+def _import_times():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import dataclass_csv"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_does_not_load_optional_modules(record_property):
+    times = _import_times()
+
+    loaded = [x for x in times if x.split(".")[0] in HEAVY_MODULES]
+
+    assert loaded == []
+    record_property("import_time_us", times["dataclass_csv"])
+
+
+def test_lazy_exports():
+    for name in dataclass_csv.__all__:
+        assert getattr(dataclass_csv, name) is not None
+
+    from dataclass_csv.sqlite import to_sqlite
+
+    assert dataclass_csv.to_sqlite is to_sqlite
+    assert "to_sqlite" in dir(dataclass_csv)
+
+
+def test_schema_is_shared_by_readers():
+    first = DataclassReader(io.StringIO("name,age\n"), User)
+    second = DataclassReader(io.StringIO("name,age\n"), User)
+
+    assert first._init_fields is second._init_fields
+    assert first.type_hints is get_schema(User).type_hints
+
+
+def test_schema_cache_does_not_keep_classes_alive():
+    klass = dataclasses.make_dataclass("Temporary", [("name", str)])
+    list(DataclassReader(io.StringIO("name\nx\n"), klass))
+
+    assert klass in _schemas
+
+    del klass
+    gc.collect()
+
+    assert not any(x.__name__ == "Temporary" for x in _schemas.keys())
@@ -0,0 +1,135 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from dataclass_csv import (
+    DataclassReader,
+    IndexedDataclassReader,
+    CsvValueError,
+    build_index,
+)
+
+from .mocks import CategoricalOrder, Customer, Status, User
+
+
+CUSTOMERS = [
+    {"id": 10, "name": "Elsa"},
+    {"id": 2, "name": "Astor\nwith a line break"},
+    {"id": 7, "name": "Edit"},
+    {"id": 3, "name": "Ella"},
+]
+
+
+def test_get_returns_the_same_records_as_the_reader(create_csv):
+    csv_file = create_csv(CUSTOMERS)
+
+    with csv_file.open() as f:
+        expected = {x.id: x for x in DataclassReader(f, Customer)}
+
+    with IndexedDataclassReader(str(csv_file), Customer) as customers:
+        assert len(customers) == 4
+        assert 7 in customers
+        assert 8 not in customers
+
+        for key, customer in expected.items():
+            assert customers.get(key) == customer
+
+        with pytest.raises(KeyError):
+            customers.get(1)
+
+
+def test_range(create_csv):
+    csv_file = create_csv(CUSTOMERS)
+
+    with IndexedDataclassReader(str(csv_file), Customer) as customers:
+        assert [x.id for x in customers.range(3, 10)] == [3, 7]
+        assert [x.id for x in customers.range(0, 100)] == [2, 3, 7, 10]
+
+
+def test_build_index_writes_a_sidecar_file(create_csv):
+    csv_file = create_csv(CUSTOMERS)
+
+    index_path = build_index(str(csv_file), Customer, key="id")
+
+    assert index_path == str(csv_file) + ".idx"
+    assert os.path.exists(index_path)
+
+
+def test_index_is_rebuilt_when_the_file_changes(create_csv):
+    csv_file = create_csv(CUSTOMERS)
+    build_index(str(csv_file), Customer)
+
+    with csv_file.open("a") as f:
+        f.write("42,Ada\n")
+
+    with IndexedDataclassReader(str(csv_file), Customer) as customers:
+        assert customers.get(42).name == "Ada"
+
+
+def test_errors_have_the_original_line_number(create_csv):
+    csv_file = create_csv(
+        [{"name": "User1", "age": 1}, {"name": "User2", "age": 2}],
+    )
+
+    with csv_file.open("a") as f:
+        f.write(",3\n")
+
+    with IndexedDataclassReader(str(csv_file), User, key="age") as users:
+        with pytest.raises(CsvValueError) as ex:
+            users.get(3)
+
+    assert ex.value.line_number == 4
+
+
+def test_build_index_unknown_key(create_csv):
+    csv_file = create_csv(CUSTOMERS)
+
+    with pytest.raises(ValueError):
+        build_index(str(csv_file), Customer, key="email")
+
+
+def test_index_is_not_pickled(create_csv):
+    csv_file = create_csv(CUSTOMERS)
+    index_path = build_index(str(csv_file), Customer)
+
+    with open(index_path, encoding="utf-8") as f:
+        assert json.load(f)["keys"] == [2, 3, 7, 10]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pickle.dumps({"version": 2}),
+        b"\x80\x04garbage",
+        b'{"version": 3}',
+        b"[1, 2, 3]",
+        "é".encode("cp1252"),
+    ],
+)
+def test_invalid_index_files_are_rebuilt(create_csv, content):
+    csv_file = create_csv(CUSTOMERS)
+
+    with open(str(csv_file) + ".idx", "wb") as f:
+        f.write(content)
+
+    with IndexedDataclassReader(str(csv_file), Customer) as customers:
+        assert customers.get(7).name == "Edit"
+
+
+def test_keys_of_other_types(create_csv):
+    csv_file = create_csv(
+        [
+            {"id": 1, "country": "BR", "status": "open"},
+            {"id": 2, "country": "SE", "status": "closed"},
+        ]
+    )
+
+    with IndexedDataclassReader(str(csv_file), CategoricalOrder, key="status") as o:
+        assert o.get(Status.OPEN).id == 1
+        assert [x.id for x in o.range(Status.CLOSED, Status.OPEN)] == [2]
+
+    # The keys stored as text are converted again when the index is loaded.
+    with IndexedDataclassReader(str(csv_file), CategoricalOrder, key="status") as o:
+        assert Status.CLOSED in o
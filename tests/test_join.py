@@ -0,0 +1,81 @@
+import pytest
+
+from dataclass_csv import DataclassReader, join
+
+from .mocks import Customer, Transaction
+
+
+CUSTOMERS = [
+    {"id": 1, "name": "Elsa"},
+    {"id": 2, "name": "Astor"},
+    {"id": 10, "name": "Edit"},
+]
+
+TRANSACTIONS = [
+    {"id": 1, "customer_id": "10", "amount": 1.5},
+    {"id": 2, "customer_id": "02", "amount": 2.0},
+    {"id": 3, "customer_id": "3", "amount": 3.0},
+    {"id": 4, "customer_id": "", "amount": 4.0},
+    {"id": 5, "customer_id": "2", "amount": 5.0},
+]
+
+
+def _join(create_csv, how, buffer_size):
+    customers_file = create_csv(CUSTOMERS, filename="customers.csv")
+    transactions_file = create_csv(TRANSACTIONS, filename="transactions.csv")
+
+    with transactions_file.open() as t, customers_file.open() as c:
+        pairs = join(
+            DataclassReader(t, Transaction),
+            DataclassReader(c, Customer),
+            on=("customer_id", "id"),
+            how=how,
+            buffer_size=buffer_size,
+        )
+        return [(x.id, y.name if y else None) for x, y in pairs]
+
+
+@pytest.mark.parametrize("buffer_size", [10, 1])
+def test_inner_join(create_csv, buffer_size):
+    result = _join(create_csv, "inner", buffer_size)
+
+    assert sorted(result) == [(1, "Edit"), (2, "Astor"), (5, "Astor")]
+
+
+@pytest.mark.parametrize("buffer_size", [10, 1])
+def test_left_join(create_csv, buffer_size):
+    result = _join(create_csv, "left", buffer_size)
+
+    assert sorted(result, key=lambda x: x[0]) == [
+        (1, "Edit"),
+        (2, "Astor"),
+        (3, None),
+        (4, None),
+        (5, "Astor"),
+    ]
+
+
+def test_hash_join_keeps_the_left_order(create_csv):
+    result = _join(create_csv, "left", 10)
+
+    assert [x[0] for x in result] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("buffer_size", [10, 1])
+def test_join_with_duplicated_keys(buffer_size):
+    left = [Customer(id=x, name=f"L{x}") for x in [2, 1, 2]]
+    right = [Customer(id=x, name=f"R{i}") for i, x in enumerate([2, 3, 2])]
+
+    result = join(left, right, on="id", buffer_size=buffer_size)
+
+    assert sorted((x.name, y.name) for x, y in result) == [
+        ("L2", "R0"),
+        ("L2", "R0"),
+        ("L2", "R2"),
+        ("L2", "R2"),
+    ]
+
+
+def test_join_invalid_how():
+    with pytest.raises(ValueError):
+        join([], [], on="id", how="outer")
@@ -0,0 +1,167 @@
+import io
+import pickle
+
+from datetime import datetime
+
+import pytest
+
+from dataclass_csv import (
+    CsvValueError,
+    JsonLinesDataclassReader,
+    JsonLinesDataclassWriter,
+    RecordConverter,
+)
+
+from .mocks import (
+    DataclassWithBooleanValueNoneDefault,
+    Reading,
+    Transaction,
+    User,
+    UserWithDateFormatDecorator,
+)
+
+
+def test_converter_mapping():
+    converter = RecordConverter(User)
+
+    assert converter.convert({"name": "User1", "age": "40"}) == User("User1", 40)
+    assert converter.convert({"name": "User1", "age": 0}) == User("User1", 0)
+
+
+def test_converter_mapped_key():
+    converter = RecordConverter(User)
+    converter.map("years").to("age")
+
+    assert converter.convert({"name": "User1", "years": "7"}) == User("User1", 7)
+
+
+def test_converter_sequence():
+    converter = RecordConverter(User, positional=True)
+
+    assert converter.convert(["User1", "40"]) == User("User1", 40)
+
+
+def test_converter_errors():
+    converter = RecordConverter(User)
+
+    with pytest.raises(CsvValueError, match=r"\[CSV Line number: 5\]") as ex:
+        converter.convert({"name": "User1", "age": "x"}, line_number=5)
+
+    error = pickle.loads(pickle.dumps(ex.value))
+    assert (str(error), error.line_number) == (str(ex.value), 5)
+
+    with pytest.raises(CsvValueError) as ex:
+        converter.convert({"name": "", "age": "1"})
+
+    assert str(ex.value) == "The field `name` is required."
+
+
+def test_read_jsonlines():
+    data = '{"name": "User1", "age": 40}\n\n{"name": "User2", "age": "30"}\n'
+    reader = JsonLinesDataclassReader(io.StringIO(data), User, batch_size=1)
+
+    assert list(reader) == [User("User1", 40), User("User2", 30)]
+    assert reader.line_num == 3
+
+
+def test_read_jsonlines_json_values():
+    data = '{"id": 1, "amount": 0, "customer_id": null}\n{"id": 2, "amount": 1.5}\n'
+    reader = JsonLinesDataclassReader(io.StringIO(data), Transaction)
+
+    assert list(reader) == [Transaction(1, 0.0), Transaction(2, 1.5)]
+
+    data = '{"boolValue": false}\n{"boolValue": "yes"}\n'
+    reader = JsonLinesDataclassReader(
+        io.StringIO(data), DataclassWithBooleanValueNoneDefault
+    )
+
+    assert [x.boolValue for x in reader] == [False, True]
+
+
+def test_read_jsonlines_errors():
+    data = '{"name": "User1", "age": 40}\n{"name": "User2",\n'
+
+    with pytest.raises(CsvValueError, match=r"\[CSV Line number: 2\]"):
+        list(JsonLinesDataclassReader(io.StringIO(data), User))
+
+    data = '{"name": "User1", "age": 40}\n["User2", 30]\n'
+
+    with pytest.raises(CsvValueError, match="not a JSON object"):
+        list(JsonLinesDataclassReader(io.StringIO(data), User))
+
+
+@pytest.mark.parametrize(
+    "data, positional",
+    [
+        ('["a", 1],["b", 2]\n["c"\n3]\n', True),
+        (
+            '{"name": "a", "age": 1},{"name": "b", "age": 2}\n{"name": "c"\n"age": 3}\n',
+            False,
+        ),
+    ],
+)
+def test_read_jsonlines_one_value_per_line(data, positional):
+    reader = JsonLinesDataclassReader(io.StringIO(data), User, positional=positional)
+
+    with pytest.raises(CsvValueError, match=r"\[CSV Line number: 1\]"):
+        list(reader)
+
+
+def test_read_jsonlines_next():
+    data = '{"name": "User1", "age": 40}\n{"name": "User2", "age": 30}\n'
+    reader = JsonLinesDataclassReader(io.StringIO(data), User)
+
+    assert next(reader) == User("User1", 40)
+    assert reader.line_num == 1
+    assert list(reader) == [User("User2", 30)]
+
+    with pytest.raises(StopIteration):
+        next(reader)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '{"name": "User1", "age": 1.9}',
+        '{"name": "User1", "age": true}',
+        '{"name": "User1", "age": [1]}',
+        '{"name": ["User1"], "age": 1}',
+        '{"name": {"first": "User1"}, "age": 1}',
+    ],
+)
+def test_read_jsonlines_rejects_values_changed_by_the_conversion(line):
+    reader = JsonLinesDataclassReader(io.StringIO(line + "\n"), User)
+
+    with pytest.raises(CsvValueError, match=r"but received a value of type"):
+        list(reader)
+
+
+def test_read_jsonlines_integral_floats():
+    data = '{"name": "User1", "age": 2.0}\n{"name": 7, "age": 3}\n'
+
+    assert list(JsonLinesDataclassReader(io.StringIO(data), User)) == [
+        User("User1", 2),
+        User("7", 3),
+    ]
+
+
+def test_jsonlines_round_trip():
+    users = [
+        UserWithDateFormatDecorator("User1", datetime(2018, 12, 9)),
+        UserWithDateFormatDecorator("User2", datetime(2019, 1, 31)),
+    ]
+    f = io.StringIO()
+
+    JsonLinesDataclassWriter(f, users, UserWithDateFormatDecorator).write()
+
+    assert f.getvalue().splitlines()[0] == '{"name":"User1","create_date":"2018-12-09"}'
+
+    f.seek(0)
+    assert list(JsonLinesDataclassReader(f, UserWithDateFormatDecorator)) == users
+
+
+def test_jsonlines_writer_wrong_type():
+    f = io.StringIO()
+
+    with pytest.raises(TypeError):
+        JsonLinesDataclassWriter(f, [Reading("a", 1.0)], User).write()
@@ -0,0 +1,149 @@
+import dataclasses
+import pickle
+import sys
+
+import pytest
+
+from dataclass_csv import DataclassReader, CsvValueError
+
+from .mocks import (
+    User,
+    UserWithDateFormatDecorator,
+    UserWithInitFalseAndDefaultValue,
+    UserWithOptionalEmail,
+)
+
+
+def test_lazy_rows_are_instances_of_the_dataclass(create_csv):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": 30}])
+
+    with csv_file.open() as f:
+        items = list(DataclassReader(f, User, lazy=True))
+
+    assert all(isinstance(x, User) for x in items)
+    assert dataclasses.is_dataclass(items[0])
+    assert items[0].name == "User1"
+    assert items[1].age == 30
+
+
+def test_lazy_fields_are_converted_on_first_access(create_csv):
+    csv_file = create_csv({"name": "Test", "create_date": "2018-12-09"})
+
+    with csv_file.open() as f:
+        user = next(DataclassReader(f, UserWithDateFormatDecorator, lazy=True))
+
+    assert "create_date" not in user.__dict__
+    create_date = user.create_date
+    assert create_date.year == 2018
+    assert user.__dict__["create_date"] is create_date
+
+
+def test_lazy_errors_have_the_line_number(create_csv):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": "x"}])
+
+    with csv_file.open() as f:
+        items = list(DataclassReader(f, User, lazy=True))
+
+    assert items[1].name == "User2"
+    with pytest.raises(CsvValueError) as ex:
+        items[1].age
+    assert ex.value.line_number == 3
+
+
+def test_lazy_rows_asdict_and_equality(create_csv):
+    csv_file = create_csv({"name": "User1", "age": 40})
+
+    with csv_file.open() as f:
+        user = next(DataclassReader(f, User, lazy=True))
+
+    assert dataclasses.asdict(user) == {"name": "User1", "age": 40}
+    assert user == User(name="User1", age=40)
+    assert User(name="User1", age=40) == user
+    assert repr(user) == "User(name='User1', age=40)"
+
+
+def test_lazy_rows_materialize(create_csv):
+    csv_file = create_csv({"name": "User1"}, fieldnames=["name", "email"])
+
+    with csv_file.open() as f:
+        user = next(DataclassReader(f, UserWithOptionalEmail, lazy=True))
+
+    materialized = user.materialize()
+    assert type(materialized) is UserWithOptionalEmail
+    assert materialized.email == "not specified"
+
+    restored = pickle.loads(pickle.dumps(user))
+    assert type(restored) is UserWithOptionalEmail
+    assert restored == materialized
+
+
+def test_lazy_rows_with_init_false(create_csv):
+    csv_file = create_csv({"firstname": "User1", "lastname": "TestUser"})
+
+    with csv_file.open() as f:
+        user = next(DataclassReader(f, UserWithInitFalseAndDefaultValue, lazy=True))
+
+    assert user.age == 0
+    assert user.materialize().firstname == "User1"
+
+
+@dataclasses.dataclass
+class UserWithPostInit:
+    name: str
+    age: int
+    label: str = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        if self.age < 0:
+            raise ValueError("age must not be negative")
+        self.label = f"{self.name} ({self.age})"
+
+
+def test_lazy_rows_run_post_init(create_csv):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": -1}])
+
+    with csv_file.open() as f:
+        reader = DataclassReader(f, UserWithPostInit, lazy=True)
+        assert next(reader).label == "User1 (40)"
+
+        with pytest.raises(ValueError, match="negative"):
+            next(reader)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires slots=True")
+def test_lazy_rows_with_slots(create_csv):
+    @dataclasses.dataclass(slots=True)
+    class SlottedUser:
+        name: str
+        age: int = 18
+        active: bool = dataclasses.field(default=True, init=False)
+
+    csv_file = create_csv({"name": "User1"}, fieldnames=["name", "age"])
+
+    with csv_file.open() as f:
+        user = next(DataclassReader(f, SlottedUser, lazy=True))
+
+    assert (user.name, user.age, user.active) == ("User1", 18, True)
+    assert user.materialize() == SlottedUser("User1")
+
+
+def test_lazy_rows_check_required(create_csv):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "", "age": "x"}])
+
+    with csv_file.open() as f:
+        reader = DataclassReader(f, User, lazy=True, check_required=True)
+        next(reader)
+
+        with pytest.raises(CsvValueError, match="`name` is required") as ex:
+            next(reader)
+
+    assert ex.value.line_number == 3
+
+
+def test_lazy_class_is_not_stored_on_the_dataclass(create_csv):
+    csv_file = create_csv({"name": "User1", "age": 40})
+
+    with csv_file.open() as f:
+        next(DataclassReader(f, User, lazy=True))
+
+    assert not [x for x in vars(User) if "lazy" in x]
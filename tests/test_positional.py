@@ -0,0 +1,77 @@
+import io
+
+import pytest
+
+from dataclass_csv import CsvValueError, DataclassReader, SectionReader
+
+from .mocks import Reading, User
+
+
+def test_positional_reader_uses_field_order():
+    f = io.StringIO("Ana,30\n\nBob,25\n")
+
+    reader = DataclassReader(f, User, positional=True)
+
+    assert list(reader) == [User("Ana", 30), User("Bob", 25)]
+
+
+def test_positional_reader_uses_index_metadata():
+    f = io.StringIO("21.5,x,kitchen\n19.0,x,garage,F\n")
+
+    reader = DataclassReader(f, Reading, positional=True)
+
+    assert list(reader) == [Reading("kitchen", 21.5), Reading("garage", 19.0, "F")]
+
+
+def test_positional_reader_errors():
+    f = io.StringIO("Ana,30\nBob,old\nCarl\n")
+    reader = DataclassReader(f, User, positional=True)
+
+    report = reader.validate()
+
+    assert report.invalid_rows == 2
+    assert [x.line_number for x in report.failures] == [2, 3]
+    assert "`age` is missing" in report.failures[1].message
+
+    with pytest.raises(ValueError):
+        DataclassReader(f, User, fieldnames=["name", "age"], positional=True)
+
+
+def test_section_reader_with_header():
+    f = io.StringIO(
+        "[users]\n"
+        "age,name\n"
+        "30,Ana\n"
+        "[readings],,\n"
+        "unit,sensor,value\n"
+        "F,garage,19.0\n"
+        "[users]\n"
+        "name,age\n"
+        "Bob,25\n"
+    )
+
+    items = list(SectionReader(f, {"[users]": User, "[readings]": Reading}))
+
+    assert items == [
+        ("[users]", User("Ana", 30)),
+        ("[readings]", Reading("garage", 19.0, "F")),
+        ("[users]", User("Bob", 25)),
+    ]
+
+
+def test_section_reader_without_header():
+    f = io.StringIO("#users\nAna,30\n#readings\n21.5,,kitchen\n")
+
+    reader = SectionReader(f, {"#users": User, "#readings": Reading}, header=False)
+
+    assert next(reader) == ("#users", User("Ana", 30))
+    assert list(reader) == [("#readings", Reading("kitchen", 21.5))]
+
+
+def test_section_reader_requires_a_marker_first():
+    f = io.StringIO("Ana,30\n")
+
+    with pytest.raises(CsvValueError) as ex:
+        list(SectionReader(f, {"#users": User}, header=False))
+
+    assert ex.value.line_number == 1
@@ -0,0 +1,86 @@
+import pytest
+
+from dataclass_csv import (
+    DataclassReader,
+    CsvValueError,
+    boolean_values,
+    number_format,
+)
+from dataclass_csv.dataclass_reader import strtobool
+
+from .mocks import EuropeanProduct, ProductWithNumberFormatMetadata
+
+
+@pytest.mark.parametrize("value", ["true", "YES", " t ", "On", "1"])
+def test_strtobool_true_values(value):
+    assert strtobool(value) is True
+
+
+@pytest.mark.parametrize("value", ["false", "No", "F ", "off", "0"])
+def test_strtobool_false_values(value):
+    assert strtobool(value) is False
+
+
+def test_strtobool_invalid_value():
+    with pytest.raises(ValueError, match="invalid boolean value maybe"):
+        strtobool("maybe")
+
+
+def test_decorators_validate_arguments():
+    with pytest.raises(ValueError):
+        boolean_values(true_values=[], false_values=["no"])
+
+    with pytest.raises(ValueError):
+        number_format(thousands=",", decimal=",")
+
+
+def test_european_number_and_bool_format(create_csv):
+    csv_file = create_csv(
+        [
+            {
+                "name": "Chair",
+                "price": "1.234,50",
+                "stock": "12.000",
+                "available": "Ja",
+                "discounted": "x",
+            },
+            {
+                "name": "Table",
+                "price": "99,9",
+                "stock": "3",
+                "available": "nein",
+                "discounted": "-",
+            },
+        ]
+    )
+
+    with csv_file.open() as f:
+        items = list(DataclassReader(f, EuropeanProduct))
+
+    assert items[0] == EuropeanProduct("Chair", 1234.5, 12000, True, True)
+    assert items[1] == EuropeanProduct("Table", 99.9, 3, False, False)
+
+
+def test_class_vocabulary_replaces_the_default(create_csv):
+    csv_file = create_csv(
+        [{"name": "Chair", "price": "1", "stock": "1", "available": "yes"}]
+    )
+
+    with csv_file.open() as f:
+        with pytest.raises(CsvValueError, match="invalid boolean value yes"):
+            list(DataclassReader(f, EuropeanProduct))
+
+
+def test_number_format_metadata(create_csv):
+    csv_file = create_csv(
+        [
+            {"name": "Sofa", "price": "1 299,99", "stock": "1,500"},
+            {"name": "Lamp", "price": "15", "stock": ""},
+        ]
+    )
+
+    with csv_file.open() as f:
+        items = list(DataclassReader(f, ProductWithNumberFormatMetadata))
+
+    assert items[0] == ProductWithNumberFormatMetadata("Sofa", 1299.99, 1500)
+    assert items[1] == ProductWithNumberFormatMetadata("Lamp", 15.0, None)
@@ -0,0 +1,90 @@
+import dataclasses
+import io
+import pickle
+import re
+
+import pytest
+
+from dataclass_csv import (
+    DataclassReader,
+    SchemaMismatchError,
+    categorical,
+    header_fingerprint,
+    schema_fingerprint,
+)
+
+from .mocks import User, UserWithDefaultDatetimeField
+
+
+def test_schema_fingerprint_changes_with_the_dataclass():
+    @dataclasses.dataclass
+    class Order:
+        id: int
+        country: str
+
+    fingerprint = schema_fingerprint(Order)
+    assert schema_fingerprint(Order) == fingerprint
+
+    categorical("country")(Order)
+    assert schema_fingerprint(Order) != fingerprint
+
+
+def test_header_fingerprint_ignores_white_spaces():
+    assert header_fingerprint(User, ["name", "age"]) == header_fingerprint(
+        User, [" name", "age "]
+    )
+    assert header_fingerprint(User, ["name", "age"]) != header_fingerprint(
+        User, ["age", "name"]
+    )
+
+
+def test_check_header_reports_a_diff():
+    f = io.StringIO("age,email,name\n")
+
+    diff = DataclassReader(f, User).check_header()
+
+    assert diff.missing == []
+    assert diff.extra == ["email"]
+    assert diff.reordered
+    assert diff.fingerprint == header_fingerprint(User, ["age", "email", "name"])
+
+
+@pytest.mark.parametrize(
+    "header, check, message",
+    [
+        ("age,email\n", "missing", "missing columns: ['name']"),
+        ("name,age,email\n", "extra", "unexpected columns: ['email']"),
+        ("age,name\n", "strict", "not in the order of the fields"),
+    ],
+)
+def test_header_check_fails_before_reading_rows(header, check, message):
+    f = io.StringIO(header + "invalid,row,values\n")
+
+    with pytest.raises(SchemaMismatchError, match=re.escape(message)) as ex:
+        DataclassReader(f, User, header_check=check)
+
+    assert ex.value.diff.fingerprint == header_fingerprint(User, header.split(","))
+
+    error = pickle.loads(pickle.dumps(ex.value))
+    assert str(error) == str(ex.value)
+    assert error.diff == ex.value.diff
+
+
+def test_header_check_allows_missing_optional_columns():
+    f = io.StringIO("name\nAna\n")
+
+    diff = DataclassReader(
+        f, UserWithDefaultDatetimeField, header_check="strict"
+    ).check_header("strict")
+
+    assert diff.missing_optional == ["birthday"]
+
+
+def test_check_header_uses_mapped_columns():
+    f = io.StringIO("full name,age\nAna,30\n")
+
+    reader = DataclassReader(f, User)
+    reader.map("full name").to("name")
+
+    assert reader.check_header("strict").extra == []
+    assert list(reader) == [User("Ana", 30)]
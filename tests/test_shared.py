@@ -0,0 +1,90 @@
+import io
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from dataclass_csv import (
+    CsvValueError,
+    DataclassReader,
+    DataclassWriter,
+    SharedDataclassReader,
+    SharedDataclassWriter,
+)
+
+from .mocks import User, UserWithDateFormatDecorator
+
+
+def test_shared_writer_from_many_threads():
+    f = io.StringIO()
+    writer = SharedDataclassWriter(f, User)
+
+    batches = [[User(f"user{i}-{j}", j) for j in range(50)] for i in range(20)]
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(writer.write, batches))
+
+    lines = f.getvalue().splitlines()
+    assert lines[0] == "name,age"
+    assert len(lines) == 1001
+
+    # The rows of each call are written together.
+    for i in range(1, len(lines), 50):
+        prefix = lines[i].split("-")[0]
+        assert all(x.startswith(prefix + "-") for x in lines[i : i + 50])
+
+
+def test_shared_writer_rejects_other_types():
+    writer = SharedDataclassWriter(io.StringIO(), User, skip_header=True)
+
+    with pytest.raises(TypeError):
+        writer.write_one("user")
+
+
+def test_shared_writer_writes_like_dataclass_writer():
+    users = [UserWithDateFormatDecorator("User1", datetime(2020, 1, 2))]
+    shared, single = io.StringIO(), io.StringIO()
+
+    writer = SharedDataclassWriter(shared, UserWithDateFormatDecorator)
+    writer.map("create_date").to("Created")
+    writer.write(users)
+
+    expected = DataclassWriter(single, users, UserWithDateFormatDecorator)
+    expected.map("create_date").to("Created")
+    expected.write()
+
+    assert shared.getvalue() == single.getvalue()
+    assert shared.getvalue().splitlines() == ["name,Created", "User1,2020-01-02"]
+
+
+def test_shared_reader_batches(create_csv):
+    csv_file = create_csv([{"name": f"user{i}", "age": i} for i in range(1000)])
+
+    def consume(shared):
+        return [x for batch in shared for x in batch]
+
+    with csv_file.open() as f:
+        shared = SharedDataclassReader(DataclassReader(f, User), batch_size=7)
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(consume, [shared] * 4))
+
+    items = sorted((x for result in results for x in result), key=lambda x: x.age)
+    assert items == [User(f"user{i}", i) for i in range(1000)]
+
+
+def test_shared_reader_error_line_number(create_csv):
+    csv_file = create_csv(
+        [{"name": "a", "age": 1}, {"name": "b", "age": 2}, {"name": "c", "age": "x"}]
+    )
+
+    with csv_file.open() as f:
+        shared = SharedDataclassReader(DataclassReader(f, User), batch_size=2)
+        assert len(shared.next_batch()) == 2
+
+        with pytest.raises(CsvValueError) as ex:
+            shared.next_batch()
+
+        assert shared.next_batch() == []
+
+    assert ex.value.line_number == 4
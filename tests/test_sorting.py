@@ -0,0 +1,103 @@
+from datetime import datetime
+
+import pytest
+
+from dataclass_csv import DataclassReader, external_sort, merge_sorted, sorted_records
+
+from .mocks import CategoricalOrder, Sale, Status, User, UserWithDateFormatDecorator
+
+
+def _read(path):
+    with open(path) as f:
+        return list(DataclassReader(f, User))
+
+
+def test_external_sort_uses_typed_keys(create_csv, tmpdir):
+    csv_file = create_csv(
+        [{"name": f"User{x}", "age": x} for x in [10, 9, 100, 1, 25, 3, 2]]
+    )
+    out_path = str(tmpdir.join("sorted.csv"))
+
+    external_sort(str(csv_file), out_path, User, key="age", buffer_size=2)
+
+    assert [x.age for x in _read(out_path)] == [1, 2, 3, 9, 10, 25, 100]
+
+
+def test_external_sort_in_memory_and_reverse(create_csv, tmpdir):
+    csv_file = create_csv([{"name": f"User{x}", "age": x} for x in [2, 10, 1]])
+    out_path = str(tmpdir.join("sorted.csv"))
+
+    external_sort(str(csv_file), out_path, User, key="age", reverse=True)
+
+    assert [x.age for x in _read(out_path)] == [10, 2, 1]
+
+
+def test_sorted_records_removes_temporary_files(tmpdir):
+    users = [User(name=f"User{x}", age=x) for x in [5, 4, 3, 2, 1]]
+
+    result = list(
+        sorted_records(users, key=lambda x: x.age, buffer_size=2, tmpdir=str(tmpdir))
+    )
+
+    assert result == sorted(users, key=lambda x: x.age)
+    assert tmpdir.listdir() == []
+
+
+def test_sorted_records_with_shared_objects(tmpdir):
+    # The records of the runs share the same strings and enum members, and
+    # hold the same string twice.
+    names = ["a", "b", "c"]
+    sales = [Sale(names[x % 3], names[x % 3], x, 1.0) for x in range(20)]
+    orders = [CategoricalOrder(x, names[x % 2], list(Status)[x % 2]) for x in range(20)]
+
+    for items, key in [(sales, "quantity"), (orders, "id")]:
+        result = list(sorted_records(items, key=key, reverse=True, buffer_size=5))
+
+        assert result == items[::-1]
+
+
+def test_sorted_records_invalid_arguments():
+    with pytest.raises(ValueError):
+        list(sorted_records([], key=1))  # type: ignore
+
+    with pytest.raises(ValueError):
+        list(sorted_records([User(name="a", age=1)], key="age", buffer_size=0))
+
+
+def test_merge_sorted(create_csv, tmpdir):
+    first = create_csv([{"name": f"User{x}", "age": x} for x in [1, 5, 20]])
+    second = create_csv([{"name": f"User{x}", "age": x} for x in [2, 3, 100]])
+    out_path = str(tmpdir.join("merged.csv"))
+
+    merge_sorted([str(first), str(second)], out_path, User, key="age")
+
+    assert [x.age for x in _read(out_path)] == [1, 2, 3, 5, 20, 100]
+
+
+def test_external_sort_round_trip_with_dateformat(tmpdir):
+    in_path = tmpdir.join("users.csv")
+    in_path.write_text(
+        "name;create_date\nUser1;2019-05-01\nÜser2;2018-01-31\n", encoding="cp1252"
+    )
+    out_path = str(tmpdir.join("sorted.csv"))
+
+    external_sort(
+        str(in_path),
+        out_path,
+        UserWithDateFormatDecorator,
+        key="create_date",
+        encoding="cp1252",
+        delimiter=";",
+        writer_options={"delimiter": ";"},
+    )
+
+    with open(out_path, encoding="cp1252") as f:
+        assert f.read().splitlines()[1] == "Üser2;2018-01-31"
+
+    with open(out_path, encoding="cp1252") as f:
+        users = list(DataclassReader(f, UserWithDateFormatDecorator, delimiter=";"))
+
+    assert users == [
+        UserWithDateFormatDecorator("Üser2", datetime(2018, 1, 31)),
+        UserWithDateFormatDecorator("User1", datetime(2019, 5, 1)),
+    ]
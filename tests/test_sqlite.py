@@ -0,0 +1,113 @@
+import dataclasses
+import io
+import sqlite3
+
+from datetime import date
+from typing import Optional
+
+import pytest
+
+from dataclass_csv import (
+    CsvValueError,
+    DataclassReader,
+    DataclassWriter,
+    create_table_sql,
+    dateformat,
+    from_sqlite,
+    to_sqlite,
+)
+
+from .mocks import Status
+
+
+@dataclasses.dataclass
+@dateformat("%Y-%m-%d")
+class Order:
+    id: int
+    customer: str
+    created: date
+    status: Status
+    total: Optional[float] = None
+    paid: bool = False
+
+
+CSV = (
+    "id,customer,created,status,total,paid\n"
+    "1,Ana,2024-01-02,open,10.5,yes\n"
+    "2,Bob,2024-02-03,closed,,no\n"
+)
+
+
+def test_create_table_sql():
+    assert create_table_sql(Order, "orders") == (
+        'CREATE TABLE IF NOT EXISTS "orders" ("id" INTEGER NOT NULL, '
+        '"customer" TEXT NOT NULL, "created" TEXT NOT NULL, '
+        '"status" TEXT NOT NULL, "total" REAL, "paid" INTEGER NOT NULL)'
+    )
+
+
+def test_to_sqlite_and_back():
+    conn = sqlite3.connect(":memory:")
+    reader = DataclassReader(io.StringIO(CSV), Order)
+
+    assert to_sqlite(reader, conn, "orders", batch_size=1) == 2
+    assert conn.execute("SELECT created, status, paid FROM orders").fetchall() == [
+        ("2024-01-02", "open", 1),
+        ("2024-02-03", "closed", 0),
+    ]
+
+    orders = list(from_sqlite(conn.execute("SELECT * FROM orders"), Order))
+    assert orders == [
+        Order(1, "Ana", date(2024, 1, 2), Status.OPEN, 10.5, True),
+        Order(2, "Bob", date(2024, 2, 3), Status.CLOSED, None, False),
+    ]
+
+    f = io.StringIO()
+    DataclassWriter(f, orders, Order).write()
+    assert f.getvalue().splitlines()[1] == "1,Ana,2024-01-02,Status.OPEN,10.5,True"
+
+
+@pytest.mark.parametrize("isolation_level", ["", None])
+def test_to_sqlite_rolls_back_on_errors(isolation_level):
+    conn = sqlite3.connect(":memory:", isolation_level=isolation_level)
+    data = CSV + "3,Carl,2024-03-04,unknown,1,no\n"
+    reader = DataclassReader(io.StringIO(data), Order)
+
+    with pytest.raises(CsvValueError):
+        to_sqlite(reader, conn, "orders", batch_size=1)
+
+    assert not conn.in_transaction
+    assert conn.execute("SELECT count(*) FROM orders").fetchone() == (0,)
+
+
+def test_to_sqlite_keeps_the_transaction_of_the_caller():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE log (message TEXT)")
+    conn.execute("INSERT INTO log VALUES ('started')")
+    assert conn.in_transaction
+
+    data = CSV + "3,Carl,2024-03-04,unknown,1,no\n"
+    with pytest.raises(CsvValueError):
+        to_sqlite(DataclassReader(io.StringIO(data), Order), conn, "orders")
+
+    assert conn.in_transaction
+    assert conn.execute("SELECT count(*) FROM log").fetchone() == (1,)
+
+    assert to_sqlite(DataclassReader(io.StringIO(CSV), Order), conn, "orders") == 2
+    assert conn.in_transaction
+
+    conn.rollback()
+    assert conn.execute("SELECT count(*) FROM log").fetchone() == (0,)
+
+
+def test_to_sqlite_with_records():
+    conn = sqlite3.connect(":memory:")
+    orders = [Order(1, "Ana", date(2024, 1, 2), Status.OPEN)]
+
+    with pytest.raises(ValueError):
+        to_sqlite(orders, conn, "orders")
+
+    assert to_sqlite(orders, conn, "orders", klass=Order) == 1
+
+    with pytest.raises(ValueError, match="Unknown fields"):
+        from_sqlite(conn.execute("SELECT id, 1 AS other FROM orders"), Order)
@@ -0,0 +1,95 @@
+import collections
+
+import pytest
+
+from dataclass_csv import CsvValueError, DataclassReader, distinct, sample
+
+from .mocks import Customer, User
+
+
+def test_distinct_keeps_the_first_record_of_each_key(create_csv):
+    csv_file = create_csv(
+        [
+            {"id": 1, "name": "Ana"},
+            {"id": 2, "name": "Bob"},
+            {"id": 1, "name": "Duplicated"},
+            {"id": 3, "name": "Carl"},
+        ]
+    )
+
+    with csv_file.open() as f:
+        items = list(distinct(DataclassReader(f, Customer), key="id"))
+
+    assert items == [Customer(1, "Ana"), Customer(2, "Bob"), Customer(3, "Carl")]
+
+
+def test_distinct_does_not_convert_duplicated_rows(create_csv):
+    csv_file = create_csv(
+        [{"name": "Ana", "age": 30}, {"name": "Ana", "age": "not a number"}]
+    )
+
+    with csv_file.open() as f:
+        items = list(distinct(DataclassReader(f, User), key=["name"]))
+
+    assert items == [User("Ana", 30)]
+
+
+def test_distinct_spills_to_partitions(tmp_path):
+    records = [Customer(i % 50, str(i)) for i in range(200)]
+
+    items = list(
+        distinct(records, key="id", max_keys=10, partitions=3, tmpdir=str(tmp_path))
+    )
+
+    assert items[:10] == records[:10]
+    assert sorted(items, key=lambda x: x.id) == records[:50]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_distinct_spills_string_keys():
+    records = [Customer(i, f"k{i % 20}") for i in range(100)]
+
+    items = list(distinct(records, key="name", max_keys=5, partitions=2))
+
+    assert sorted(x.name for x in items) == sorted(f"k{i}" for i in range(20))
+    assert sorted(items, key=lambda x: x.id) == records[:20]
+
+
+def test_distinct_with_bloom_filter():
+    records = [Customer(i % 100, str(i)) for i in range(1000)]
+
+    items = list(distinct(records, key=lambda x: x.id, max_keys=100, bloom=True))
+
+    assert len(items) <= 100
+    assert len({x.id for x in items}) == len(items)
+    assert len(items) >= 95
+
+    with pytest.raises(ValueError):
+        distinct(records, key="id", bloom=True, error_rate=2)
+
+
+def test_sample_converts_only_the_sampled_rows(create_csv):
+    rows = [{"name": f"user{i}", "age": i} for i in range(100)]
+    rows[50]["age"] = "invalid"
+    csv_file = create_csv(rows)
+
+    with csv_file.open() as f:
+        items = sample(DataclassReader(f, User), 1, seed=1)
+
+    assert items == [User("user83", 83)]
+
+    with csv_file.open() as f:
+        with pytest.raises(CsvValueError):
+            sample(DataclassReader(f, User), 200)
+
+
+def test_sample_is_uniform():
+    counts = collections.Counter()
+
+    for seed in range(2000):
+        items = sample(range(20), 5, seed=seed)
+        assert items == sorted(items)
+        counts.update(items)
+
+    # Each item is expected 500 times.
+    assert all(400 < counts[x] < 600 for x in range(20))
@@ -0,0 +1,106 @@
+from dataclass_csv import DataclassReader, ValidationReport
+from dataclass_csv.cli import main
+
+from .mocks import User, UserWithDateFormatDecorator
+
+
+def test_validate_valid_file(create_csv):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": 30}])
+
+    with csv_file.open() as f:
+        report = DataclassReader(f, User).validate()
+
+    assert report.is_valid
+    assert report.rows == 2
+    assert report.error_counts == {}
+    assert report.failures == []
+
+
+def test_validate_reports_every_invalid_column(create_csv):
+    csv_file = create_csv(
+        [
+            {"name": "User1", "age": "test"},
+            {"name": "", "age": "x"},
+            {"name": "User3", "age": 30},
+        ]
+    )
+
+    with csv_file.open() as f:
+        report = DataclassReader(f, User).validate()
+
+    assert not report.is_valid
+    assert report.rows == 3
+    assert report.invalid_rows == 2
+    assert report.error_counts == {"age": 2, "name": 1}
+    assert [(x.line_number, x.field) for x in report.failures] == [
+        (2, "age"),
+        (3, "name"),
+        (3, "age"),
+    ]
+    assert report.failures[1].message == "The field `name` is required."
+
+
+def test_validate_limits_the_failures_kept(create_csv):
+    csv_file = create_csv([{"name": "User", "age": "test"}] * 5)
+
+    with csv_file.open() as f:
+        report = DataclassReader(f, User).validate(max_failures=2)
+
+    assert report.error_counts == {"age": 5}
+    assert len(report.failures) == 2
+
+
+def test_validate_missing_column(create_csv):
+    csv_file = create_csv({"name": "User1"})
+
+    with csv_file.open() as f:
+        report = DataclassReader(f, User).validate()
+
+    assert report.error_counts == {"age": 1}
+    assert "is missing in the CSV file" in report.failures[0].message
+
+
+def test_validate_date_values(create_csv):
+    csv_file = create_csv({"name": "User1", "create_date": "2018/12/09"})
+
+    with csv_file.open() as f:
+        report = DataclassReader(f, UserWithDateFormatDecorator).validate()
+
+    assert report.error_counts == {"create_date": 1}
+
+
+def test_merge_reports():
+    first = ValidationReport(max_failures=2)
+    first.add_failure("age", 5, ValueError("invalid"))
+    first.add_row(False)
+
+    second = ValidationReport()
+    second.add_failure("age", 2, ValueError("invalid"))
+    second.add_failure("name", 3, ValueError("invalid"))
+    second.add_row(False)
+    second.add_row(True)
+
+    report = first.merge(second)
+
+    assert report.rows == 3
+    assert report.invalid_rows == 2
+    assert report.error_counts == {"age": 2, "name": 1}
+    assert [x.line_number for x in report.failures] == [2, 3]
+
+
+def test_cli_validate(create_csv, capsys):
+    csv_file = create_csv([{"name": "User1", "age": 40}, {"name": "User2", "age": "x"}])
+
+    exit_code = main(["validate", str(csv_file), "tests.mocks:User"])
+
+    output = capsys.readouterr().out
+    assert exit_code == 1
+    assert f"{csv_file}:3: age:" in output
+    assert "2 row(s) checked, 1 invalid." in output
+
+
+def test_cli_invalid_target(create_csv, capsys):
+    csv_file = create_csv({"name": "User1", "age": 40})
+
+    assert main(["validate", str(csv_file), "tests.mocks"]) == 2
+    assert "expected `module:Class`" in capsys.readouterr().err